@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
 import os
 import sys
 import time
 from collections.abc import Mapping
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -23,19 +24,20 @@ from app.config import (
     mode_summary,
     resolve_service_modes,
 )
+from app.fetch_cache import set_fetch_cache_enabled
 from app.process import launch_services_async, monitor_services
 from app.status_display import emit_new_warnings, render_status_table
-from app.smoke import format_result_line, run_smoke_checks, write_report
+from app.smoke import close_session, format_result_line, run_smoke_checks, write_report
 from app.logging_utils import (
     configure_file_logging,
     install_log_masking,
     set_debug_logging,
 )
 from app.progress_display import ProgressDisplay
-from app.llm_search import generate_search_parameters, SearchGenerationResult
+from app.llm_search import generate_search_parameters, set_search_cache_enabled, SearchGenerationResult
 from app.summary_display import render_summary_with_links
 from app.llm_client import create_llm_client
-from app.mcp_runners import run_oneshot_with_mcp
+from app.mcp_runners import get_session_pool, prewarm_mcp_session, run_oneshot_with_mcp
 
 app = typer.Typer(
     add_completion=False,
@@ -56,6 +58,9 @@ ONESHOT_PROGRESS_STEPS: tuple[str, ...] = (
     "Summarizing...",
 )
 
+# Event loop shared by MCP queries so pooled server sessions survive between REPL inputs
+_mcp_loop: asyncio.AbstractEventLoop | None = None
+
 # Emit warnings/errors once to stderr so startup issues are visible in CLI
 logging.basicConfig(level=logging.WARNING, format="%(levelname)s:%(name)s:%(message)s")
 install_log_masking()
@@ -345,6 +350,9 @@ def repl_loop(
             )
         )
 
+    if llm_client is not None:
+        _prewarm_mcp_servers(force_mock, config_path)
+
     console.print(
         "[bold cyan]workspace-finder[/] REPL ready. "
         f"Modes: [bold]{summary}[/]. Type 'exit' to quit."
@@ -413,28 +421,81 @@ def _render_summary_output(payload: Any, alternatives: list[str]) -> bool:
     return True
 
 
+def _close_mcp_loop() -> None:
+    """Terminate pooled MCP sessions and close the shared loop at exit."""
+    loop = _mcp_loop
+    if loop is None or loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(get_session_pool().aclose())
+    except Exception:  # noqa: BLE001
+        logging.debug("failed to close pooled MCP sessions", exc_info=True)
+    finally:
+        loop.close()
+
+
+def _run_on_mcp_loop(coro):
+    """Run a coroutine on the long-lived MCP event loop."""
+    global _mcp_loop
+    if _mcp_loop is None or _mcp_loop.is_closed():
+        _mcp_loop = asyncio.new_event_loop()
+        atexit.register(_close_mcp_loop)
+    return _mcp_loop.run_until_complete(coro)
+
+
+def _prewarm_mcp_servers(force_mock: bool, config_path: Path | None) -> None:
+    """Start the servers listed under ``prewarm`` so the first query skips their spawn."""
+    try:
+        _run_on_mcp_loop(
+            prewarm_mcp_session(
+                force_mock=force_mock,
+                config_path=config_path,
+                pool=get_session_pool(),
+            )
+        )
+    except Exception as exc:  # noqa: BLE001
+        logging.warning("MCP prewarm failed: %s", exc)
+
+
+async def _with_progress(work: Awaitable[Any]) -> Any:
+    """Show the oneshot progress steps while ``work`` already runs on the loop."""
+    progress = asyncio.ensure_future(
+        ProgressDisplay(console).run_async(ONESHOT_PROGRESS_STEPS, delay=0.02)
+    )
+    try:
+        return await work
+    finally:
+        await progress
+
+
 def run_oneshot_with_mcp_sync(
     query: str,
     *,
     force_mock: bool,
     config_path: Path | None = None,
     llm_client: Any | None = None,
+    eager: bool = False,
 ) -> None:
     """Execute oneshot query using MCP servers synchronously.
 
     This function starts MCP servers, executes search/fetch/summarize pipeline,
-    and displays results with evidence links.
+    and displays results with evidence links. Servers are started on first use
+    (all up front with ``eager``) and kept in the session pool so subsequent
+    queries (e.g. from the REPL) skip spawn and handshake.
     """
     normalized_query = (query or "").strip()
-    ProgressDisplay(console).run(ONESHOT_PROGRESS_STEPS, delay=0.02)
 
     try:
-        result = asyncio.run(
-            run_oneshot_with_mcp(
-                normalized_query,
-                force_mock=force_mock,
-                config_path=config_path,
-                llm_client=llm_client,
+        result = _run_on_mcp_loop(
+            _with_progress(
+                run_oneshot_with_mcp(
+                    normalized_query,
+                    force_mock=force_mock,
+                    config_path=config_path,
+                    llm_client=llm_client,
+                    pool=get_session_pool(),
+                    eager=eager,
+                )
             )
         )
 
@@ -562,6 +623,21 @@ def main(
         "-c",
         help="Path to servers.yaml. Defaults to repo root servers.yaml.",
     ),
+    eager: bool = typer.Option(
+        False,
+        "--eager",
+        help="Start every MCP server up front instead of on first use.",
+    ),
+    no_fetch_cache: bool = typer.Option(
+        False,
+        "--no-fetch-cache",
+        help="Always re-fetch documents instead of reusing recently fetched content.",
+    ),
+    no_search_cache: bool = typer.Option(
+        False,
+        "--no-search-cache",
+        help="Always ask the LLM for search parameters instead of reusing cached ones.",
+    ),
 ):
     """
     CLI entry point. In TTY without subcommands, enter the REPL;
@@ -570,6 +646,11 @@ def main(
     if ctx.invoked_subcommand:
         return
 
+    if no_fetch_cache:
+        set_fetch_cache_enabled(False)
+    if no_search_cache:
+        set_search_cache_enabled(False)
+
     mode, query_text, source = determine_input_mode(query)
     console.print(f"input mode: {mode.name} ({source})")
 
@@ -592,6 +673,7 @@ def main(
                 force_mock=mock,
                 config_path=config,
                 llm_client=llm_client,
+                eager=eager,
             )
         else:
             # Fallback to simple echo mode without MCP
@@ -661,7 +743,10 @@ def smoke(
         )
         raise typer.Exit(code=1)
 
-    results = run_smoke_checks(resolved)
+    try:
+        results = run_smoke_checks(resolved)
+    finally:
+        close_session()
     for result in results.values():
         color = "green" if result.ok else "red"
         console.print(f"[{color}]{format_result_line(result)}[/]")
@@ -5,6 +5,7 @@ import re
 from dataclasses import dataclass, field
 from collections.abc import Iterable
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -12,6 +13,7 @@ import yaml
 
 
 DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[1] / "servers.yaml"
+DEFAULT_LAUNCH_PARALLELISM = 4
 
 _PLACEHOLDER_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
@@ -81,17 +83,37 @@ def _extract_placeholders(values: Any) -> set[str]:
     return placeholders
 
 
-def _render_template(value: str, env: Mapping[str, str]) -> str:
-    def _replace(match: re.Match[str]) -> str:
-        return env.get(match.group(1), "")
+def render_template(value: str, env: Mapping[str, str], *, allow_missing: bool = True) -> str:
+    """Substitute ``${NAME}`` placeholders from ``env``.
 
-    return _PLACEHOLDER_PATTERN.sub(_replace, value)
+    Missing names render as "" when ``allow_missing``; otherwise ``KeyError``
+    is raised with the name.
+    """
+    # Most values have no placeholders; skip the scan entirely
+    if "${" not in value:
+        return value
+
+    parts: list[str] = []
+    position = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(value):
+        key = match.group(1)
+        if key in env:
+            replacement = env[key]
+        elif allow_missing:
+            replacement = ""
+        else:
+            raise KeyError(key)
+        parts.append(value[position : match.start()])
+        parts.append(replacement)
+        position = match.end()
+    parts.append(value[position:])
+    return "".join(parts)
 
 
 def _collect_missing_auth_files(definition: ServerDefinition, env: Mapping[str, str]) -> list[str]:
     missing: list[str] = []
     for raw_path in definition.auth_files:
-        resolved = _render_template(raw_path, env).strip()
+        resolved = render_template(raw_path, env).strip()
         if not resolved:
             missing.append(raw_path)
             continue
@@ -108,15 +130,30 @@ def _parse_mode(raw_mode: str | None) -> RunMode:
         return RunMode.MOCK
 
 
+def _read_config(path: str | Path | None) -> Mapping[str, Any]:
+    """Parsed servers.yaml, re-read only when the file changes.
+
+    The result is shared between callers and must not be mutated.
+    """
+    target = (Path(path) if path else DEFAULT_CONFIG_PATH).expanduser().resolve()
+    stat = target.stat()
+    return _parse_config(str(target), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _parse_config(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    # mtime and size are part of the cache key so edits are picked up
+    return yaml.safe_load(Path(path).read_text()) or {}
+
+
 def load_server_definitions(path: str | Path | None = None) -> dict[str, ServerDefinition]:
-    target = Path(path) if path else DEFAULT_CONFIG_PATH
-    raw_config = yaml.safe_load(target.read_text()) or {}
+    raw_config = _read_config(path)
     services: Mapping[str, Any] = raw_config.get("services", {}) or {}
 
     definitions: dict[str, ServerDefinition] = {}
     for name, raw in services.items():
         declared_mode = _parse_mode(raw.get("mode"))
-        env = raw.get("env") or {}
+        env = dict(raw.get("env") or {})
         auth_files = [entry.get("path", "") for entry in raw.get("auth_files", []) or [] if entry.get("path")]
 
         real_command = ServerCommand(
@@ -131,7 +168,7 @@ def load_server_definitions(path: str | Path | None = None) -> dict[str, ServerD
             exec=mock_raw.get("exec", real_command.exec),
             args=list(mock_raw.get("args") or []),
             workdir=mock_raw.get("workdir", real_command.workdir),
-            env=mock_raw.get("env") or {},
+            env=dict(mock_raw.get("env") or {}),
         )
 
         definitions[name] = ServerDefinition(
@@ -147,6 +184,25 @@ def load_server_definitions(path: str | Path | None = None) -> dict[str, ServerD
     return definitions
 
 
+def load_launch_parallelism(path: str | Path | None = None) -> int:
+    """Return how many servers may start at once (``launch_parallelism``)."""
+    raw_config = _read_config(path)
+    try:
+        value = int(raw_config.get("launch_parallelism", DEFAULT_LAUNCH_PARALLELISM))
+    except (TypeError, ValueError):
+        return DEFAULT_LAUNCH_PARALLELISM
+    return value if value > 0 else DEFAULT_LAUNCH_PARALLELISM
+
+
+def load_prewarm_services(path: str | Path | None = None) -> tuple[str, ...]:
+    """Return servers.yaml's ``prewarm`` list (servers started before the first query)."""
+    raw_config = _read_config(path)
+    raw = raw_config.get("prewarm") or []
+    if not isinstance(raw, list):
+        return ()
+    return tuple(name for name in raw if isinstance(name, str) and name)
+
+
 def resolve_service_modes(
     definitions: Mapping[str, ServerDefinition],
     *,
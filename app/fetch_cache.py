@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Mapping
+
+from app.config import ResolvedService
+
+FETCH_CACHE_TTL = 5 * 60  # seconds fetched content is reused across questions
+_FETCH_CACHE_SIZE = 512
+
+_fetch_cache: OrderedDict[tuple[str, str, str], tuple[float, Any]] = OrderedDict()
+_fetch_cache_lock = threading.Lock()
+_fetch_cache_enabled = True
+
+MISS = object()
+
+
+def fetch_cache_scope(resolved: Mapping[str, ResolvedService], session_key: str) -> str:
+    """Scope cached content to the service modes and server commands that fetched it.
+
+    ``session_key`` is ``app.process.session_config_key`` for the same services.
+    Mock and real runs, or runs against differently configured servers, get
+    different scopes and so never share entries.
+    """
+    modes = ",".join(f"{name}={resolved[name].selected_mode.value}" for name in sorted(resolved))
+    return f"{modes}:{session_key}"
+
+
+def fetch_cache_key(scope: str, fetch_tool: str, fetch_params: Mapping[str, Any]) -> tuple[str, str, str]:
+    """Identify one fetch target by its scope, tool and canonicalised parameters."""
+    return scope, fetch_tool, json.dumps(fetch_params, sort_keys=True, default=str)
+
+
+def set_fetch_cache_enabled(enabled: bool) -> None:
+    """Turn cross-question reuse of fetched content on or off for this process."""
+    global _fetch_cache_enabled
+    _fetch_cache_enabled = enabled
+    if not enabled:
+        clear_fetch_cache()
+
+
+def clear_fetch_cache() -> None:
+    with _fetch_cache_lock:
+        _fetch_cache.clear()
+
+
+def get_cached_fetch(key: tuple[str, str, str]) -> Any:
+    """Return cached content for ``key``, or ``MISS`` when absent or expired."""
+    if not _fetch_cache_enabled:
+        return MISS
+    now = time.monotonic()
+    with _fetch_cache_lock:
+        hit = _fetch_cache.get(key)
+        if hit is None:
+            return MISS
+        if now - hit[0] >= FETCH_CACHE_TTL:
+            del _fetch_cache[key]
+            return MISS
+        _fetch_cache.move_to_end(key)
+        return hit[1]
+
+
+def store_fetch(key: tuple[str, str, str], content: Any) -> None:
+    if not _fetch_cache_enabled:
+        return
+    with _fetch_cache_lock:
+        _fetch_cache[key] = (time.monotonic(), content)
+        _fetch_cache.move_to_end(key)
+        while len(_fetch_cache) > _FETCH_CACHE_SIZE:
+            _fetch_cache.popitem(last=False)
+
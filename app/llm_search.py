@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
 import logging
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Mapping
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Mapping
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
 
 from app.schema_validation import validate_search_payload
 from app.logging_utils import mask_sensitive_text
@@ -39,6 +51,10 @@ def _get_model_name() -> str:
     """
     return os.getenv("OPENAI_MODEL") or DEFAULT_MODEL_NAME
 
+# Part of the search cache key: bump it whenever SYSTEM_PROMPT, TOOLS or the
+# post-processing of generated searches changes, so cached results are regenerated
+SEARCH_PROMPT_VERSION = 1
+
 SYSTEM_PROMPT = """
 You are an assistant that generates search parameters for Slack, GitHub, and Google Drive.
 - Return only via the function call `build_search_queries`.
@@ -127,31 +143,37 @@ def _safe_debug(prefix: str, payload: Any) -> None:
 
 
 def _extract_function_arguments(response: Mapping[str, Any]) -> dict[str, Any]:
-    # Direct format used in tests
-    if "function_call" in response:
-        func = response["function_call"] or {}
-    else:
-        choices = response.get("choices", [])
-        message = choices[0].get("message", {}) if choices else {}
-        func = message.get("function_call")
-        if not func and message.get("tool_calls"):
-            func = (message["tool_calls"][0] or {}).get("function")
+    # Fast path: direct format used in tests
+    func = response.get("function_call")
+    if func is None:
+        func = _extract_function_from_choices(response)
     if not func:
         raise ValueError("function_call missing")
 
     args = func.get("arguments")
-    if args is None:
-        raise ValueError("function_call.arguments missing")
     if isinstance(args, str):
         try:
             return json.loads(args)
         except json.JSONDecodeError as exc:
             raise ValueError("function_call.arguments is not valid JSON") from exc
+    if args is None:
+        raise ValueError("function_call.arguments missing")
     if isinstance(args, Mapping):
         return dict(args)
     raise ValueError("function_call.arguments has unexpected type")
 
 
+def _extract_function_from_choices(response: Mapping[str, Any]) -> Mapping[str, Any] | None:
+    choices = response.get("choices")
+    if not choices:
+        return None
+    message = choices[0].get("message") or {}
+    func = message.get("function_call")
+    if not func and message.get("tool_calls"):
+        func = (message["tool_calls"][0] or {}).get("function")
+    return func
+
+
 def generate_search_parameters(question: str, llm_client: Any) -> SearchGenerationResult:
     """Generate search parameters for Slack/GitHub/Drive using LLM function calling.
 
@@ -221,6 +243,180 @@ def generate_search_parameters(question: str, llm_client: Any) -> SearchGenerati
     raise ValueError(str(last_error) if last_error else "unknown error")
 
 
+SEARCH_CACHE_TTL = 24 * 60 * 60  # seconds a generated set of searches stays valid
+SEARCH_CACHE_MAX_ENTRIES = 256
+_SEARCH_MEMORY_CACHE_SIZE = 128
+
+_search_memory_cache: OrderedDict[str, tuple[float, SearchGenerationResult]] = OrderedDict()
+_search_cache_lock = threading.Lock()
+_search_cache_enabled = True
+
+
+def _search_cache_path() -> Path | None:
+    """Opt-in on-disk cache for generated search parameters.
+
+    Environment variable: MCP_SEARCH_CACHE_PATH
+    Default: unset, so searches derived from user questions are only kept in memory
+    """
+    override = os.getenv("MCP_SEARCH_CACHE_PATH")
+    return Path(override).expanduser() if override else None
+
+
+def _search_cache_active() -> bool:
+    """Whether generated searches are reused.
+
+    Environment variable: MCP_SEARCH_CACHE ("0" disables)
+    Default: enabled, unless turned off with ``set_search_cache_enabled(False)``
+    """
+    return _search_cache_enabled and os.getenv("MCP_SEARCH_CACHE") != "0"
+
+
+def set_search_cache_enabled(enabled: bool) -> None:
+    """Turn reuse of generated searches on or off for this process."""
+    global _search_cache_enabled
+    _search_cache_enabled = enabled
+    if not enabled:
+        clear_search_cache()
+
+
+def search_cache_key(question: str, services: Iterable[str]) -> str:
+    """Digest of everything that shapes the generated searches."""
+    parts = (
+        question,
+        str(SEARCH_PROMPT_VERSION),
+        _get_model_name(),
+        _get_github_search_scope() or "",
+        ",".join(sorted(services)),
+    )
+    return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def clear_search_cache() -> None:
+    """Forget in-process cached generations (the disk cache is left alone)."""
+    with _search_cache_lock:
+        _search_memory_cache.clear()
+
+
+@contextmanager
+def _file_lock(fp: IO[str], *, exclusive: bool) -> Iterator[None]:
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(fp.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+    try:
+        yield
+    finally:
+        fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+
+
+def _read_search_cache(path: Path) -> dict[str, Any]:
+    try:
+        with path.open("r", encoding="utf-8") as fp, _file_lock(fp, exclusive=False):
+            entries = json.load(fp)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logger.debug("search cache unreadable (%s): %s", path, exc)
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def _store_search_cache(path: Path, key: str, result: SearchGenerationResult, created_at: float) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch(exist_ok=True)
+        with path.open("r+", encoding="utf-8") as fp, _file_lock(fp, exclusive=True):
+            try:
+                entries = json.load(fp)
+            except ValueError:
+                entries = {}
+            if not isinstance(entries, dict):
+                entries = {}
+            entries[key] = {
+                "created_at": created_at,
+                "searches": result.searches,
+                "alternatives": result.alternatives,
+            }
+            # Drop expired entries, then keep only the newest ones
+            fresh = [
+                item
+                for item in entries.items()
+                if isinstance(item[1], dict) and created_at - item[1].get("created_at", 0) < SEARCH_CACHE_TTL
+            ]
+            fresh.sort(key=lambda item: item[1]["created_at"], reverse=True)
+            fp.seek(0)
+            fp.truncate()
+            json.dump(dict(fresh[:SEARCH_CACHE_MAX_ENTRIES]), fp, ensure_ascii=False)
+    except (OSError, TypeError, ValueError) as exc:
+        logger.debug("search cache not written (%s): %s", path, exc)
+
+
+def _cached_entry(entry: Any, now: float) -> tuple[float, SearchGenerationResult] | None:
+    if not isinstance(entry, dict):
+        return None
+    created_at = entry.get("created_at")
+    searches = entry.get("searches")
+    alternatives = entry.get("alternatives")
+    if not isinstance(created_at, (int, float)) or now - created_at >= SEARCH_CACHE_TTL:
+        return None
+    if not isinstance(searches, list) or not isinstance(alternatives, list):
+        return None
+    # The file may be stale or hand-edited: only searches that pass the same
+    # validation as fresh LLM output reach the runners
+    try:
+        for item in searches:
+            validate_search_payload(item)
+    except ValueError as exc:
+        logger.debug("discarding invalid cached searches: %s", exc)
+        return None
+    if not all(isinstance(item, str) for item in alternatives):
+        return None
+    return float(created_at), SearchGenerationResult(searches=searches, alternatives=alternatives)
+
+
+def generate_search_parameters_cached(
+    question: str,
+    llm_client: Any,
+    *,
+    services: Iterable[str] = (),
+) -> SearchGenerationResult:
+    """``generate_search_parameters`` behind an in-process LRU and a disk cache.
+
+    Entries are keyed by ``search_cache_key`` and expire after
+    ``SEARCH_CACHE_TTL``; repeated questions skip the LLM round-trip. The disk
+    cache is only used when ``MCP_SEARCH_CACHE_PATH`` is set, and entries read
+    from it are validated again. Cache I/O failures are ignored and fall
+    through to the LLM. With the cache
+    disabled (``MCP_SEARCH_CACHE=0`` or ``--no-search-cache``), every call
+    asks the LLM and nothing is stored.
+    """
+    if not _search_cache_active():
+        return generate_search_parameters(question, llm_client)
+
+    key = search_cache_key(question, services)
+    now = time.time()
+
+    with _search_cache_lock:
+        hit = _search_memory_cache.get(key)
+        if hit is not None and now - hit[0] < SEARCH_CACHE_TTL:
+            _search_memory_cache.move_to_end(key)
+            return copy.deepcopy(hit[1])
+
+    path = _search_cache_path()
+    cached = _cached_entry(_read_search_cache(path).get(key), now) if path is not None else None
+    if cached is None:
+        cached = (now, generate_search_parameters(question, llm_client))
+        if path is not None:
+            _store_search_cache(path, key, cached[1], now)
+
+    with _search_cache_lock:
+        _search_memory_cache[key] = cached
+        _search_memory_cache.move_to_end(key)
+        while len(_search_memory_cache) > _SEARCH_MEMORY_CACHE_SIZE:
+            _search_memory_cache.popitem(last=False)
+    return copy.deepcopy(cached[1])
+
+
 def _clean_alternatives(raw: Any) -> list[str]:
     if raw is None:
         raise ValueError("alternatives missing")
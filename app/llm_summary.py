@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Any, Callable, Mapping, Sequence
 
@@ -109,31 +111,37 @@ def _safe_debug(prefix: str, payload: Any) -> None:
 
 
 def _extract_function_arguments(response: Mapping[str, Any]) -> dict[str, Any]:
-    # Direct format used in tests
-    if "function_call" in response:
-        func = response["function_call"] or {}
-    else:
-        choices = response.get("choices", [])
-        message = choices[0].get("message", {}) if choices else {}
-        func = message.get("function_call")
-        if not func and message.get("tool_calls"):
-            func = (message["tool_calls"][0] or {}).get("function")
+    # Fast path: direct format used in tests
+    func = response.get("function_call")
+    if func is None:
+        func = _extract_function_from_choices(response)
     if not func:
         raise ValueError("function_call missing")
 
     args = func.get("arguments")
-    if args is None:
-        raise ValueError("function_call.arguments missing")
     if isinstance(args, str):
         try:
             return json.loads(args)
         except json.JSONDecodeError as exc:
             raise ValueError("function_call.arguments is not valid JSON") from exc
+    if args is None:
+        raise ValueError("function_call.arguments missing")
     if isinstance(args, Mapping):
         return dict(args)
     raise ValueError("function_call.arguments has unexpected type")
 
 
+def _extract_function_from_choices(response: Mapping[str, Any]) -> Mapping[str, Any] | None:
+    choices = response.get("choices")
+    if not choices:
+        return None
+    message = choices[0].get("message") or {}
+    func = message.get("function_call")
+    if not func and message.get("tool_calls"):
+        func = (message["tool_calls"][0] or {}).get("function")
+    return func
+
+
 def _normalize_content(content: Any) -> str:
     if isinstance(content, str):
         return content
@@ -144,19 +152,17 @@ def _normalize_content(content: Any) -> str:
 
 
 def _build_documents_payload(documents: Sequence[FetchResult]) -> list[dict[str, Any]]:
+    # Empty title/snippet keys are dropped to keep the prompt (and encode work) small.
     payload: list[dict[str, Any]] = []
     for idx, doc in enumerate(documents, start=1):
-        payload.append(
-            {
-                "id": idx,
-                "service": doc.service,
-                "kind": doc.kind,
-                "title": doc.title,
-                "snippet": doc.snippet,
-                "uri": doc.uri,
-                "content": _normalize_content(doc.content),
-            }
-        )
+        entry: dict[str, Any] = {"id": idx, "service": doc.service, "kind": doc.kind}
+        if doc.title:
+            entry["title"] = doc.title
+        if doc.snippet:
+            entry["snippet"] = doc.snippet
+        entry["uri"] = doc.uri
+        entry["content"] = _normalize_content(doc.content)
+        payload.append(entry)
     return payload
 
 
@@ -190,8 +196,14 @@ def summarize_documents(
     llm_client: Any,
     *,
     io_logger: Callable[[dict[str, Any]], None] | None = None,
+    speculative: bool = False,
 ) -> SummaryResult:
-    """Summarize fetched documents into Markdown with ordered evidence numbers."""
+    """Summarize fetched documents into Markdown with ordered evidence numbers.
+
+    With ``speculative=True`` all attempts are issued concurrently and the first
+    schema-valid response wins, trading one extra LLM call for lower latency
+    when the first candidate fails validation.
+    """
 
     doc_payload = _build_documents_payload(documents)
     user_content = json.dumps(
@@ -201,6 +213,7 @@ def summarize_documents(
             "instructions": "Assign evidence numbers in the same order as documents (1..N).",
         },
         ensure_ascii=False,
+        separators=(",", ":"),
     )
 
     messages = [
@@ -219,18 +232,27 @@ def summarize_documents(
 
     _safe_debug("LLM request", request_payload)
 
+    # Speculative losers keep running after a winner is returned; once settled,
+    # their requests/responses are dropped instead of reaching io_logger.
+    settled = threading.Event()
+    log_lock = threading.Lock()
+
+    def _settle() -> None:
+        with log_lock:
+            settled.set()
+
     def _log_io(payload: Mapping[str, Any]) -> None:
         if io_logger is None:
             return
-        try:
-            io_logger(dict(payload))
-        except Exception:  # noqa: BLE001
-            logger.debug("failed to emit LLM IO log", exc_info=True)
-
-    attempts = 0
-    last_error: Exception | None = None
-    while attempts < _MAX_ATTEMPTS:
-        attempts += 1
+        with log_lock:
+            if settled.is_set():
+                return
+            try:
+                io_logger(dict(payload))
+            except Exception:  # noqa: BLE001
+                logger.debug("failed to emit LLM IO log", exc_info=True)
+
+    def _one_call() -> Mapping[str, Any]:
         _log_io({"stage": "summary", "direction": "request", **request_payload})
         response = llm_client.create(
             messages=messages,
@@ -241,8 +263,23 @@ def summarize_documents(
             tools=TOOLS,
         )
 
+        if settled.is_set():
+            return response
         _safe_debug("LLM response", response)
         _log_io({"stage": "summary", "direction": "response", "response": response})
+        return response
+
+    if speculative:
+        try:
+            return _summarize_speculatively(_one_call, expected_count=len(documents))
+        finally:
+            _settle()
+
+    attempts = 0
+    last_error: Exception | None = None
+    while attempts < _MAX_ATTEMPTS:
+        attempts += 1
+        response = _one_call()
 
         try:
             payload = _extract_function_arguments(response)
@@ -256,3 +293,32 @@ def summarize_documents(
             raise ValueError(str(exc)) from exc
 
     raise ValueError(str(last_error) if last_error else "unknown error")
+
+
+def _summarize_speculatively(
+    call: Callable[[], Mapping[str, Any]], *, expected_count: int
+) -> SummaryResult:
+    """Run all attempts concurrently and return the first schema-valid summary.
+
+    Errors raised by ``call`` itself (transport/API failures) propagate as-is,
+    matching the sequential path; only schema failures fall through to the
+    next candidate.
+    """
+
+    last_error: Exception | None = None
+    executor = ThreadPoolExecutor(max_workers=_MAX_ATTEMPTS)
+    try:
+        futures = [executor.submit(call) for _ in range(_MAX_ATTEMPTS)]
+        for future in as_completed(futures):
+            response = future.result()
+            try:
+                payload = _extract_function_arguments(response)
+                return _validate_summary_payload(payload, expected_count=expected_count)
+            except Exception as exc:  # noqa: BLE001
+                last_error = exc
+                logger.warning("summary schema validation failed on speculative candidate: %s", exc)
+    finally:
+        # Do not block on slower candidates once a winner has been chosen.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    raise ValueError(str(last_error) if last_error else "unknown error")
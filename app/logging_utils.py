@@ -13,18 +13,53 @@ _DOMAIN_PATTERN = re.compile(r"(?<!\*)\b([A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+)\b")
 LOG_DIR_ENV = "MCP_LOG_DIR"
 LOG_FILENAME = "workspace-finder.log"
 
+# Pre-built fill strings so masking does not re-allocate "*" * n per match.
+_STARS_CACHE_SIZE = 256
+_STARS = tuple("*" * i for i in range(_STARS_CACHE_SIZE))
+_STAR_BYTES = tuple(b"*" * i for i in range(_STARS_CACHE_SIZE))
+
+
+def _stars(count: int) -> str:
+    return _STARS[count] if count < _STARS_CACHE_SIZE else "*" * count
+
+
+def _star_bytes(count: int) -> bytes:
+    return _STAR_BYTES[count] if count < _STARS_CACHE_SIZE else b"*" * count
+
 
 def _mask_domain_value(domain: str) -> str:
+    if not domain.isascii():
+        return _mask_domain_value_slow(domain)
+
+    last_dot = domain.rfind(".")
+    if last_dot < 0:
+        return _stars(len(domain))
+
+    # Mask labels in place on a single ASCII buffer; the TLD is kept as-is.
+    buf = bytearray(domain, "ascii")
+    start = 0
+    while start <= last_dot:
+        end = domain.find(".", start)
+        length = end - start
+        if length <= 2:
+            buf[start:end] = _star_bytes(length)
+        else:
+            buf[start + 1 : end - 1] = _star_bytes(length - 2)
+        start = end + 1
+    return buf.decode("ascii")
+
+
+def _mask_domain_value_slow(domain: str) -> str:
     parts = domain.split(".")
     if len(parts) < 2:
-        return "*" * len(domain)
+        return _stars(len(domain))
 
     masked_parts: list[str] = []
     for part in parts[:-1]:
         if len(part) <= 2:
-            masked_parts.append("*" * len(part))
+            masked_parts.append(_stars(len(part)))
             continue
-        masked_parts.append(part[0] + "*" * (len(part) - 2) + part[-1])
+        masked_parts.append(part[0] + _stars(len(part) - 2) + part[-1])
 
     masked_parts.append(parts[-1])
     return ".".join(masked_parts)
@@ -33,15 +68,15 @@ def _mask_domain_value(domain: str) -> str:
 def _mask_email(match: re.Match[str]) -> str:
     local, domain = match.group(1), match.group(2)
     if len(local) <= 2:
-        masked_local = local[0] + "*" * (len(local) - 1)
+        masked_local = local[0] + _stars(len(local) - 1)
     else:
-        masked_local = local[0] + "*" * (len(local) - 2) + local[-1]
+        masked_local = local[0] + _stars(len(local) - 2) + local[-1]
     return f"{masked_local}@{_mask_domain_value(domain)}"
 
 
 def _mask_token(match: re.Match[str]) -> str:
     prefix, rest = match.group(1), match.group(2)
-    return prefix + "*" * len(rest)
+    return prefix + _stars(len(rest))
 
 
 def _mask_domain(match: re.Match[str]) -> str:
@@ -7,23 +7,177 @@ by search_pipeline.py.
 from __future__ import annotations
 
 import asyncio
-import base64
+import atexit
+import binascii
+import csv
+import io
+import itertools
 import json
 import logging
 import os
-from typing import Any, Mapping
-
-from app.config import load_server_definitions, resolve_service_modes
-from app.process import launch_services_async, RuntimeStatus
+import re
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Hashable, Iterable, Mapping
+from urllib.parse import quote
+
+try:  # POSIX only
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+from app.config import (
+    DEFAULT_LAUNCH_PARALLELISM,
+    load_launch_parallelism,
+    load_prewarm_services,
+    load_server_definitions,
+    resolve_service_modes,
+)
+from app.fetch_cache import fetch_cache_scope
+from app.process import launch_services_async, RuntimeStatus, session_config_key
 from app.search_pipeline import FetchResult, SearchResult
 
 logger = logging.getLogger(__name__)
 
+# Search hit snippets are cut to this many characters. CPython returns the
+# string itself when slicing a str that is already short enough, so no
+# length check is needed in front of the slice.
+_SNIPPET_CHARS = 200
+
+# Format: https://github.com/owner/repo/issues/123
+_GH_ISSUE_URL_RE = re.compile(r"github\.com/([^/]+)/([^/]+)/(?:issues|pull)/(\d+)")
+# GDrive search lines: "ファイル名 (mimeType)"
+_GDRIVE_LINE_RE = re.compile(r"^(.+?)\s*\(([^)]+)\)$")
+
+# JSON-RPC frames are encoded/decoded on every MCP call; prefer a C codec when
+# one is installed. _dumps_line returns a newline-terminated frame as bytes and
+# _loads accepts bytes; both raise ValueError on bad input.
+try:
+    import orjson
+
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on optional package
+    try:
+        import ujson
+
+        def _dumps_line(obj: Any) -> bytes:
+            return (ujson.dumps(obj, ensure_ascii=False) + "\n").encode()
+
+        _loads = ujson.loads
+    except ImportError:
+
+        def _dumps_line(obj: Any) -> bytes:
+            return (json.dumps(obj, separators=(",", ":")) + "\n").encode()
+
+        _loads = json.loads
+
 
 class McpClientError(Exception):
     """Raised when MCP client operations fail."""
 
 
+class _BatchRejectedError(McpClientError):
+    """Raised for batch members when the server does not accept JSON-RPC batches."""
+
+
+_INVALID_REQUEST_CODE = -32600
+_READ_CHUNK_SIZE = 64 * 1024
+
+# stdin write buffer water marks. Frames are left to the transport without
+# awaiting drain() until the buffer passes the high mark, so back-to-back
+# requests coalesce into fewer pipe writes and event-loop wakeups.
+_WRITE_BUFFER_HIGH = 1 << 20
+_WRITE_BUFFER_LOW = 1 << 16
+_DRAIN_THRESHOLD = _WRITE_BUFFER_HIGH
+
+
+def _raise_write_buffer_limits(stdin: asyncio.StreamWriter | None) -> None:
+    try:
+        stdin.transport.set_write_buffer_limits(high=_WRITE_BUFFER_HIGH, low=_WRITE_BUFFER_LOW)
+    except (AttributeError, ValueError):
+        pass
+
+
+def _needs_drain(stdin: asyncio.StreamWriter) -> bool:
+    try:
+        size = stdin.transport.get_write_buffer_size()
+    except AttributeError:
+        return True
+    return not isinstance(size, int) or size > _DRAIN_THRESHOLD
+
+
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031) if fcntl is not None else None
+_PIPE_BUFFER_SIZE = 1 << 20
+
+
+def _pipe_buffer_size() -> int:
+    """Largest pipe size an unprivileged process may request, capped at 1 MiB."""
+    try:
+        with open("/proc/sys/fs/pipe-max-size", encoding="ascii") as f:
+            return min(_PIPE_BUFFER_SIZE, int(f.read()))
+    except (OSError, ValueError):
+        return _PIPE_BUFFER_SIZE
+
+
+def _enlarge_pipe_buffers(process: asyncio.subprocess.Process) -> None:
+    """Grow the stdio pipes so large responses don't stall the server's writer.
+
+    Linux pipes default to 64 KiB; best effort, silently skipped elsewhere.
+    """
+    if sys.platform != "linux" or _F_SETPIPE_SZ is None:
+        return
+    size = _pipe_buffer_size()
+    for stream in (process.stdin, process.stdout):
+        transport = getattr(stream, "transport", None) or getattr(stream, "_transport", None)
+        if transport is None:
+            continue
+        try:
+            fd = transport.get_extra_info("pipe").fileno()
+            fcntl.fcntl(fd, _F_SETPIPE_SZ, size)
+        except (AttributeError, OSError, TypeError, ValueError):
+            pass
+
+
+DEFAULT_MAX_INFLIGHT = 32
+
+
+def _max_inflight() -> int:
+    """Per-client cap on outstanding JSON-RPC requests.
+
+    Environment variable: MCP_MAX_INFLIGHT
+    Default: 32
+    """
+    env_value = os.getenv("MCP_MAX_INFLIGHT")
+    if env_value:
+        try:
+            limit = int(env_value)
+        except ValueError:
+            logger.warning("MCP_MAX_INFLIGHT の値が不正です: %s", env_value)
+        else:
+            if limit > 0:
+                return limit
+    return DEFAULT_MAX_INFLIGHT
+
+
+def _batch_opt_in() -> bool:
+    """Whether clients may send JSON-RPC batch arrays before a server opts in.
+
+    Environment variable: MCP_JSONRPC_BATCH ("1" enables)
+    Default: disabled; servers such as the GitHub MCP server ignore arrays, so
+    batches are otherwise only sent to servers advertising
+    ``capabilities.experimental.jsonrpcBatch``.
+    """
+    return os.getenv("MCP_JSONRPC_BATCH") == "1"
+
+
 class StdioMcpClient:
     """Simple MCP client that communicates via stdio with a subprocess.
 
@@ -38,52 +192,294 @@ class StdioMcpClient:
     ):
         self._process = process
         self._name = name
-        self._request_id = 0
-        self._lock = asyncio.Lock()
+        self._request_ids = itertools.count(1)
+        # Responses are matched by id and each frame is one synchronous write, so
+        # only drain() needs serializing (concurrent drains fail before 3.12).
+        self._drain_lock = asyncio.Lock()
+        # Bounds responses queued behind a slow reader; a batch holds one slot
+        self._inflight = asyncio.Semaphore(_max_inflight())
+        self.inflight_count = 0  # requests (or batches) holding a slot
+        self._init_started = False
+        self._init_done = asyncio.Event()
+        self._pending: dict[int, asyncio.Future[Any]] = {}
+        self._batch_pending: set[int] = set()
+        self._supports_batch = _batch_opt_in()
+        self._reader_task: asyncio.Task[None] | None = None
+        self._read_buffer = bytearray()
         self._initialized = False
+        # initialize result (serverInfo, capabilities), kept for later lookups
+        self.server_info: dict[str, Any] = {}
+        _enlarge_pipe_buffers(process)
+        _raise_write_buffer_limits(process.stdin)
+
+    def _ensure_reader(self) -> None:
+        """Start the background stdout reader while requests are outstanding."""
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.get_running_loop().create_task(self._read_loop())
+
+    async def aclose(self) -> None:
+        """Stop the reader and fail outstanding requests with "connection closed"."""
+        task, self._reader_task = self._reader_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(McpClientError(f"{self._name}: connection closed"))
+        self._batch_pending.clear()
+        self._read_buffer.clear()
+
+    async def _read_loop(self) -> None:
+        """Dispatch JSON-RPC responses to their pending futures by id.
+
+        The loop exits once nothing is pending and is restarted by the next request,
+        so stdout is only consumed while a response is actually awaited.
+        """
+        assert self._process.stdout is not None
+        stdout = self._process.stdout
+        buffer = self._read_buffer
+        scanned = 0
+        reason = "connection closed"
+        try:
+            while self._pending:
+                # Frames are newline-delimited; pull large chunks and split locally.
+                newline = buffer.find(b"\n", scanned)
+                if newline < 0:
+                    scanned = len(buffer)
+                    chunk = await stdout.read(_READ_CHUNK_SIZE)
+                    if not chunk:
+                        reason = "empty response from server"
+                        break
+                    buffer += chunk
+                    continue
+
+                response_line = bytes(buffer[:newline])
+                del buffer[: newline + 1]
+                scanned = 0
+                if not response_line.strip():
+                    continue
 
-    async def _send_request(self, method: str, params: dict[str, Any] | None = None) -> Any:
-        """Send a JSON-RPC request and return the response."""
-        if self._process.stdin is None or self._process.stdout is None:
-            raise McpClientError(f"{self._name}: process stdin/stdout not available")
+                try:
+                    response = _loads(response_line)
+                except ValueError as exc:
+                    logger.debug("%s: skipping non JSON-RPC output: %s", self._name, exc)
+                    continue
+
+                # Batch requests are answered with an array of responses.
+                for item in response if isinstance(response, list) else (response,):
+                    if isinstance(item, dict):
+                        self._dispatch_response(item)
+        except Exception as exc:  # noqa: BLE001
+            reason = f"reader failed: {exc}"
+        finally:
+            # Anything still pending here can no longer receive a response.
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(McpClientError(f"{self._name}: {reason}"))
+
+    def _dispatch_response(self, response: dict[str, Any]) -> None:
+        response_id = response.get("id")
+        if response_id is None and "error" in response and self._batch_pending:
+            # A batch array the server could not parse is answered with a single
+            # id-less error; fail every outstanding batch member so callers fall back.
+            for batch_id in tuple(self._batch_pending):
+                future = self._pending.pop(batch_id, None)
+                if future is not None and not future.done():
+                    future.set_exception(_BatchRejectedError(f"{self._name}: batch request rejected"))
+            return
+
+        future = self._pending.pop(response_id, None)
+        if future is None:
+            # Notifications or responses to requests that already timed out.
+            return
+        if not future.done():
+            future.set_result(response)
 
-        self._request_id += 1
+    def _build_request(self, method: str, params: dict[str, Any] | None) -> dict[str, Any]:
         request: dict[str, Any] = {
             "jsonrpc": "2.0",
-            "id": self._request_id,
+            "id": next(self._request_ids),
             "method": method,
         }
         if params is not None:
             request["params"] = params
+        return request
 
-        try:
-            request_line = json.dumps(request) + "\n"
-            self._process.stdin.write(request_line.encode())
-            await self._process.stdin.drain()
-
-            # Read response with timeout
-            response_line = await asyncio.wait_for(
-                self._process.stdout.readline(),
-                timeout=30.0,
+    def _unwrap_response(self, response: Mapping[str, Any]) -> Any:
+        if "error" in response:
+            error = response["error"]
+            raise McpClientError(
+                f"{self._name}: {error.get('message', 'unknown error')}"
             )
+        return response.get("result")
 
-            if not response_line:
-                raise McpClientError(f"{self._name}: empty response from server")
+    async def _write(self, payload: Any) -> None:
+        assert self._process.stdin is not None
+        stdin = self._process.stdin
+        stdin.write(_dumps_line(payload))
+        if _needs_drain(stdin):
+            async with self._drain_lock:
+                await stdin.drain()
 
-            response = json.loads(response_line.decode())
+    async def _send_request(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        *,
+        timeout: float = 30.0,
+    ) -> Any:
+        """Send a JSON-RPC request and return the response.
+
+        Responses are matched by id, so multiple requests can be in flight at
+        once, up to MCP_MAX_INFLIGHT per client.
+        """
+        if self._process.stdin is None or self._process.stdout is None:
+            raise McpClientError(f"{self._name}: process stdin/stdout not available")
 
-            if "error" in response:
-                error = response["error"]
-                raise McpClientError(
-                    f"{self._name}: {error.get('message', 'unknown error')}"
-                )
+        async with self._inflight_slot():
+            return await self._send_request_unbounded(method, params, timeout)
 
-            return response.get("result")
+    @asynccontextmanager
+    async def _inflight_slot(self) -> AsyncIterator[None]:
+        if self._inflight.locked():
+            logger.debug("%s: %d requests in flight; waiting for a slot", self._name, self.inflight_count)
+        async with self._inflight:
+            self.inflight_count += 1
+            try:
+                yield
+            finally:
+                self.inflight_count -= 1
+
+    async def _send_request_unbounded(
+        self, method: str, params: dict[str, Any] | None, timeout: float = 30.0
+    ) -> Any:
+        request = self._build_request(method, params)
+        request_id = request["id"]
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._ensure_reader()
+
+        try:
+            await self._write(request)
+
+            # Wait for the reader task to deliver the response
+            response = await asyncio.wait_for(future, timeout=timeout)
+            return self._unwrap_response(response)
 
         except asyncio.TimeoutError:
+            self._notify_cancelled((request_id,), "timeout")
             raise McpClientError(f"{self._name}: timeout waiting for response")
-        except json.JSONDecodeError as exc:
-            raise McpClientError(f"{self._name}: invalid JSON response: {exc}")
+        except asyncio.CancelledError:
+            # wait_for cancels the future along with the caller
+            if not future.done() or future.cancelled():
+                self._notify_cancelled((request_id,), "cancelled by client")
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _send_batch(self, calls: list[tuple[str, dict[str, Any] | None]]) -> list[Any]:
+        """Send several requests as one JSON-RPC batch array.
+
+        Returns one entry per call in order; failed calls yield their
+        ``McpClientError`` instead of raising. Unless the server opted in to
+        batches, or rejects one, the calls go out as concurrent single requests.
+        """
+        if not self._supports_batch or len(calls) < 2:
+            return await self._send_individually(calls)
+
+        if self._process.stdin is None or self._process.stdout is None:
+            raise McpClientError(f"{self._name}: process stdin/stdout not available")
+
+        async with self._inflight_slot():
+            loop = asyncio.get_running_loop()
+            requests = [self._build_request(method, params) for method, params in calls]
+            futures: list[asyncio.Future[Any]] = []
+            for request in requests:
+                future = loop.create_future()
+                self._pending[request["id"]] = future
+                self._batch_pending.add(request["id"])
+                futures.append(future)
+            self._ensure_reader()
+
+            try:
+                await self._write(requests)
+                try:
+                    responses = await asyncio.wait_for(
+                        asyncio.gather(*futures, return_exceptions=True),
+                        timeout=30.0,
+                    )
+                except asyncio.TimeoutError:
+                    # wait_for cancels the gather, so only futures answered before then count
+                    self._notify_cancelled(
+                        [r["id"] for r, f in zip(requests, futures) if f.cancelled()], "timeout"
+                    )
+                    responses = [McpClientError(f"{self._name}: timeout waiting for response")] * len(requests)
+            except asyncio.CancelledError:
+                self._notify_cancelled(
+                    [r["id"] for r, f in zip(requests, futures) if not f.done() or f.cancelled()],
+                    "cancelled by client",
+                )
+                raise
+            finally:
+                for request in requests:
+                    self._pending.pop(request["id"], None)
+                    self._batch_pending.discard(request["id"])
+
+        rejected = all(
+            isinstance(item, _BatchRejectedError)
+            or (isinstance(item, dict) and (item.get("error") or {}).get("code") == _INVALID_REQUEST_CODE)
+            for item in responses
+        )
+        if rejected:
+            logger.debug("%s: server rejected JSON-RPC batch; falling back to single requests", self._name)
+            self._supports_batch = False
+            return await self._send_individually(calls)
+
+        results: list[Any] = []
+        for item in responses:
+            if isinstance(item, BaseException):
+                results.append(item if isinstance(item, McpClientError) else McpClientError(f"{self._name}: {item}"))
+                continue
+            try:
+                results.append(self._unwrap_response(item))
+            except McpClientError as exc:
+                results.append(exc)
+        return results
+
+    async def _send_individually(self, calls: list[tuple[str, dict[str, Any] | None]]) -> list[Any]:
+        return list(
+            await asyncio.gather(
+                *(self._send_request(method, params) for method, params in calls),
+                return_exceptions=True,
+            )
+        )
+
+    def _notify_cancelled(self, request_ids: Any, reason: str) -> None:
+        """Tell the server to stop working on abandoned requests (best effort).
+
+        Written without awaiting drain() so it can run while the caller is being
+        cancelled; each frame is a single write, so it cannot split another frame.
+        """
+        stdin = self._process.stdin
+        if stdin is None:
+            return
+        for request_id in request_ids:
+            notification = {
+                "jsonrpc": "2.0",
+                "method": "notifications/cancelled",
+                "params": {"requestId": request_id, "reason": reason},
+            }
+            try:
+                stdin.write(_dumps_line(notification))
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("%s: failed to send cancellation: %s", self._name, exc)
+                return
 
     async def _send_notification(self, method: str, params: dict[str, Any] | None = None) -> None:
         """Send a JSON-RPC notification (no response expected)."""
@@ -98,42 +494,62 @@ class StdioMcpClient:
             notification["params"] = params
 
         try:
-            notification_line = json.dumps(notification) + "\n"
-            self._process.stdin.write(notification_line.encode())
-            await self._process.stdin.drain()
+            await self._write(notification)
         except Exception as exc:
             raise McpClientError(f"{self._name}: failed to send notification: {exc}")
 
-    async def initialize(self) -> None:
-        """Perform MCP protocol initialization handshake."""
+    async def initialize(self, timeout: float = 30.0) -> None:
+        """Perform MCP protocol initialization handshake.
+
+        The first caller runs the handshake; concurrent callers wait for it to
+        finish instead of queueing on a lock. A server that answers is ready,
+        so launchers use this (with a short ``timeout``) as the readiness probe.
+        """
         if self._initialized:
             return
 
-        async with self._lock:
-            if self._initialized:
-                return
-
-            # Send initialize request
-            init_params = {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "mcp-workspace-finder",
-                    "version": "0.1.0",
-                },
-            }
+        if self._init_started:
+            done = self._init_done
+            await done.wait()
+            if not self._initialized:
+                raise McpClientError(f"{self._name}: initialization failed")
+            return
 
-            try:
-                result = await self._send_request("initialize", init_params)
-                logger.debug("%s: initialized with capabilities: %s", self._name, result)
+        self._init_started = True
+        done = self._init_done
+
+        # Send initialize request
+        init_params = {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {
+                "name": "mcp-workspace-finder",
+                "version": "0.1.0",
+            },
+        }
 
-                # Note: Skip "initialized" notification as some MCP servers (e.g., github v0.6.2)
-                # don't support it and will return "Method not found" errors
-                self._initialized = True
+        try:
+            result = await self._send_request("initialize", init_params, timeout=timeout)
+            logger.debug("%s: initialized with capabilities: %s", self._name, result)
+            self.server_info = result if isinstance(result, dict) else {}
+            capabilities = self.server_info.get("capabilities")
+            experimental = capabilities.get("experimental") if isinstance(capabilities, dict) else None
+            if isinstance(experimental, dict) and experimental.get("jsonrpcBatch"):
+                self._supports_batch = True
+
+            # Note: Skip "initialized" notification as some MCP servers (e.g., github v0.6.2)
+            # don't support it and will return "Method not found" errors
+            self._initialized = True
 
-            except McpClientError as exc:
-                logger.warning("%s: initialization failed: %s", self._name, exc)
-                raise
+        except McpClientError as exc:
+            logger.warning("%s: initialization failed: %s", self._name, exc)
+            raise
+        finally:
+            if not self._initialized:
+                # Allow a later call to retry the handshake with a fresh event.
+                self._init_started = False
+                self._init_done = asyncio.Event()
+            done.set()
 
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """Call a tool on the MCP server and return the result."""
@@ -141,18 +557,27 @@ class StdioMcpClient:
         if not self._initialized:
             await self.initialize()
 
-        async with self._lock:
-            result = await self._send_request(
-                "tools/call",
-                {
-                    "name": tool_name,
-                    "arguments": arguments,
-                },
-            )
-            # Extract content from result
-            if isinstance(result, dict):
-                return result.get("content", [])
-            return result
+        result = await self._send_request(
+            "tools/call",
+            {
+                "name": tool_name,
+                "arguments": arguments,
+            },
+        )
+        return _tool_content(result)
+
+    async def call_tools_batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """Call several tools in one JSON-RPC batch.
+
+        Returns one entry per call; failed calls yield an ``McpClientError``.
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        results = await self._send_batch(
+            [("tools/call", {"name": name, "arguments": arguments}) for name, arguments in calls]
+        )
+        return [item if isinstance(item, BaseException) else _tool_content(item) for item in results]
 
     async def read_resource(self, uri: str) -> str:
         """Read a resource from the MCP server using resources/read.
@@ -170,38 +595,72 @@ class StdioMcpClient:
         if not self._initialized:
             await self.initialize()
 
-        async with self._lock:
-            result = await self._send_request(
-                "resources/read",
-                {"uri": uri},
-            )
+        result = await self._send_request(
+            "resources/read",
+            {"uri": uri},
+        )
+        return self._resource_text(result)
 
-            # Extract content from result
-            # MCP resources/read returns: { contents: [{ uri, text?, blob?, mimeType? }] }
-            if not isinstance(result, dict):
-                raise McpClientError(f"{self._name}: invalid resources/read response format")
+    def _resource_text(self, result: Any) -> str:
+        payload = self._resource_payload(result)
+        if isinstance(payload, str):
+            return payload
+        try:
+            return payload.decode("utf-8")
+        except UnicodeDecodeError:
+            return payload.decode("utf-8", "replace")
+
+    def _resource_payload(self, result: Any) -> str | bytes:
+        # Extract content from result
+        # MCP resources/read returns: { contents: [{ uri, text?, blob?, mimeType? }] }
+        if not isinstance(result, dict):
+            raise McpClientError(f"{self._name}: invalid resources/read response format")
+
+        contents = result.get("contents")
+        if not contents or not isinstance(contents, list) or len(contents) == 0:
+            raise McpClientError(f"{self._name}: empty contents in resources/read response")
+
+        if len(contents) == 1:
+            return self._content_payload(contents[0])
+
+        # Chunked resources arrive as several contents entries; join them in order
+        parts = [self._content_payload(content) for content in contents]
+        if all(isinstance(part, bytes) for part in parts):
+            return b"".join(parts)  # sized up front: a single copy of the payload
+        return "".join(
+            part if isinstance(part, str) else part.decode("utf-8", "replace")
+            for part in parts
+        )
 
-            contents = result.get("contents")
-            if not contents or not isinstance(contents, list) or len(contents) == 0:
-                raise McpClientError(f"{self._name}: empty contents in resources/read response")
+    def _content_payload(self, content: Any) -> str | bytes:
+        if not isinstance(content, dict):
+            raise McpClientError(f"{self._name}: invalid content item in resources/read response")
+
+        # Try text first, then blob (base64 encoded)
+        if "text" in content:
+            return content["text"]
+        elif "blob" in content:
+            # Detach the base64 text from the response so it is freed as soon as
+            # it is decoded, before the caller allocates the UTF-8 string; peak
+            # memory is then two copies of the payload rather than three.
+            # a2b_base64 reads the ASCII str in place, unlike b64decode which
+            # first copies it into bytes.
+            blob = content.pop("blob")
+            try:
+                return binascii.a2b_base64(blob)
+            except (binascii.Error, ValueError, TypeError) as exc:
+                raise McpClientError(f"{self._name}: failed to decode blob content: {exc}")
+        else:
+            raise McpClientError(
+                f"{self._name}: resources/read response has neither 'text' nor 'blob'"
+            )
 
-            first_content = contents[0]
-            if not isinstance(first_content, dict):
-                raise McpClientError(f"{self._name}: invalid content item in resources/read response")
 
-            # Try text first, then blob (base64 encoded)
-            if "text" in first_content:
-                return first_content["text"]
-            elif "blob" in first_content:
-                try:
-                    decoded = base64.b64decode(first_content["blob"])
-                    return decoded.decode("utf-8")
-                except (ValueError, UnicodeDecodeError) as exc:
-                    raise McpClientError(f"{self._name}: failed to decode blob content: {exc}")
-            else:
-                raise McpClientError(
-                    f"{self._name}: resources/read response has neither 'text' nor 'blob'"
-                )
+def _tool_content(result: Any) -> Any:
+    # Extract content from result
+    if isinstance(result, dict):
+        return result.get("content", [])
+    return result
 
 
 def _parse_github_code_results(json_text: str, max_results: int = 3) -> list[Mapping[str, Any]]:
@@ -210,9 +669,18 @@ def _parse_github_code_results(json_text: str, max_results: int = 3) -> list[Map
     The real GitHub MCP server returns a text response containing JSON with format:
     {"total_count": N, "items": [{"name": "...", "html_url": "...", ...}, ...]}
     """
+    try:
+        data = _loads(json_text)
+    except Exception as exc:
+        logger.warning("Failed to parse GitHub code JSON: %s", exc)
+        return []
+    return _parse_github_code_results_from_dict(data, max_results)
+
+
+def _parse_github_code_results_from_dict(data: Any, max_results: int = 3) -> list[Mapping[str, Any]]:
+    """Build code search results from an already-decoded search_code payload."""
     results = []
     try:
-        data = json.loads(json_text)
         items = data.get("items", [])
         for item in items[:max_results]:
             repo = item.get("repository", {})
@@ -244,9 +712,18 @@ def _parse_github_issues_results(json_text: str, max_results: int = 3) -> list[M
     The real GitHub MCP server returns a text response containing JSON with format:
     {"total_count": N, "items": [{"title": "...", "html_url": "...", "number": N, ...}, ...]}
     """
+    try:
+        data = _loads(json_text)
+    except Exception as exc:
+        logger.warning("Failed to parse GitHub issues JSON: %s", exc)
+        return []
+    return _parse_github_issues_results_from_dict(data, max_results)
+
+
+def _parse_github_issues_results_from_dict(data: Any, max_results: int = 3) -> list[Mapping[str, Any]]:
+    """Build issue/PR search results from an already-decoded search_issues payload."""
     results = []
     try:
-        data = json.loads(json_text)
         items = data.get("items", [])
         for item in items[:max_results]:
             html_url = item.get("html_url", "")
@@ -258,8 +735,7 @@ def _parse_github_issues_results(json_text: str, max_results: int = 3) -> list[M
 
             # Extract owner/repo from html_url
             # Format: https://github.com/owner/repo/issues/123
-            import re
-            match = re.search(r"github\.com/([^/]+)/([^/]+)/(?:issues|pull)/(\d+)", html_url)
+            match = _GH_ISSUE_URL_RE.search(html_url)
             owner = match.group(1) if match else ""
             repo = match.group(2) if match else ""
 
@@ -267,7 +743,7 @@ def _parse_github_issues_results(json_text: str, max_results: int = 3) -> list[M
             results.append({
                 "service": "github",
                 "title": f"#{number} {title}",
-                "snippet": body[:200] if body else f"{kind.upper()} ({state})",
+                "snippet": body[:_SNIPPET_CHARS] if body else f"{kind.upper()} ({state})",
                 "uri": html_url,
                 "kind": kind,
                 "owner": owner,
@@ -283,7 +759,8 @@ def _parse_github_issues_results(json_text: str, max_results: int = 3) -> list[M
 def _parse_github_json_results(json_text: str, max_results: int = 3) -> list[Mapping[str, Any]]:
     """Parse JSON results from GitHub MCP server (auto-detect code vs issues format)."""
     try:
-        data = json.loads(json_text)
+        # Decode once; the format-specific parsers reuse the payload
+        data = _loads(json_text)
         items = data.get("items", [])
         if not items:
             return []
@@ -292,51 +769,69 @@ def _parse_github_json_results(json_text: str, max_results: int = 3) -> list[Map
         first_item = items[0]
         if "path" in first_item or "repository" in first_item:
             # Code search result
-            return _parse_github_code_results(json_text, max_results)
+            return _parse_github_code_results_from_dict(data, max_results)
         elif "number" in first_item or "pull_request" in first_item:
             # Issue/PR search result
-            return _parse_github_issues_results(json_text, max_results)
+            return _parse_github_issues_results_from_dict(data, max_results)
         else:
             # Fallback to code parser
-            return _parse_github_code_results(json_text, max_results)
+            return _parse_github_code_results_from_dict(data, max_results)
     except Exception as exc:
         logger.warning("Failed to parse GitHub JSON: %s", exc)
         return []
 
 
+_DRIVE_LOCK = threading.Lock()
+
+
 def _get_drive_service():
     """Create Google Drive API service using stored credentials.
 
+    The service is cached per token file and rebuilt when its mtime changes,
+    so token rotation is picked up without re-reading the file on every call.
+
     Returns:
         Google Drive service object or None if credentials are unavailable.
     """
+    token_path = os.getenv("DRIVE_TOKEN_PATH")
     try:
-        from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
-
-        token_path = os.getenv("DRIVE_TOKEN_PATH")
-        if not token_path or not os.path.exists(token_path):
-            logger.debug("DRIVE_TOKEN_PATH not set or file not found")
-            return None
-
-        with open(token_path) as f:
-            token_data = json.load(f)
-
-        creds = Credentials(
-            token=token_data.get("access_token"),
-            refresh_token=token_data.get("refresh_token"),
-            token_uri="https://oauth2.googleapis.com/token",
-            client_id=token_data.get("client_id"),
-            client_secret=token_data.get("client_secret"),
-        )
-
-        return build("drive", "v3", credentials=creds)
+        mtime = os.path.getmtime(token_path) if token_path else None
+    except OSError:
+        mtime = None
+    if mtime is None:
+        logger.debug("DRIVE_TOKEN_PATH not set or file not found")
+        return None
 
+    try:
+        # GDrive parsing runs in worker threads; build the service only once
+        with _DRIVE_LOCK:
+            return _build_drive_service(token_path, mtime)
     except Exception as exc:
         logger.debug("Failed to create Drive service: %s", exc)
         return None
 
 
+@lru_cache(maxsize=1)
+def _build_drive_service(token_path: str, mtime: float):
+    # mtime is part of the cache key only; failures raise and are not cached
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.discovery import build
+
+    with open(token_path) as f:
+        token_data = json.load(f)
+
+    creds = Credentials(
+        token=token_data.get("access_token"),
+        refresh_token=token_data.get("refresh_token"),
+        token_uri="https://oauth2.googleapis.com/token",
+        client_id=token_data.get("client_id"),
+        client_secret=token_data.get("client_secret"),
+    )
+
+    # The bundled discovery document is used; skip the on-disk discovery cache
+    return build("drive", "v3", credentials=creds, cache_discovery=False)
+
+
 def _get_webviewlink_from_drive_api(filename: str) -> str | None:
     """Get webViewLink for a file by name using Google Drive API.
 
@@ -346,33 +841,60 @@ def _get_webviewlink_from_drive_api(filename: str) -> str | None:
     Returns:
         The webViewLink URL if found, None otherwise.
     """
+    return _get_webviewlinks_bulk([filename]).get(filename)
+
+
+def _drive_query_literal(value: str) -> str:
+    # Drive query strings escape backslashes and single quotes with a backslash;
+    # most filenames contain neither, and two membership tests beat two scans
+    if "'" in value or "\\" in value:
+        value = value.replace("\\", "\\\\").replace("'", "\\'")
+    return "'" + value + "'"
+
+
+def _get_webviewlinks_bulk(filenames: list[str]) -> dict[str, str]:
+    """Look up webViewLinks for several exact filenames with one Drive API call.
+
+    Args:
+        filenames: Filenames to search for.
+
+    Returns:
+        Mapping of filename to webViewLink for the files that were found. When a
+        name matches several files, the first one returned by the API wins.
+    """
+    names = list(dict.fromkeys(filenames))
+    if not names:
+        return {}
+
+    links: dict[str, str] = {}
     try:
         service = _get_drive_service()
         if not service:
-            return None
-
-        # Search for the file by exact name
-        # Escape single quotes in filename for the query
-        escaped_name = filename.replace("'", "\\'")
-        query = f"name = '{escaped_name}'"
-
-        results = service.files().list(
-            q=query,
-            fields="files(id, name, webViewLink)",
-            pageSize=1,
-        ).execute()
-
-        files = results.get("files", [])
-        if files:
-            web_view_link = files[0].get("webViewLink")
-            if web_view_link:
-                logger.debug("Found webViewLink for '%s': %s", filename, web_view_link)
-                return web_view_link
+            return links
+
+        # One disjunctive query instead of a round-trip per file
+        query = " or ".join(f"name = {_drive_query_literal(name)}" for name in names)
+
+        # The service's HTTP client is not thread-safe; share it one call at a time
+        with _DRIVE_LOCK:
+            results = service.files().list(
+                q=query,
+                fields="files(id, name, webViewLink)",
+                pageSize=100,
+            ).execute()
+
+        wanted = set(names)
+        for file in results.get("files", []):
+            name = file.get("name")
+            web_view_link = file.get("webViewLink")
+            if name in wanted and web_view_link and name not in links:
+                logger.debug("Found webViewLink for '%s': %s", name, web_view_link)
+                links[name] = web_view_link
 
     except Exception as exc:
         logger.debug("Failed to get webViewLink from Drive API: %s", exc)
 
-    return None
+    return links
 
 
 def _parse_gdrive_text_results(text: str, max_results: int = 3) -> list[Mapping[str, Any]]:
@@ -384,29 +906,28 @@ def _parse_gdrive_text_results(text: str, max_results: int = 3) -> list[Mapping[
     This function tries to get the actual webViewLink using Google Drive API.
     If that fails, it falls back to constructing a search URL.
     """
-    import re
-    from urllib.parse import quote
-
     results = []
     try:
         # Skip the "Found N files:" header
         lines = text.strip().split("\n")
+        files: list[tuple[str, str]] = []
         for line in lines[1:max_results + 1]:
             line = line.strip()
             if not line:
                 continue
 
             # Parse "ファイル名 (mimeType)" format
-            match = re.match(r"^(.+?)\s*\(([^)]+)\)$", line)
+            match = _GDRIVE_LINE_RE.match(line)
             if match:
-                title = match.group(1).strip()
-                mime_type = match.group(2).strip()
+                files.append((match.group(1).strip(), match.group(2).strip()))
             else:
-                title = line
-                mime_type = "unknown"
+                files.append((line, "unknown"))
+
+        # Try to get the actual webViewLinks from Google Drive API in one call
+        web_view_links = _get_webviewlinks_bulk([title for title, _ in files])
 
-            # Try to get the actual webViewLink from Google Drive API
-            web_view_link = _get_webviewlink_from_drive_api(title)
+        for title, mime_type in files:
+            web_view_link = web_view_links.get(title)
 
             if web_view_link:
                 uri = web_view_link
@@ -445,38 +966,54 @@ def _parse_slack_csv_results(csv_text: str, max_results: int = 3) -> list[Mappin
     correctly for all Slack configurations. See:
     https://github.com/korotovsky/slack-mcp-server/issues/XXX (TODO: file issue)
     """
-    import csv
-    import io
-    import os
-
     results = []
     try:
-        reader = csv.DictReader(io.StringIO(csv_text))
+        # Index columns once from the header and stop after max_results rows,
+        # instead of building a dict for every row of the response.
+        reader = csv.reader(io.StringIO(csv_text))
+        header = next(reader, None)
+        if not header:
+            return results
+        columns = {name: idx for idx, name in enumerate(header)}
+        msg_idx = columns.get("MsgID")
+        channel_idx = columns.get("Channel")
+        text_idx = columns.get("Text")
+        user_idx = columns.get("RealName", columns.get("UserName"))
+        time_idx = columns.get("Time")
+
+        def _cell(row: list[str], idx: int | None) -> str:
+            return row[idx] if idx is not None and idx < len(row) else ""
+
+        # Construct a pseudo-permalink for reference
+        # Format: slack://channel/timestamp (or use SLACK_WORKSPACE env if available)
+        # Read per response, not at import: .env is loaded after this module is imported
+        workspace = os.getenv("SLACK_WORKSPACE", "workspace")
+        archives_url = f"https://{workspace}.slack.com/archives/"
+
         for row in reader:
             if len(results) >= max_results:
                 break
+            if not row:
+                continue
             # Extract channel_id from Channel field (e.g., "#general" -> need to lookup)
             # For now, use MsgID as thread_ts since that's the message identifier
-            msg_id = row.get("MsgID", "")
-            channel = row.get("Channel", "")
-            text = row.get("Text", "")
-            user = row.get("RealName", row.get("UserName", ""))
-            time = row.get("Time", "")
+            msg_id = _cell(row, msg_idx)
+            channel = _cell(row, channel_idx)
+            text = _cell(row, text_idx)
+            user = _cell(row, user_idx)
+            time = _cell(row, time_idx)
 
             # The MsgID is in format like "1762499528.459139" which is the timestamp
             thread_ts = msg_id
 
-            # Construct a pseudo-permalink for reference
-            # Format: slack://channel/timestamp (or use SLACK_WORKSPACE env if available)
-            workspace = os.getenv("SLACK_WORKSPACE", "workspace")
             channel_display = channel.lstrip("#") if channel else "channel"
             ts_for_url = msg_id.replace(".", "") if msg_id else ""
-            uri = f"https://{workspace}.slack.com/archives/{channel_display}/p{ts_for_url}" if ts_for_url else ""
+            uri = f"{archives_url}{channel_display}/p{ts_for_url}" if ts_for_url else ""
 
             results.append({
                 "service": "slack",
                 "title": f"Message from {user}" if user else "Slack message",
-                "snippet": text[:200] if text else "",
+                "snippet": text[:_SNIPPET_CHARS],
                 "uri": uri,
                 "kind": "message",
                 "channel": channel,  # Channel name, not ID
@@ -491,6 +1028,29 @@ def _parse_slack_csv_results(csv_text: str, max_results: int = 3) -> list[Mappin
     return results
 
 
+def _parse_github_text_results(text: str, max_results: int) -> list[Mapping[str, Any]] | None:
+    # GitHub: JSON format with items array
+    return _parse_github_json_results(text, max_results) if text.strip().startswith("{") else None
+
+
+def _parse_gdrive_search_text(text: str, max_results: int) -> list[Mapping[str, Any]] | None:
+    # GDrive: Plain text "Found N files:" format
+    return _parse_gdrive_text_results(text, max_results) if "Found" in text else None
+
+
+# Parsers for real MCP server text responses, chosen once per search runner.
+# Returning None falls back to generic normalization.
+_TEXT_RESULT_PARSERS: Mapping[str, Any] = MappingProxyType({
+    "slack": _parse_slack_csv_results,  # Slack: CSV format
+    "github": _parse_github_text_results,
+    "gdrive": _parse_gdrive_search_text,
+    "drive": _parse_gdrive_search_text,
+})
+
+# GDrive parsing resolves webViewLinks through the (synchronous) Drive API
+_BLOCKING_TEXT_PARSERS = frozenset((_parse_gdrive_search_text,))
+
+
 def create_search_runner(
     client: StdioMcpClient,
     service: str,
@@ -506,78 +1066,95 @@ def create_search_runner(
     Returns:
         An async function that takes search params and returns results
     """
-    # Get the parameter mapping for this service
+    # Resolve parameter names and the text-response parser once per runner
     param_mapping = SEARCH_PARAM_MAPPINGS.get(service, {"query_param": "query", "limit_param": "limit"})
+    query_param = param_mapping["query_param"]
+    limit_param = param_mapping.get("limit_param")
+    text_parser = _TEXT_RESULT_PARSERS.get(service)
+    # Parsers that call out to HTTP APIs run off the event loop
+    offload_parse = text_parser in _BLOCKING_TEXT_PARSERS
 
-    async def search_runner(params: Mapping[str, Any]) -> list[Mapping[str, Any]]:
-        query = params.get("query", "")
-        max_results = params.get("max_results", 3)
+    # Build arguments using the correct parameter names for this service; the
+    # variant is picked here so a call does no branching on configuration
+    if limit_param:
 
-        # Build arguments using the correct parameter names for this service
-        arguments: dict[str, Any] = {
-            param_mapping["query_param"]: query,
-        }
-        if param_mapping.get("limit_param"):
-            arguments[param_mapping["limit_param"]] = max_results
+        def tool_call(query: str, max_results: int) -> tuple[str, dict[str, Any]]:
+            """Build the (tool, arguments) pair for a search, for batching."""
+            return tool_name, {query_param: query, limit_param: max_results}
 
-        try:
-            result = await client.call_tool(
-                tool_name,
-                arguments,
-            )
+    else:
+
+        def tool_call(query: str, max_results: int) -> tuple[str, dict[str, Any]]:
+            """Build the (tool, arguments) pair for a search, for batching."""
+            return tool_name, {query_param: query}
+
+    if text_parser is None:
 
+        def parse(result: Any, max_results: int) -> list[Mapping[str, Any]]:
+            """Turn a search tool result into normalized hits."""
+            return _normalize_search_items(result, service)
+
+    else:
+
+        def parse(result: Any, max_results: int) -> list[Mapping[str, Any]]:
+            """Turn a search tool result into normalized hits."""
             # Handle real MCP server text responses
             # Real servers return [{"type": "text", "text": "..."}] format
             if isinstance(result, list) and result:
                 first_item = result[0]
                 if isinstance(first_item, dict) and first_item.get("type") == "text":
-                    text_content = first_item.get("text", "")
-
-                    # Slack: CSV format
-                    if service == "slack":
-                        return _parse_slack_csv_results(text_content, max_results)
-
-                    # GitHub: JSON format with items array
-                    if service == "github" and text_content.strip().startswith("{"):
-                        return _parse_github_json_results(text_content, max_results)
-
-                    # GDrive: Plain text "Found N files:" format
-                    if service in ("gdrive", "drive") and "Found" in text_content:
-                        return _parse_gdrive_text_results(text_content, max_results)
-
-            # Normalize results to expected format (for mock servers and structured responses)
-            normalized = []
-            for item in result if isinstance(result, list) else [result]:
-                if isinstance(item, dict):
-                    # Extract URI from various possible field names used by real MCP servers
-                    # GitHub uses: html_url, url
-                    # GDrive uses: webViewLink, uri
-                    uri = (
-                        item.get("uri")
-                        or item.get("url")
-                        or item.get("html_url")  # GitHub search_code returns html_url
-                        or item.get("webViewLink")  # GDrive returns webViewLink
-                        or item.get("permalink")
-                        or ""
-                    )
-                    normalized.append({
-                        "service": service,
-                        "title": item.get("title", item.get("name", "Untitled")),
-                        "snippet": item.get("snippet", item.get("text", ""))[:200],
-                        "uri": uri,
-                        "kind": item.get("kind", item.get("type", "file")),
-                        **{k: v for k, v in item.items() if k not in ("title", "snippet", "uri", "kind")},
-                    })
+                    parsed = text_parser(first_item.get("text", ""), max_results)
+                    if parsed is not None:
+                        return parsed
 
-            return normalized
+            return _normalize_search_items(result, service)
+
+    async def search_runner(params: Mapping[str, Any]) -> list[Mapping[str, Any]]:
+        try:
+            max_results = params.get("max_results", 3)
+            result = await client.call_tool(*tool_call(params.get("query", ""), max_results))
+            if offload_parse:
+                return await asyncio.to_thread(parse, result, max_results)
+            return parse(result, max_results)
 
         except McpClientError as exc:
             logger.warning("%s search failed: %s", service, exc)
             raise
 
+    search_runner.tool_call = tool_call  # type: ignore[attr-defined]
+    search_runner.parse = parse  # type: ignore[attr-defined]
     return search_runner
 
 
+def _normalize_search_items(result: Any, service: str) -> list[Mapping[str, Any]]:
+    # Normalize results to expected format (for mock servers and structured responses)
+    normalized = []
+    for item in result if isinstance(result, list) else [result]:
+        if isinstance(item, dict):
+            # Extract URI from various possible field names used by real MCP servers
+            # GitHub uses: html_url, url
+            # GDrive uses: webViewLink, uri
+            uri = (
+                item.get("uri")
+                or item.get("url")
+                or item.get("html_url")  # GitHub search_code returns html_url
+                or item.get("webViewLink")  # GDrive returns webViewLink
+                or item.get("permalink")
+                or ""
+            )
+            # Copy the item in C (keeping permalink, owner/repo, ...) and then
+            # overwrite the canonical fields; a service field from the server wins
+            entry = item.copy()
+            entry.setdefault("service", service)
+            entry["title"] = item.get("title", item.get("name", "Untitled"))
+            entry["snippet"] = item.get("snippet", item.get("text", ""))[:_SNIPPET_CHARS]
+            entry["uri"] = uri
+            entry["kind"] = item.get("kind", item.get("type", "file"))
+            normalized.append(entry)
+
+    return normalized
+
+
 def create_fetch_runner(
     client: StdioMcpClient,
     service: str,
@@ -595,57 +1172,63 @@ def create_fetch_runner(
         An async function that takes a SearchResult and returns content
     """
 
-    async def fetch_runner(result: SearchResult) -> Any:
-        try:
-            # If tool_name is None, use read_resource with the URI
-            if tool_name is None:
+    if tool_name is None:
+        # Resource-based fetch: use read_resource with the URI
+        async def fetch_runner(result: SearchResult) -> Any:
+            try:
                 uri = result.fetch_params.get("uri")
                 if not uri:
                     raise McpClientError(
                         f"{service}: fetch_params missing 'uri' for read_resource"
                     )
                 return await client.read_resource(uri)
+            except McpClientError as exc:
+                logger.warning("%s fetch failed: %s", service, exc)
+                raise
 
-            # Otherwise, use the tool call
-            content = await client.call_tool(
-                tool_name,
-                result.fetch_params,
-            )
+    else:
+        # Tool-based fetch
+        async def fetch_runner(result: SearchResult) -> Any:
+            try:
+                content = await client.call_tool(tool_name, result.fetch_params)
+                return _fetched_text(content)
+            except McpClientError as exc:
+                logger.warning("%s fetch failed: %s", service, exc)
+                raise
 
-            # Extract text content from response
-            if isinstance(content, list) and content:
-                first = content[0]
-                if isinstance(first, dict):
-                    return first.get("text", first.get("content", str(first)))
-                return str(first)
-            return str(content) if content else ""
+    return fetch_runner
 
-        except McpClientError as exc:
-            logger.warning("%s fetch failed: %s", service, exc)
-            raise
 
-    return fetch_runner
+def _fetched_text(content: Any) -> Any:
+    # Extract text content from response
+    if isinstance(content, list) and content:
+        first = content[0]
+        if isinstance(first, dict):
+            return first.get("text", first.get("content", str(first)))
+        return str(first)
+    return str(content) if content else ""
 
 
 # Tool name mappings for each service
 # Note: "drive" in servers.yaml maps to "gdrive" in search parameters
-SEARCH_TOOLS = {
+# The tables are read-only views so runtime code cannot mutate them by accident.
+SEARCH_TOOLS: Mapping[str, str] = MappingProxyType({
     "slack": "conversations_search_messages",  # korotovsky/slack-mcp-server
     "github": "search_code",  # @modelcontextprotocol/server-github
     "gdrive": "search",  # @modelcontextprotocol/server-gdrive
     "drive": "search",  # alias for gdrive
-}
+})
 
 # Parameter name mappings for each service's search tool
 # Each MCP server uses different parameter names
-SEARCH_PARAM_MAPPINGS = {
+SEARCH_PARAM_MAPPINGS: Mapping[str, Mapping[str, str | None]] = MappingProxyType({
     "slack": {"query_param": "search_query", "limit_param": "limit"},
     "github": {"query_param": "q", "limit_param": "per_page"},
     "gdrive": {"query_param": "query", "limit_param": None},  # gdrive doesn't support limit
     "drive": {"query_param": "query", "limit_param": None},
-}
+})
 
-FETCH_TOOLS = {
+FETCH_TOOLS: Mapping[str, str | None] = MappingProxyType({
     # Slack: Use conversations_replies for fetching thread messages
     "slack": "conversations_replies",
     "slack.conversations_replies": "conversations_replies",
@@ -657,12 +1240,77 @@ FETCH_TOOLS = {
     # The fetch runner should handle this via MCP resources protocol
     "gdrive": None,  # Resource-based, not tool-based
     "drive": None,
-}
+})
+
+# Additional fetch tools registered under "<service>.<tool>" besides the primary one
+EXTRA_FETCH_TOOLS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    # Code search results are fetched with get_file_contents
+    "github": ("get_file_contents",),
+})
 
 # Service name normalization (servers.yaml -> search params)
-SERVICE_NAME_MAP = {
+SERVICE_NAME_MAP: Mapping[str, str] = MappingProxyType({
     "drive": "gdrive",
-}
+})
+
+
+@dataclass(frozen=True)
+class _RegPlan:
+    """Which runners to create for one server and under which names."""
+
+    service: str
+    raw: str
+    search_tool: str | None
+    combined_search: bool
+    has_fetch: bool
+    fetch_tool: str | None
+    extra_fetch_tools: tuple[str, ...]
+
+    @property
+    def aliases(self) -> tuple[str, ...]:
+        return (self.service,) if self.raw == self.service else (self.service, self.raw)
+
+    @cached_property
+    def search_keys(self) -> tuple[str, ...]:
+        return self.aliases if self.combined_search or self.search_tool else ()
+
+    @cached_property
+    def fetch_keys(self) -> tuple[tuple[str, str | None], ...]:
+        """(runner key, fetch tool) pairs; a ``None`` tool fetches via resources/read."""
+        if not self.has_fetch:
+            return ()
+        keys: list[tuple[str, str | None]] = []
+        # Register under the normalized name and the original name for compatibility
+        for alias in self.aliases:
+            keys.append((alias, self.fetch_tool))
+            if self.fetch_tool:
+                keys.append((sys.intern(f"{alias}.{self.fetch_tool}"), self.fetch_tool))
+            # Always register a __read_resource__ runner so results can also be
+            # fetched via resources/read; tool-less services already use it.
+            keys.append((sys.intern(f"{alias}.__read_resource__"), None))
+        keys.extend((sys.intern(f"{self.service}.{tool}"), tool) for tool in self.extra_fetch_tools)
+        return tuple(keys)
+
+
+@lru_cache(maxsize=None)
+def _plan_registration(raw_service: str) -> _RegPlan:
+    # Names read from YAML are fresh strings; interning them lets the table
+    # lookups here and the runner closures match the literal keys by identity.
+    raw_service = sys.intern(raw_service)
+    # Normalize service name (e.g., "drive" -> "gdrive")
+    service = SERVICE_NAME_MAP.get(raw_service, raw_service)
+    has_fetch = service in FETCH_TOOLS or raw_service in FETCH_TOOLS
+    return _RegPlan(
+        service=service,
+        raw=raw_service,
+        search_tool=SEARCH_TOOLS.get(service) or SEARCH_TOOLS.get(raw_service),
+        # For GitHub, use combined runner that searches both code and issues
+        combined_search=service == "github",
+        has_fetch=has_fetch,
+        # Can be None for resource-based fetch
+        fetch_tool=FETCH_TOOLS.get(service, FETCH_TOOLS.get(raw_service)) if has_fetch else None,
+        extra_fetch_tools=EXTRA_FETCH_TOOLS.get(service, ()),
+    )
 
 
 def create_github_combined_search_runner(
@@ -671,7 +1319,7 @@ def create_github_combined_search_runner(
     """Create a GitHub search runner that searches both code and issues.
 
     This runner calls search_code, search_issues (for issues), and
-    search_issues (for PRs) in parallel, then merges the results.
+    search_issues (for PRs) concurrently, then merges the results.
     """
     code_runner = create_search_runner(client, "github", "search_code")
     issues_runner = create_search_runner(client, "github", "search_issues")
@@ -683,47 +1331,46 @@ def create_github_combined_search_runner(
         # GitHub search_issues requires 'is:issue' or 'is:pull-request' in the query.
         # We need to run separate queries for issues and PRs since an item cannot be
         # both an issue AND a PR (using "is:issue is:pr" returns zero results).
+        lowered = query.lower()
         has_type_filter = any(
-            f in query.lower() for f in ("is:issue", "is:pr", "is:pull-request")
+            f in lowered for f in ("is:issue", "is:pr", "is:pull-request")
         )
 
-        # Build query params for issues and PRs
+        # Build the queries for issues and PRs; the tool arguments are built
+        # straight from them, without copying params per search
+        searches = [("code", code_runner, query)]
         if has_type_filter:
             # User already specified a type filter, use as-is
-            issues_params = {**params, "query": query}
-            prs_params = None  # Skip PR search if user specified a type
+            # Skip PR search if user specified a type
+            searches.append(("issues", issues_runner, query))
         else:
             # Search for both issues and PRs separately
-            issues_params = {**params, "query": f"{query} is:issue"}
-            prs_params = {**params, "query": f"{query} is:pr"}
-
-        # Run searches in parallel
-        code_task = asyncio.create_task(code_runner(params))
-        issues_task = asyncio.create_task(issues_runner(issues_params))
-        prs_task = (
-            asyncio.create_task(issues_runner(prs_params)) if prs_params else None
-        )
+            searches.append(("issues", issues_runner, f"{query} is:issue"))
+            searches.append(("PRs", issues_runner, f"{query} is:pr"))
 
-        code_results: list[Mapping[str, Any]] = []
-        issues_results: list[Mapping[str, Any]] = []
-        prs_results: list[Mapping[str, Any]] = []
-
-        # Gather results, handling failures gracefully
+        # Submit all searches at once; they share one JSON-RPC batch only when
+        # the server opted in, and are otherwise concurrent single requests
         try:
-            code_results = await code_task
-        except Exception as exc:
-            logger.debug("GitHub code search failed: %s", exc)
-
-        try:
-            issues_results = await issues_task
-        except Exception as exc:
-            logger.debug("GitHub issues search failed: %s", exc)
+            outcomes = await client.call_tools_batch(
+                [runner.tool_call(search_query, max_results) for _, runner, search_query in searches]
+            )
+        except McpClientError as exc:
+            logger.warning("github search failed: %s", exc)
+            outcomes = [exc] * len(searches)
 
-        if prs_task:
+        # Parse results, handling failures gracefully
+        parsed: dict[str, list[Mapping[str, Any]]] = {}
+        for (label, runner, _), outcome in zip(searches, outcomes):
             try:
-                prs_results = await prs_task
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                parsed[label] = runner.parse(outcome, max_results)
             except Exception as exc:
-                logger.debug("GitHub PRs search failed: %s", exc)
+                logger.debug("GitHub %s search failed: %s", label, exc)
+
+        code_results = parsed.get("code", [])
+        issues_results = parsed.get("issues", [])
+        prs_results = parsed.get("PRs", [])
 
         # Merge results: prioritize issues/PRs, then code
         # Limit total to max_results
@@ -735,73 +1382,571 @@ def create_github_combined_search_runner(
 
 async def create_mcp_runners_from_processes(
     processes: Mapping[str, asyncio.subprocess.Process],
+    *,
+    prewarm: bool = False,
+    handshake_timeout: float = 30.0,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
     """Create search and fetch runners from running MCP server processes.
 
     Args:
         processes: Mapping of service names to their subprocess handles
+        prewarm: Run every client's initialize handshake concurrently before
+            returning, dropping the runners of services whose handshake failed
+        handshake_timeout: How long a prewarm handshake may take; this is the
+            readiness check for servers launched without an output probe
 
     Returns:
         Tuple of (search_runners, fetch_runners) dicts
     """
+    registrations: list[tuple[StdioMcpClient, dict[str, Any], dict[str, Any]]] = []
+
+    for raw_service, process in processes.items():
+        plan = _plan_registration(raw_service)
+        client = StdioMcpClient(process, plan.service)
+        search_runners: dict[str, Any] = {}
+        fetch_runners: dict[str, Any] = {}
+        registrations.append((client, search_runners, fetch_runners))
+
+        search_runner = None
+        if plan.combined_search:
+            search_runner = create_github_combined_search_runner(client)
+        elif plan.search_tool:
+            search_runner = create_search_runner(client, plan.service, plan.search_tool)
+        for key in plan.search_keys:
+            search_runners[key] = search_runner
+
+        # One runner per fetch tool, shared by every key that fetches with it
+        by_tool: dict[str | None, Any] = {}
+        for key, tool in plan.fetch_keys:
+            if tool not in by_tool:
+                by_tool[tool] = create_fetch_runner(client, plan.service, tool)
+            fetch_runners[key] = by_tool[tool]
+
+    if prewarm:
+        # Handshakes run concurrently so startup costs max(initialize), not the sum
+        outcomes = await asyncio.gather(
+            *(client.initialize(timeout=handshake_timeout) for client, _, _ in registrations),
+            return_exceptions=True,
+        )
+        warmed = []
+        for registration, outcome in zip(registrations, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning("%s initialize failed, skipping: %s", registration[0]._name, outcome)
+            else:
+                warmed.append(registration)
+        registrations = warmed
+
+    all_search_runners: dict[str, Any] = {}
+    all_fetch_runners: dict[str, Any] = {}
+    for _, search_runners, fetch_runners in registrations:
+        all_search_runners.update(search_runners)
+        all_fetch_runners.update(fetch_runners)
+    return all_search_runners, all_fetch_runners
+
+
+def _default_searches(search_runners: Mapping[str, Any], query: str) -> list[dict[str, Any]]:
+    """Build one search per distinct runner, preferring canonical service names.
+
+    Aliases such as "drive" share the runner of their canonical name and would
+    otherwise query the same server twice.
+    """
+    seen: set[int] = set()
+    searches: list[dict[str, Any]] = []
+    # Canonical names first so an alias never claims the runner
+    ordered = sorted(search_runners.items(), key=lambda entry: entry[0] in SERVICE_NAME_MAP)
+    for name, runner in ordered:
+        if id(runner) in seen:
+            continue
+        seen.add(id(runner))
+        searches.append({"service": name, "query": query, "max_results": 3})
+    return searches
+
+
+DEFAULT_SESSION_TTL = 300.0  # seconds an idle pooled session is kept alive
+
+McpRunners = tuple[dict[str, Any], dict[str, Any]]
+# processes, search runners, fetch runners, and launches still in progress
+_LaunchedSession = tuple[
+    dict[str, asyncio.subprocess.Process],
+    dict[str, Any],
+    dict[str, Any],
+    set[asyncio.Future[McpRunners]],
+]
+
+
+def _close_pipes(process: asyncio.subprocess.Process) -> None:
+    # Close the stdio transports now; left to garbage collection they emit
+    # "unclosed transport" ResourceWarnings once the event loop is gone
+    transport = getattr(process, "_transport", None)
+    if transport is not None:
+        transport.close()
+        return
+    stdin = getattr(process, "stdin", None)
+    if stdin is not None:
+        stdin.close()
+
+
+async def _stop_process(process: asyncio.subprocess.Process | None) -> None:
+    if not process:
+        return
+    try:
+        if process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+    except ProcessLookupError:
+        pass  # already exited between the returncode check and the signal
+    finally:
+        _close_pipes(process)
+
+
+async def _terminate_processes(processes: Mapping[str, asyncio.subprocess.Process]) -> None:
+    # Stop all servers at once so teardown waits for the slowest, not the sum
+    results = await asyncio.gather(
+        *(_stop_process(process) for process in processes.values()),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.debug("failed to stop MCP server: %s", result)
+
+
+def _kill_processes(processes: Mapping[str, asyncio.subprocess.Process]) -> None:
+    """Synchronously kill processes whose event loop is gone (e.g. at exit)."""
+    for process in processes.values():
+        if process and process.returncode is None:
+            try:
+                process.kill()
+            except Exception:  # noqa: BLE001
+                pass
+
+
+class _LazyService:
+    """Launch one MCP server the first time any of its runners is called."""
+
+    def __init__(
+        self,
+        name: str,
+        definitions: Mapping[str, Any],
+        resolved: Mapping[str, Any],
+        processes: dict[str, asyncio.subprocess.Process],
+        *,
+        readiness_timeout: float,
+        launch_slots: asyncio.Semaphore,
+        launches: set[asyncio.Future[McpRunners]],
+    ):
+        self._name = name
+        self._definitions = {name: definitions[name]}
+        self._resolved = {name: resolved[name]}
+        self._processes = processes
+        self._readiness_timeout = readiness_timeout
+        self._launch_slots = launch_slots
+        self._launches = launches
+        self._launch: asyncio.Future[McpRunners] | None = None
+
+    async def runners(self) -> McpRunners:
+        # Concurrent first calls share one launch; a failed launch is forgotten
+        # so the next call (e.g. the next query on a pooled session) retries it
+        if self._launch is None:
+            self._launch = asyncio.ensure_future(self._start())
+            self._launch.add_done_callback(self._forget_failed_launch)
+            # Tracked so session teardown can wait for launches nobody awaits
+            self._launches.add(self._launch)
+            self._launch.add_done_callback(self._launches.discard)
+        return await asyncio.shield(self._launch)
+
+    def _forget_failed_launch(self, launch: asyncio.Future[McpRunners]) -> None:
+        if self._launch is launch and (launch.cancelled() or launch.exception() is not None):
+            self._launch = None
+
+    async def _start(self) -> McpRunners:
+        # Slots are shared by the session's services, capping concurrent spawns
+        async with self._launch_slots:
+            statuses = await launch_services_async(
+                self._definitions,
+                self._resolved,
+                wait_for_output=False,
+            )
+        status = statuses[self._name]
+        if status.process is None:
+            raise McpClientError(f"{self._name}: failed to start: {status.error or status.warning}")
+        # Registered before the handshake so session cleanup terminates it either way
+        self._processes[self._name] = status.process
+        try:
+            runners = await create_mcp_runners_from_processes(
+                {self._name: status.process},
+                prewarm=True,
+                handshake_timeout=self._readiness_timeout,
+            )
+            if not any(runners):
+                raise McpClientError(f"{self._name}: initialize failed")
+        except BaseException:
+            # Stop the half-started server so a retry launches a fresh one
+            if self._processes.get(self._name) is status.process:
+                del self._processes[self._name]
+            await _stop_process(status.process)
+            raise
+        return runners
+
+    async def resolve(self, key: str, *, fetch: bool) -> Any:
+        search_runners, fetch_runners = await self.runners()
+        runner = (fetch_runners if fetch else search_runners).get(key)
+        if runner is None:
+            raise McpClientError(f"{self._name}: no runner for {key}")
+        return runner
+
+
+def _lazy_search_runner(service: _LazyService, key: str) -> Any:
+    async def search_runner(params: Mapping[str, Any]) -> list[Mapping[str, Any]]:
+        runner = await service.resolve(key, fetch=False)
+        return await runner(params)
+
+    search_runner.warm = service.runners  # type: ignore[attr-defined]
+    return search_runner
+
+
+def _lazy_fetch_runner(service: _LazyService, key: str) -> Any:
+    async def fetch_runner(result: Any) -> Any:
+        runner = await service.resolve(key, fetch=True)
+        return await runner(result)
+
+    fetch_runner.warm = service.runners  # type: ignore[attr-defined]
+    return fetch_runner
+
+
+async def _warm_services(runners: McpRunners, services: Iterable[str]) -> None:
+    """Start the listed services of a lazy session now instead of on first use."""
+    search_runners, fetch_runners = runners
+    warmers = []
+    for name in services:
+        service = _plan_registration(name).service
+        runner = search_runners.get(service) or fetch_runners.get(service)
+        warm = getattr(runner, "warm", None)  # eager sessions are already running
+        if warm is not None:
+            warmers.append(warm())
+    for outcome in await asyncio.gather(*warmers, return_exceptions=True):
+        if isinstance(outcome, Exception):
+            logger.warning("prewarm failed: %s", outcome)
+
+
+async def _start_searched_services(
+    search_runners: Mapping[str, Any], searches: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Start the lazy servers the searches need, dropping searches whose server failed.
+
+    Returns the remaining searches and a warning per failed service. Searches
+    for services without a runner are kept, so the pipeline reports them.
+    """
+    services: list[str] = []
+    warmers = []
+    for search in searches:
+        service = search.get("service")
+        warm = getattr(search_runners.get(service), "warm", None)  # eager runners are running
+        if warm is not None and service not in services:
+            services.append(service)
+            warmers.append(warm())
+    failed: set[str] = set()
+    warnings: list[str] = []
+    for service, outcome in zip(services, await asyncio.gather(*warmers, return_exceptions=True)):
+        if isinstance(outcome, Exception):
+            failed.add(service)
+            warning = f"{service} MCP サーバーを起動できませんでした: {outcome}"
+            warnings.append(warning)
+            logger.warning(warning)
+    return [search for search in searches if search.get("service") not in failed], warnings
+
+
+async def _settle_launches(launches: set[asyncio.Future[McpRunners]]) -> None:
+    # Shielded launches outlive the callers that started them; let them finish
+    # so any server they start is registered before the session terminates it
+    if launches:
+        await asyncio.gather(*launches, return_exceptions=True)
+
+
+def _lazy_mcp_session(
+    definitions: Mapping[str, Any],
+    resolved: Mapping[str, Any],
+    *,
+    readiness_timeout: float,
+    max_parallel_launches: int = DEFAULT_LAUNCH_PARALLELISM,
+) -> _LaunchedSession:
+    """Register runners for every configured service without spawning any.
+
+    Each server is started on the first call to one of its runners, so a
+    query that only touches one service never pays for the others. The
+    returned processes dict fills in as servers start, and the launches set
+    holds the launches still in progress.
+    """
+    processes: dict[str, asyncio.subprocess.Process] = {}
     search_runners: dict[str, Any] = {}
     fetch_runners: dict[str, Any] = {}
+    launch_slots = asyncio.Semaphore(max(1, max_parallel_launches))
+    launches: set[asyncio.Future[McpRunners]] = set()
+
+    for name in resolved:
+        if name not in definitions:
+            continue
+        service = _LazyService(
+            name,
+            definitions,
+            resolved,
+            processes,
+            readiness_timeout=readiness_timeout,
+            launch_slots=launch_slots,
+            launches=launches,
+        )
+        plan = _plan_registration(name)
+        for key in plan.search_keys:
+            search_runners[key] = _lazy_search_runner(service, key)
+        for key, _ in plan.fetch_keys:
+            fetch_runners[key] = _lazy_fetch_runner(service, key)
 
-    for raw_service, process in processes.items():
-        # Normalize service name (e.g., "drive" -> "gdrive")
-        service = SERVICE_NAME_MAP.get(raw_service, raw_service)
-        client = StdioMcpClient(process, service)
+    return processes, search_runners, fetch_runners, launches
 
-        # For GitHub, use combined runner that searches both code and issues
-        if service == "github":
-            runner = create_github_combined_search_runner(client)
-            search_runners[service] = runner
-            if raw_service != service:
-                search_runners[raw_service] = runner
+
+async def _launch_mcp_session(
+    definitions: Mapping[str, Any],
+    resolved: Mapping[str, Any],
+    *,
+    readiness_timeout: float,
+    eager: bool = False,
+    max_parallel_launches: int = DEFAULT_LAUNCH_PARALLELISM,
+) -> _LaunchedSession | None:
+    if not eager:
+        return _lazy_mcp_session(
+            definitions,
+            resolved,
+            readiness_timeout=readiness_timeout,
+            max_parallel_launches=max_parallel_launches,
+        )
+
+    statuses = await launch_services_async(
+        definitions,
+        resolved,
+        max_parallel_launches=max_parallel_launches,
+        # The initialize handshake below is the readiness check
+        wait_for_output=False,
+    )
+
+    processes = {
+        name: status.process
+        for name, status in statuses.items()
+        if status.process is not None
+    }
+    if not processes:
+        return None
+
+    search_runners, fetch_runners = await create_mcp_runners_from_processes(
+        processes, prewarm=True, handshake_timeout=readiness_timeout
+    )
+    return processes, search_runners, fetch_runners, set()
+
+
+@asynccontextmanager
+async def _single_use_session(
+    definitions: Mapping[str, Any],
+    resolved: Mapping[str, Any],
+    *,
+    readiness_timeout: float,
+    eager: bool = False,
+    max_parallel_launches: int = DEFAULT_LAUNCH_PARALLELISM,
+) -> AsyncIterator[McpRunners | None]:
+    launched = await _launch_mcp_session(
+        definitions,
+        resolved,
+        readiness_timeout=readiness_timeout,
+        eager=eager,
+        max_parallel_launches=max_parallel_launches,
+    )
+    if launched is None:
+        yield None
+        return
+
+    processes, search_runners, fetch_runners, launches = launched
+    try:
+        yield search_runners, fetch_runners
+    finally:
+        await _settle_launches(launches)
+        await _terminate_processes(processes)
+
+
+@dataclass
+class _PooledSession:
+    loop: asyncio.AbstractEventLoop
+    processes: dict[str, asyncio.subprocess.Process]
+    search_runners: dict[str, Any]
+    fetch_runners: dict[str, Any]
+    launches: set[asyncio.Future[McpRunners]]
+    last_used: float
+    in_use: int = 0
+
+    def usable_in(self, loop: asyncio.AbstractEventLoop) -> bool:
+        return (
+            self.loop is loop
+            and not loop.is_closed()
+            and all(process.returncode is None for process in self.processes.values())
+        )
+
+
+class McpSessionPool:
+    """Keep launched MCP servers and their runners alive between queries.
+
+    Sessions are keyed by the caller (typically a digest of the command specs) and reused
+    while their processes are alive and bound to the running event loop. Idle
+    sessions older than ``session_ttl`` are terminated on the next acquire.
+    """
+
+    def __init__(self, session_ttl: float = DEFAULT_SESSION_TTL):
+        self._session_ttl = session_ttl
+        self._sessions: dict[Hashable, _PooledSession] = {}
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        key: Hashable,
+        definitions: Mapping[str, Any],
+        resolved: Mapping[str, Any],
+        *,
+        readiness_timeout: float = 10.0,
+        eager: bool = False,
+        max_parallel_launches: int = DEFAULT_LAUNCH_PARALLELISM,
+    ) -> AsyncIterator[McpRunners | None]:
+        loop = asyncio.get_running_loop()
+        await self._evict(loop, expired_only=True)
+
+        session = self._sessions.get(key)
+        if session is not None and not session.usable_in(loop):
+            self._sessions.pop(key, None)
+            await self._discard(session, loop)
+            session = None
+
+        if session is None:
+            launched = await _launch_mcp_session(
+                definitions,
+                resolved,
+                readiness_timeout=readiness_timeout,
+                eager=eager,
+                max_parallel_launches=max_parallel_launches,
+            )
+            if launched is None:
+                yield None
+                return
+            processes, search_runners, fetch_runners, launches = launched
+            session = _PooledSession(
+                loop=loop,
+                processes=processes,
+                search_runners=search_runners,
+                fetch_runners=fetch_runners,
+                launches=launches,
+                last_used=time.monotonic(),
+            )
+            self._sessions[key] = session
         else:
-            search_tool = SEARCH_TOOLS.get(service) or SEARCH_TOOLS.get(raw_service)
-            if search_tool:
-                runner = create_search_runner(client, service, search_tool)
-                search_runners[service] = runner
-                # Also register under original name for compatibility
-                if raw_service != service:
-                    search_runners[raw_service] = runner
-
-        # Add fetch runners with both simple and qualified names
-        # Check if service has a fetch tool defined (can be None for resource-based fetch)
-        if service in FETCH_TOOLS or raw_service in FETCH_TOOLS:
-            fetch_tool = FETCH_TOOLS.get(service, FETCH_TOOLS.get(raw_service))
-            runner = create_fetch_runner(client, service, fetch_tool)
-            fetch_runners[service] = runner
-            if fetch_tool:
-                fetch_runners[f"{service}.{fetch_tool}"] = runner
-            else:
-                # For resource-based fetch (tool_name=None), register with special name
-                fetch_runners[f"{service}.__read_resource__"] = runner
-            
-            # For GitHub, also register get_file_contents for code search results
-            if service == "github":
-                file_contents_runner = create_fetch_runner(client, service, "get_file_contents")
-                fetch_runners["github.get_file_contents"] = file_contents_runner
-            
-            # Always register a __read_resource__ runner for services that support it
-            # This allows code search results to be fetched via resources/read
-            if fetch_tool is not None:
-                # Create a separate runner for read_resource
-                resource_runner = create_fetch_runner(client, service, None)
-                fetch_runners[f"{service}.__read_resource__"] = resource_runner
-                if raw_service != service:
-                    fetch_runners[f"{raw_service}.__read_resource__"] = resource_runner
-            
-            # Also register under original name for compatibility
-            if raw_service != service:
-                fetch_runners[raw_service] = runner
-                if fetch_tool:
-                    fetch_runners[f"{raw_service}.{fetch_tool}"] = runner
-                else:
-                    fetch_runners[f"{raw_service}.__read_resource__"] = runner
-
-    return search_runners, fetch_runners
+            logger.debug("reusing pooled MCP session for %s", key)
+
+        session.in_use += 1
+        try:
+            yield session.search_runners, session.fetch_runners
+        finally:
+            session.in_use -= 1
+            session.last_used = time.monotonic()
+
+    async def prewarm(
+        self,
+        key: Hashable,
+        definitions: Mapping[str, Any],
+        resolved: Mapping[str, Any],
+        services: Iterable[str],
+        *,
+        readiness_timeout: float = 10.0,
+        max_parallel_launches: int = DEFAULT_LAUNCH_PARALLELISM,
+    ) -> None:
+        """Start ``services`` in the session for ``key`` before its first query."""
+        async with self.acquire(
+            key,
+            definitions,
+            resolved,
+            readiness_timeout=readiness_timeout,
+            max_parallel_launches=max_parallel_launches,
+        ) as runners:
+            if runners is not None:
+                await _warm_services(runners, services)
+
+    async def aclose(self) -> None:
+        """Terminate every pooled session."""
+        await self._evict(asyncio.get_running_loop(), expired_only=False)
+
+    def close_all(self) -> None:
+        """Kill every pooled process without an event loop (atexit hook)."""
+        sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            _kill_processes(session.processes)
+
+    async def _evict(self, loop: asyncio.AbstractEventLoop, *, expired_only: bool) -> None:
+        deadline = time.monotonic() - self._session_ttl
+        for key, session in list(self._sessions.items()):
+            if session.in_use:
+                continue
+            if expired_only and session.last_used > deadline and session.usable_in(loop):
+                continue
+            self._sessions.pop(key, None)
+            await self._discard(session, loop)
+
+    @staticmethod
+    async def _discard(session: _PooledSession, loop: asyncio.AbstractEventLoop) -> None:
+        if session.loop is loop:
+            await _settle_launches(session.launches)
+            await _terminate_processes(session.processes)
+        else:
+            _kill_processes(session.processes)
+
+
+_MCP_POOL = McpSessionPool()
+atexit.register(_MCP_POOL.close_all)
+
+
+def get_session_pool() -> McpSessionPool:
+    """Return the process-wide MCP session pool."""
+    return _MCP_POOL
+
+
+def _load_session_config(
+    config_path: Any | None, force_mock: bool
+) -> tuple[dict[str, Any], dict[str, Any], int]:
+    definitions = load_server_definitions(config_path)
+    resolved = resolve_service_modes(
+        definitions,
+        force_mock=force_mock,
+        allow_real=not force_mock,
+    )
+    return definitions, resolved, load_launch_parallelism(config_path)
+
+
+async def prewarm_mcp_session(
+    *,
+    force_mock: bool,
+    pool: McpSessionPool,
+    config_path: Any | None = None,
+) -> None:
+    """Start the servers listed under ``prewarm`` in servers.yaml into ``pool``.
+
+    Later ``run_oneshot_with_mcp`` calls with the same configuration find
+    them already running; the other servers still start on first use.
+    """
+    services = load_prewarm_services(config_path)
+    if not services:
+        return
+    definitions, resolved, launch_parallelism = _load_session_config(config_path, force_mock)
+    await pool.prewarm(
+        session_config_key(definitions, resolved),
+        definitions,
+        resolved,
+        services,
+        max_parallel_launches=launch_parallelism,
+    )
 
 
 async def run_oneshot_with_mcp(
@@ -810,104 +1955,135 @@ async def run_oneshot_with_mcp(
     force_mock: bool,
     llm_client: Any | None = None,
     config_path: Any | None = None,
+    pool: McpSessionPool | None = None,
+    eager: bool = False,
 ) -> Any | None:
     """Run oneshot search using MCP servers.
 
     This function:
     1. Loads server definitions from config
     2. Resolves service modes (mock/real)
-    3. Launches MCP servers
+    3. Registers MCP runners; each server is launched on its first call
+       (or reused from ``pool``)
     4. Creates search/fetch runners
-    5. Generates search parameters using LLM (if available)
+    5. Generates search parameters using LLM (if available), overlapping
+       the server launch or pool acquisition
     6. Executes the search-fetch-summarize pipeline
-    7. Cleans up server processes
+    7. Cleans up server processes (unless pooled)
 
     Args:
         query: The search query
         force_mock: If True, force mock mode for all services
         llm_client: Optional LLM client for search parameter generation
         config_path: Optional path to servers.yaml
+        pool: Optional session pool; when given, servers stay alive for reuse
+            by later calls that would spawn the same server commands
+        eager: Launch every server up front instead of on first use
 
     Returns:
         SearchFetchSummaryResult if successful, None otherwise
     """
-    from app.llm_search import generate_search_parameters
-    from app.summary_pipeline import run_search_fetch_and_summarize_pipeline
+    from app.llm_search import generate_search_parameters_cached
+
+    # Load configuration and resolve service modes
+    definitions, resolved, launch_parallelism = _load_session_config(config_path, force_mock)
+
+    # Keyed by the spawned command lines and environment, so edits to the
+    # config or env between queries start fresh servers (and fetch fresh content)
+    session_key = session_config_key(definitions, resolved)
+
+    # Launch MCP servers (or reuse pooled ones)
+    if pool is not None:
+        session = pool.acquire(
+            session_key,
+            definitions,
+            resolved,
+            readiness_timeout=10.0,
+            eager=eager,
+            max_parallel_launches=launch_parallelism,
+        )
+    else:
+        session = _single_use_session(
+            definitions,
+            resolved,
+            readiness_timeout=10.0,
+            eager=eager,
+            max_parallel_launches=launch_parallelism,
+        )
 
-    # Load configuration
-    definitions = load_server_definitions(config_path)
+    # Ask the LLM for search parameters while servers start (eager mode) or
+    # the pooled session is acquired; it does not depend on the runners
+    generation_task: asyncio.Task[Any] | None = None
+    if llm_client is not None:
+        generation_task = asyncio.create_task(
+            asyncio.to_thread(
+                generate_search_parameters_cached, query, llm_client, services=sorted(resolved)
+            )
+        )
 
-    # Resolve service modes
-    resolved = resolve_service_modes(
-        definitions,
-        force_mock=force_mock,
-        allow_real=not force_mock,
-    )
+    try:
+        async with session as runners:
+            return await _run_oneshot_pipeline(
+                query,
+                runners,
+                generation_task,
+                llm_client,
+                fetch_cache_scope=fetch_cache_scope(resolved, session_key),
+            )
+    finally:
+        if generation_task is not None and not generation_task.done():
+            generation_task.cancel()
 
-    # Launch MCP servers
-    statuses = await launch_services_async(
-        definitions,
-        resolved,
-        readiness_timeout=10.0,
-    )
 
-    # Get running processes
-    processes = {
-        name: status.process
-        for name, status in statuses.items()
-        if status.process is not None
-    }
+async def _run_oneshot_pipeline(
+    query: str,
+    runners: McpRunners | None,
+    generation_task: asyncio.Task[Any] | None,
+    llm_client: Any | None,
+    *,
+    fetch_cache_scope: str | None = None,
+) -> Any | None:
+    from app.summary_pipeline import run_search_fetch_and_summarize_pipeline
 
-    if not processes:
+    if runners is None:
         logger.warning("No MCP servers could be started")
         return None
 
-    try:
-        # Create runners from processes
-        search_runners, fetch_runners = await create_mcp_runners_from_processes(
-            processes
-        )
+    search_runners, fetch_runners = runners
 
-        if not search_runners:
-            logger.warning("No search runners available")
-            return None
-
-        # Generate search parameters
-        alternatives: list[str] = []
-        if llm_client is not None:
-            generation = generate_search_parameters(query, llm_client)
-            searches = generation.searches
-            alternatives = generation.alternatives
-        else:
-            # Fallback: create simple search for each available service
-            searches = [
-                {"service": name, "query": query, "max_results": 3}
-                for name in search_runners.keys()
-            ]
-
-        if not searches:
-            logger.warning("No search parameters generated")
-            return None
-
-        # Run the full pipeline
-        result = await run_search_fetch_and_summarize_pipeline(
-            query,
-            searches,
-            search_runners=search_runners,
-            fetch_runners=fetch_runners,
-            llm_client=llm_client,
-            alternatives=alternatives,
-        )
+    if not search_runners:
+        logger.warning("No search runners available")
+        return None
 
-        return result
+    # Generate search parameters
+    alternatives: list[str] = []
+    if generation_task is not None:
+        generation = await generation_task
+        searches = generation.searches
+        alternatives = generation.alternatives
+    else:
+        # Fallback: create simple search for each available service
+        searches = _default_searches(search_runners, query)
+
+    if not searches:
+        logger.warning("No search parameters generated")
+        return None
 
-    finally:
-        # Cleanup: terminate all processes
-        for process in processes.values():
-            if process and process.returncode is None:
-                process.terminate()
-                try:
-                    await asyncio.wait_for(process.wait(), timeout=2.0)
-                except asyncio.TimeoutError:
-                    process.kill()
+    # Lazy sessions start the searched servers here. If none of them comes up,
+    # the query fails as a whole, as it does when an eager launch starts nothing
+    searches, launch_warnings = await _start_searched_services(search_runners, searches)
+    if not searches:
+        logger.warning("No MCP servers could be started")
+        return None
 
+    # Run the full pipeline
+    return await run_search_fetch_and_summarize_pipeline(
+        query,
+        searches,
+        search_runners=search_runners,
+        fetch_runners=fetch_runners,
+        llm_client=llm_client,
+        alternatives=alternatives,
+        initial_warnings=launch_warnings,
+        fetch_cache_scope=fetch_cache_scope,
+    )
@@ -1,22 +1,54 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
 import re
 import shutil
 import subprocess
+import threading
+import weakref
 from asyncio.subprocess import Process as AsyncProcess
+from collections import ChainMap, deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Mapping
-
-from app.config import RunMode, ServerDefinition, ResolvedService
+from types import MappingProxyType
+from typing import AsyncIterator, Mapping
+
+from app.config import (
+    DEFAULT_LAUNCH_PARALLELISM,
+    ResolvedService,
+    RunMode,
+    ServerDefinition,
+    render_template,
+)
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
-_PLACEHOLDER_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+DEFAULT_STDIO_BUFFER_BYTES = 64 * 1024 * 1024
+
+
+def _stdio_buffer_limit() -> int:
+    """StreamReader limit for MCP server stdout/stderr.
+
+    Environment variable: MCP_STDIO_BUFFER_BYTES
+    Default: 64 MiB. asyncio's 64 KiB default makes readline() raise
+    LimitOverrunError on large JSON-RPC lines and pauses the pipe early.
+    """
+    env_value = os.getenv("MCP_STDIO_BUFFER_BYTES")
+    if env_value:
+        try:
+            limit = int(env_value)
+        except ValueError:
+            logger.warning("MCP_STDIO_BUFFER_BYTES の値が不正です: %s", env_value)
+        else:
+            if limit > 0:
+                return limit
+    return DEFAULT_STDIO_BUFFER_BYTES
 
 
 class StartConfigurationError(RuntimeError):
@@ -60,24 +92,38 @@ class RuntimeStatus:
 
 
 def _render_template(value: str, env: Mapping[str, str], *, allow_missing: bool = False) -> str:
-    def _replace(match: re.Match[str]) -> str:
-        key = match.group(1)
-        if key not in env:
-            if allow_missing:
-                return ""
-            raise StartConfigurationError(f"環境変数不足: {key}")
-        return env[key]
+    try:
+        return render_template(value, env, allow_missing=allow_missing)
+    except KeyError as exc:
+        raise StartConfigurationError(f"環境変数不足: {exc.args[0]}") from None
 
-    return _PLACEHOLDER_PATTERN.sub(_replace, value)
+
+_UNBUFFERED_ENV: Mapping[str, str] = MappingProxyType({"PYTHONUNBUFFERED": "1"})
 
 
 def _merge_env(command_env: Mapping[str, str], base_env: Mapping[str, str], *, allow_missing: bool) -> dict[str, str]:
-    merged = dict(base_env)
+    # PYTHONUNBUFFERED=1 unless the base environment sets it
+    lookup = ChainMap(base_env, _UNBUFFERED_ENV)
+    merged = {**_UNBUFFERED_ENV, **base_env}
     for key, template in command_env.items():
-        merged[key] = _render_template(template, base_env, allow_missing=allow_missing)
+        merged[key] = _render_template(template, lookup, allow_missing=allow_missing)
     return merged
 
 
+# Successful executable lookups, shared by services that run the same binary.
+# Failures are not cached so a binary installed later is picked up.
+_WHICH_CACHE: dict[tuple[str, str], str] = {}
+_ACCESS_CACHE: set[str] = set()
+_EXECUTABLE_CACHE_LOCK = threading.Lock()
+
+
+def clear_executable_cache() -> None:
+    """Forget cached executable lookups (e.g. after PATH contents change)."""
+    with _EXECUTABLE_CACHE_LOCK:
+        _WHICH_CACHE.clear()
+        _ACCESS_CACHE.clear()
+
+
 def _resolve_executable(raw_exec: str, workdir: Path, env: Mapping[str, str]) -> str:
     expanded = os.path.expanduser(raw_exec)
     has_sep = os.sep in expanded or (os.altsep and os.altsep in expanded)
@@ -87,15 +133,27 @@ def _resolve_executable(raw_exec: str, workdir: Path, env: Mapping[str, str]) ->
         if not candidate.is_absolute():
             candidate = (workdir / candidate).resolve()
 
+        path = str(candidate)
+        with _EXECUTABLE_CACHE_LOCK:
+            if path in _ACCESS_CACHE:
+                return path
         if not candidate.exists():
             raise StartConfigurationError(f"実行パス不備: {candidate} が存在しません")
         if not os.access(candidate, os.X_OK):
             raise StartConfigurationError(f"実行パス不備: {candidate} に実行権限がありません")
-        return str(candidate)
-
-    resolved = shutil.which(expanded, path=env.get("PATH"))
-    if not resolved:
-        raise StartConfigurationError(f"実行パス不備: {expanded} が PATH 上に見つかりません")
+        with _EXECUTABLE_CACHE_LOCK:
+            _ACCESS_CACHE.add(path)
+        return path
+
+    key = (expanded, env.get("PATH", ""))
+    with _EXECUTABLE_CACHE_LOCK:
+        resolved = _WHICH_CACHE.get(key)
+    if resolved is None:
+        resolved = shutil.which(expanded, path=env.get("PATH"))
+        if not resolved:
+            raise StartConfigurationError(f"実行パス不備: {expanded} が PATH 上に見つかりません")
+        with _EXECUTABLE_CACHE_LOCK:
+            _WHICH_CACHE[key] = resolved
     return resolved
 
 
@@ -103,6 +161,7 @@ def _build_command_spec(
     definition: ServerDefinition,
     selected_mode: RunMode,
     base_env: Mapping[str, str],
+    env_cache: dict[tuple[bool, tuple[tuple[str, str], ...]], dict[str, str]] | None = None,
 ) -> CommandSpec:
     command = definition.real if selected_mode is RunMode.REAL else definition.mock
 
@@ -110,14 +169,21 @@ def _build_command_spec(
     env_templates.update(definition.env)
     env_templates.update(command.env)
 
-    env = _merge_env(env_templates, base_env, allow_missing=selected_mode is RunMode.MOCK)
+    allow_missing = selected_mode is RunMode.MOCK
+    # Services with the same env templates share one merged (read-only) env
+    cache_key = (allow_missing, tuple(env_templates.items()))
+    env = env_cache.get(cache_key) if env_cache is not None else None
+    if env is None:
+        env = _merge_env(env_templates, base_env, allow_missing=allow_missing)
+        if env_cache is not None:
+            env_cache[cache_key] = env
 
-    workdir = Path(_render_template(command.workdir, env, allow_missing=selected_mode is RunMode.MOCK)).expanduser()
+    workdir = Path(_render_template(command.workdir, env, allow_missing=allow_missing)).expanduser()
     if not workdir.exists():
         raise StartConfigurationError(f"作業ディレクトリ不備: {workdir} が存在しません")
 
-    exec_value = _render_template(command.exec, env, allow_missing=selected_mode is RunMode.MOCK)
-    args = [_render_template(arg, env, allow_missing=selected_mode is RunMode.MOCK) for arg in command.args]
+    exec_value = _render_template(command.exec, env, allow_missing=allow_missing)
+    args = [_render_template(arg, env, allow_missing=allow_missing) for arg in command.args]
 
     executable = _resolve_executable(exec_value, workdir, env)
     argv = [executable, *args]
@@ -125,10 +191,73 @@ def _build_command_spec(
     return CommandSpec(argv=argv, env=env, workdir=workdir)
 
 
-def _build_default_env(base_env: Mapping[str, str] | None) -> dict[str, str]:
-    default_env = dict(os.environ if base_env is None else base_env)
-    default_env.setdefault("PYTHONUNBUFFERED", "1")
-    return default_env
+def compute_config_hash(spec: CommandSpec) -> str:
+    """Stable digest of everything that determines how a server is spawned."""
+    payload = json.dumps(
+        {"argv": spec.argv, "env": sorted(spec.env.items()), "cwd": str(spec.workdir)},
+        sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def plan_launches(
+    definitions: Mapping[str, ServerDefinition],
+    resolved: Mapping[str, ResolvedService],
+    *,
+    base_env: Mapping[str, str] | None = None,
+) -> dict[str, CommandSpec | StartConfigurationError]:
+    """Build the command spec of every resolved service in one pass.
+
+    Services with identical env templates share a single merged environment
+    and executables resolve through the lookup cache, so servers running the
+    same interpreter cost one merge and one PATH walk. Services whose spec
+    cannot be built map to the error instead.
+    """
+    default_env = _build_default_env(base_env)
+    env_cache: dict[tuple[bool, tuple[tuple[str, str], ...]], dict[str, str]] = {}
+    plans: dict[str, CommandSpec | StartConfigurationError] = {}
+    for name, decision in resolved.items():
+        definition = definitions.get(name)
+        if not definition:
+            plans[name] = StartConfigurationError("definition missing")
+            continue
+        try:
+            plans[name] = _build_command_spec(definition, decision.selected_mode, default_env, env_cache)
+        except StartConfigurationError as exc:
+            plans[name] = exc
+    return plans
+
+
+def session_config_key(
+    definitions: Mapping[str, ServerDefinition],
+    resolved: Mapping[str, ResolvedService],
+    *,
+    base_env: Mapping[str, str] | None = None,
+) -> str:
+    """Digest of the command specs for a set of services.
+
+    Two launches with the same key would spawn identical processes, so their
+    servers can be shared. Services whose spec cannot be built contribute their
+    error, so fixing the configuration yields a new key.
+    """
+    plans = plan_launches(definitions, resolved, base_env=base_env)
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(plans):
+        plan = plans[name]
+        if isinstance(plan, CommandSpec):
+            part = compute_config_hash(plan)
+        elif name not in definitions:
+            part = "definition missing"
+        else:
+            part = f"error:{plan}"
+        digest.update(f"{name}\0{part}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _build_default_env(base_env: Mapping[str, str] | None) -> Mapping[str, str]:
+    # Read in place, not copied: _merge_env makes the one copy each service
+    # needs, and os.environ is read live so .env values loaded later are seen
+    return os.environ if base_env is None else base_env
 
 
 def start_services(
@@ -138,7 +267,7 @@ def start_services(
     base_env: Mapping[str, str] | None = None,
 ) -> dict[str, StartResult]:
     """Start services based on resolved modes and return their processes or errors."""
-    default_env = dict(os.environ if base_env is None else base_env)
+    default_env = _build_default_env(base_env)
     results: dict[str, StartResult] = {}
 
     for name, decision in resolved.items():
@@ -179,6 +308,57 @@ def start_services(
     return results
 
 
+STDERR_TAIL_LINES = 256
+
+
+class _StderrTail:
+    """Drain a server's stderr in the background, keeping the last lines.
+
+    Unread stderr piles up in the StreamReader buffer (up to the stdio limit)
+    for the life of the server; the kept lines are what crash diagnostics and
+    the restart policy inspect, available as soon as the process exits.
+    """
+
+    def __init__(self, stream: asyncio.StreamReader, maxlen: int = STDERR_TAIL_LINES):
+        self.lines: deque[str] = deque(maxlen=maxlen)
+        self._first_line: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        self.task = asyncio.create_task(self._drain(stream))
+
+    async def _drain(self, stream: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                try:
+                    data = await stream.readline()
+                except ValueError:
+                    continue  # over-long line; the reader already skipped it
+                if not data:
+                    break
+                line = data.decode("utf-8", errors="ignore")
+                self.lines.append(line)
+                if not self._first_line.done():
+                    self._first_line.set_result(line)
+        except Exception:  # noqa: BLE001
+            pass
+        finally:
+            if not self._first_line.done():
+                self._first_line.set_result(None)
+
+    async def first_line(self) -> str | None:
+        """The first stderr line, or None if the stream closed without one."""
+        return await asyncio.shield(self._first_line)
+
+    async def text(self, timeout: float = 0.5) -> str:
+        """Lines kept so far, after giving the drain a moment to reach EOF."""
+        try:
+            await asyncio.wait_for(asyncio.shield(self.task), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return "".join(self.lines)
+
+
+_STDERR_TAILS: weakref.WeakKeyDictionary[AsyncProcess, _StderrTail] = weakref.WeakKeyDictionary()
+
+
 async def _wait_for_readiness(name: str, process: AsyncProcess, timeout: float) -> tuple[bool, str | None]:
     """Ready when either stdout or stderr emits the first line within timeout."""
 
@@ -193,7 +373,9 @@ async def _wait_for_readiness(name: str, process: AsyncProcess, timeout: float)
             return None
         return data.decode("utf-8", errors="ignore") if isinstance(data, (bytes, bytearray)) else str(data)
 
-    tasks = {asyncio.create_task(_read_line(process.stdout)), asyncio.create_task(_read_line(process.stderr))}
+    tail = _STDERR_TAILS.get(process)
+    stderr_task = asyncio.create_task(tail.first_line() if tail else _read_line(process.stderr))
+    tasks = {asyncio.create_task(_read_line(process.stdout)), stderr_task}
     done, pending = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
 
     for task in pending:
@@ -204,7 +386,8 @@ async def _wait_for_readiness(name: str, process: AsyncProcess, timeout: float)
         logger.warning("%s: %s", name, warning)
         return False, warning
 
-    line = next(iter(done)).result()
+    finished = next(iter(done))
+    line = finished.result()
     if not line:
         returncode = process.returncode
         warning = f"起動失敗: exit code {returncode}" if returncode is not None else "起動失敗"
@@ -222,7 +405,8 @@ async def _wait_for_readiness(name: str, process: AsyncProcess, timeout: float)
         # can surface the reason without needing stderr again. Include any remaining
         # stderr to improve diagnostics.
         remainder = await _read_stderr(process)
-        combined = f"{line}{remainder}"
+        # A first line taken from the stderr tail is still part of the tail
+        combined = remainder if tail is not None and finished is stderr_task else f"{line}{remainder}"
         fatal = _is_permanent_failure(combined)
         warning = combined.strip() if fatal else f"起動失敗: exit code {returncode}"
         logger.warning("%s: %s", name, warning)
@@ -242,6 +426,8 @@ async def _start_service_async(
     definition: ServerDefinition | None,
     default_env: Mapping[str, str],
     readiness_timeout: float,
+    wait_for_output: bool = True,
+    spec: CommandSpec | None = None,
 ) -> RuntimeStatus:
     if not definition:
         warning = "definition missing"
@@ -256,7 +442,8 @@ async def _start_service_async(
         )
 
     try:
-        spec = _build_command_spec(definition, decision.selected_mode, default_env)
+        if spec is None:
+            spec = _build_command_spec(definition, decision.selected_mode, default_env)
     except StartConfigurationError as exc:
         logger.error("%s: %s", name, exc)
         return RuntimeStatus(
@@ -277,6 +464,7 @@ async def _start_service_async(
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            limit=_stdio_buffer_limit(),
         )
     except Exception as exc:  # noqa: BLE001
         warning = f"起動失敗: {exc}"
@@ -291,6 +479,19 @@ async def _start_service_async(
             error=str(exc),
         )
 
+    if process.stderr is not None:
+        _STDERR_TAILS[process] = _StderrTail(process.stderr)
+
+    if not wait_for_output:
+        # The caller confirms readiness itself (MCP initialize handshake)
+        return RuntimeStatus(
+            name=name,
+            mode=decision.selected_mode,
+            command=spec.argv,
+            process=process,
+            ready=False,
+        )
+
     ready, warning = await _wait_for_readiness(name, process, readiness_timeout)
 
     if not ready and process.returncode is not None:
@@ -314,29 +515,98 @@ async def launch_services_async(
     *,
     base_env: Mapping[str, str] | None = None,
     readiness_timeout: float = 1.0,
+    max_parallel_launches: int = DEFAULT_LAUNCH_PARALLELISM,
+    wait_for_output: bool = True,
 ) -> dict[str, RuntimeStatus]:
     """Start services concurrently and wait for initial readiness signals.
 
     A service is considered ready when the first stdout line arrives. When a
     timeout or early exit occurs, a warning is recorded but other services
-    continue to launch.
-    """
-    default_env = _build_default_env(base_env)
+    continue to launch. At most ``max_parallel_launches`` services are
+    spawning or waiting for readiness at any time.
 
-    tasks = {
-        name: asyncio.create_task(
-            _start_service_async(name, decision, definitions.get(name), default_env, readiness_timeout)
+    With ``wait_for_output=False`` processes are returned as soon as they are
+    spawned (``ready`` stays False); MCP callers then treat the initialize
+    handshake as the readiness check, which works for servers that never
+    print a banner.
+    """
+    statuses = {
+        status.name: status
+        async for status in iter_launches(
+            definitions,
+            resolved,
+            base_env=base_env,
+            readiness_timeout=readiness_timeout,
+            max_parallel_launches=max_parallel_launches,
+            wait_for_output=wait_for_output,
         )
-        for name, decision in resolved.items()
     }
-    results: dict[str, RuntimeStatus] = {}
-    for name, task in tasks.items():
-        results[name] = await task
+    return {name: statuses[name] for name in resolved}
 
-    return results
+
+async def iter_launches(
+    definitions: Mapping[str, ServerDefinition],
+    resolved: Mapping[str, ResolvedService],
+    *,
+    base_env: Mapping[str, str] | None = None,
+    readiness_timeout: float = 1.0,
+    max_parallel_launches: int = DEFAULT_LAUNCH_PARALLELISM,
+    wait_for_output: bool = True,
+) -> AsyncIterator[RuntimeStatus]:
+    """Start services like ``launch_services_async``, yielding each status as it settles.
+
+    Fast servers are reported without waiting for slow ones, so callers can
+    start using them early. Iterate to the end: every launch runs to
+    completion and the caller owns the processes it yields.
+    """
+    default_env = _build_default_env(base_env)
+    launch_slots = asyncio.Semaphore(max(1, max_parallel_launches))
+    plans = plan_launches(definitions, resolved, base_env=default_env)
+
+    async def launch(name: str, decision: ResolvedService) -> RuntimeStatus:
+        plan = plans.get(name)
+        try:
+            # The readiness wait stays inside the slot, so only N interpreters load at once
+            async with launch_slots:
+                return await _start_service_async(
+                    name,
+                    decision,
+                    definitions.get(name),
+                    default_env,
+                    readiness_timeout,
+                    wait_for_output,
+                    spec=plan if isinstance(plan, CommandSpec) else None,
+                )
+        except Exception as exc:  # noqa: BLE001
+            # One failing launch must not hide the outcome of the others
+            warning = f"起動失敗: {exc}"
+            logger.warning("%s: %s", name, warning)
+            return RuntimeStatus(
+                name=name,
+                mode=decision.selected_mode,
+                command=None,
+                process=None,
+                ready=False,
+                warning=warning,
+                error=str(exc),
+            )
+
+    if len(resolved) == 1:
+        # Nothing to overlap with, so skip the Task wrapping and scheduling round trip
+        ((name, decision),) = resolved.items()
+        yield await launch(name, decision)
+        return
+
+    tasks = [asyncio.create_task(launch(name, decision)) for name, decision in resolved.items()]
+    for next_done in asyncio.as_completed(tasks):
+        yield await next_done
 
 
 async def _read_stderr(process: AsyncProcess) -> str:
+    tail = _STDERR_TAILS.get(process)
+    if tail is not None:
+        return await tail.text()
+
     if process.stderr is None:
         return ""
 
@@ -360,9 +630,12 @@ _FATAL_KEYWORDS = (
 )
 
 
+# One case-insensitive pass over the stderr text instead of one per keyword
+_FATAL_RE = re.compile("|".join(map(re.escape, _FATAL_KEYWORDS)), re.IGNORECASE)
+
+
 def _is_permanent_failure(stderr_text: str) -> bool:
-    lowered = stderr_text.lower()
-    return any(keyword in lowered for keyword in _FATAL_KEYWORDS)
+    return _FATAL_RE.search(stderr_text) is not None
 
 
 async def monitor_services(
@@ -444,11 +717,17 @@ async def monitor_services(
             if status.process is None:
                 return
 
-    tasks = [asyncio.create_task(_monitor_single(name, status)) for name, status in statuses.items() if status.process]
+    monitored = [(name, status) for name, status in statuses.items() if status.process]
 
-    if not tasks:
+    if not monitored:
         return statuses
 
+    if len(monitored) == 1 and stop_after is None:
+        await _monitor_single(*monitored[0])
+        return statuses
+
+    tasks = [asyncio.create_task(_monitor_single(name, status)) for name, status in monitored]
+
     async def _wait_all() -> None:
         await asyncio.gather(*tasks)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from collections.abc import Sequence
 
@@ -24,3 +25,16 @@ class ProgressDisplay:
                 self.console.print(f"[cyan]{label}[/]")
                 if delay > 0:
                     time.sleep(delay)
+
+    async def run_async(self, steps: Sequence[str], *, delay: float = 0.0, spinner: str = "dots") -> None:
+        """Like ``run``, but yields to the event loop between steps instead of sleeping."""
+        steps = tuple(steps)
+        if not steps:
+            return
+
+        with self.console.status(steps[0], spinner=spinner) as status:
+            for label in steps:
+                status.update(label)
+                self.console.print(f"[cyan]{label}[/]")
+                if delay > 0:
+                    await asyncio.sleep(delay)
@@ -3,7 +3,11 @@ from __future__ import annotations
 import asyncio
 import errno
 import logging
+import re
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from typing import Awaitable, Callable, Generic, TypeVar
 
 T = TypeVar("T")
@@ -20,8 +24,11 @@ _TEMP_ERRNOS = {
     errno.ECONNABORTED,
 }
 
+_TRANSIENT_TYPES = (asyncio.TimeoutError, TimeoutError, ConnectionError)
+_RATE_RE = re.compile("rate", re.IGNORECASE)
 
-@dataclass
+
+@dataclass(slots=True)
 class RunOutcome(Generic[T]):
     success: bool
     result: T | None
@@ -29,35 +36,54 @@ class RunOutcome(Generic[T]):
     skipped_reason: str | None = None
 
 
+_STATUS_PATHS = ("status", "status_code", "code", "response.status", "response.status_code")
+# Exception type -> getter for the attribute path that held its status last time
+_STATUS_ATTR_CACHE: dict[type, attrgetter] = {}
+
+
 def _status_code_from(exc: Exception) -> int | None:
-    for attr in ("status", "status_code", "code"):
-        value = getattr(exc, attr, None)
+    getter = _STATUS_ATTR_CACHE.get(type(exc))
+    if getter is not None:
+        try:
+            value = getter(exc)
+        except AttributeError:
+            value = None
         if isinstance(value, int):
             return value
 
-    response = getattr(exc, "response", None)
-    if response is not None:
-        for attr in ("status", "status_code"):
-            value = getattr(response, attr, None)
-            if isinstance(value, int):
-                return value
+    # First sight of this type, or this instance lacks the usual attribute:
+    # probe every path and remember the one that worked
+    for path in _STATUS_PATHS:
+        path_getter = attrgetter(path)
+        try:
+            value = path_getter(exc)
+        except AttributeError:
+            continue
+        if isinstance(value, int):
+            _STATUS_ATTR_CACHE[type(exc)] = path_getter
+            return value
 
     return None
 
 
-def _is_rate_limited(exc: Exception) -> bool:
-    status = _status_code_from(exc)
-    if status == 429:
-        return True
+def _is_rate_limited(exc: Exception, status: int | None) -> bool:
+    if status is not None:
+        return status == 429
+    # Only render the message when the error carries no status code, and scan
+    # for "rate" case-insensitively instead of allocating a lowered copy
     message = str(exc)
-    return "429" in message and "rate" in message.lower()
+    return "429" in message and _RATE_RE.search(message) is not None
 
 
-def _is_transient(exc: Exception) -> bool:
-    if isinstance(exc, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+@lru_cache(maxsize=128)
+def _is_transient_type(exc_type: type[BaseException]) -> bool:
+    return issubclass(exc_type, _TRANSIENT_TYPES)
+
+
+def _is_transient(exc: Exception, status: int | None) -> bool:
+    if _is_transient_type(type(exc)):
         return True
 
-    status = _status_code_from(exc)
     if status is not None and 500 <= status < 600:
         return True
 
@@ -67,6 +93,19 @@ def _is_transient(exc: Exception) -> bool:
     return False
 
 
+if sys.version_info >= (3, 11):
+
+    async def _call_with_timeout(func: Callable[[], Awaitable[T]], timeout: float) -> T:
+        # Times out the current task in place instead of wrapping the call in another Task
+        async with asyncio.timeout(timeout):
+            return await func()
+
+else:  # pragma: no cover - Python 3.10
+
+    async def _call_with_timeout(func: Callable[[], Awaitable[T]], timeout: float) -> T:
+        return await asyncio.wait_for(func(), timeout=timeout)
+
+
 async def run_with_retry(
     func: Callable[[], Awaitable[T]],
     *,
@@ -85,32 +124,34 @@ async def run_with_retry(
     """
 
     log = logger or logging.getLogger(__name__)
+    prefix = f"{service} {stage}"
 
     for attempt in range(1, MAX_ATTEMPTS + 1):
         try:
-            result = await asyncio.wait_for(func(), timeout=timeout)
+            result = await _call_with_timeout(func, timeout)
             if attempt > 1:
-                msg = f"{service} {stage} succeeded after retry #{attempt - 1}"
+                msg = f"{prefix} succeeded after retry #{attempt - 1}"
                 warnings.append(msg)
                 log.warning(msg)
             return RunOutcome(success=True, result=result, attempts=attempt)
         except Exception as exc:  # noqa: BLE001
-            if _is_rate_limited(exc):
-                msg = f"{service} {stage} skipped due to rate limit (429): {exc}"
+            status = _status_code_from(exc)
+            if _is_rate_limited(exc, status):
+                msg = f"{prefix} skipped due to rate limit (429): {exc}"
                 warnings.append(msg)
                 log.warning(msg)
                 return RunOutcome(success=False, result=None, attempts=attempt, skipped_reason="rate_limit")
 
-            is_transient = _is_transient(exc)
+            is_transient = _is_transient(exc, status)
             has_retry = attempt < MAX_ATTEMPTS and is_transient
             if not has_retry:
-                msg = f"{service} {stage} failed after {attempt} attempt(s): {exc}"
+                msg = f"{prefix} failed after {attempt} attempt(s): {exc}"
                 warnings.append(msg)
                 log.warning(msg)
                 return RunOutcome(success=False, result=None, attempts=attempt, skipped_reason="error")
 
             delay = BACKOFF_START * (2 ** (attempt - 1))
-            msg = f"{service} {stage} transient error on attempt {attempt}: {exc}; retrying in {delay:.1f}s"
+            msg = f"{prefix} transient error on attempt {attempt}: {exc}; retrying in {delay:.1f}s"
             warnings.append(msg)
             log.warning(msg)
             await asyncio.sleep(delay)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 
 _SCHEMA_DIR = Path(__file__).resolve().parents[1] / "schemas"
@@ -35,42 +35,41 @@ def _load_schema(service: str) -> dict[str, Any]:
         raise ValueError(f"Schema file is invalid JSON: {path}") from exc
 
 
+# Loaded at import so a missing or malformed schema fails at startup rather
+# than on the first user query, and validation never touches the filesystem.
+_SCHEMAS: dict[str, dict[str, Any]] = {service: _load_schema(service) for service in _SCHEMA_FILES}
+
+
 def _require(condition: bool, message: str) -> None:
     if not condition:
         raise ValueError(message)
 
 
-def _validate_common(payload: Mapping[str, Any], *, service: str) -> None:
-    _require(isinstance(payload, Mapping), "payload must be a mapping")
-
-    actual_service = payload.get("service")
-    _require(actual_service == service, f"service must be '{service}'")
-
-    query = payload.get("query")
-    _require(isinstance(query, str) and query.strip(), "query is required")
-
-    if "max_results" in payload:
-        max_results = payload["max_results"]
-        _require(isinstance(max_results, int), "max_results must be int")
-        _require(1 <= max_results <= 3, "max_results must be between 1 and 3")
-
-
-def _validate_slack(payload: Mapping[str, Any]) -> None:
-    _validate_common(payload, service="slack")
+def _make_validator(service: str) -> Callable[[Mapping[str, Any]], None]:
+    """Build the payload checks for one service.
 
+    The caller has already checked that the payload is a mapping for this
+    service, so only the per-field checks remain.
+    """
 
-def _validate_github(payload: Mapping[str, Any]) -> None:
-    _validate_common(payload, service="github")
+    def validate(payload: Mapping[str, Any]) -> None:
+        query = payload.get("query")
+        if not isinstance(query, str) or not query.strip():
+            raise ValueError("query is required")
 
+        if "max_results" in payload:
+            max_results = payload["max_results"]
+            if not isinstance(max_results, int):
+                raise ValueError("max_results must be int")
+            if not 1 <= max_results <= 3:
+                raise ValueError("max_results must be between 1 and 3")
 
-def _validate_gdrive(payload: Mapping[str, Any]) -> None:
-    _validate_common(payload, service="gdrive")
+    validate.__name__ = f"_validate_{service}"
+    return validate
 
 
-_VALIDATORS: dict[str, Any] = {
-    "slack": _validate_slack,
-    "github": _validate_github,
-    "gdrive": _validate_gdrive,
+_VALIDATORS: dict[str, Callable[[Mapping[str, Any]], None]] = {
+    service: _make_validator(service) for service in _SCHEMAS
 }
 
 
@@ -81,17 +80,15 @@ def validate_search_payload(payload: Mapping[str, Any]) -> None:
     that mirror the JSON Schemas located under `schemas/`.
     """
 
-    _require(isinstance(payload, Mapping), "payload must be a mapping")
+    # Decoded JSON is a plain dict, which skips the slow ABC isinstance check
+    _require(type(payload) is dict or isinstance(payload, Mapping), "payload must be a mapping")
 
     service = payload.get("service")
     if not isinstance(service, str):
         raise ValueError("service is required")
 
-    # Ensure the schema file exists and is valid JSON (for contract visibility).
-    _load_schema(service)
-
     validator = _VALIDATORS.get(service)
-    if not validator:
+    if validator is None:
         raise ValueError(f"Unsupported service: {service}")
 
     validator(payload)
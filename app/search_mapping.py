@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
-from typing import Any, Iterable, Mapping
+from typing import Any, Callable, Collection, Iterable, Mapping
 
 MAX_RESULTS_PER_SERVICE = 3
 
+# Pattern: /archives/C12345/p1234567890123456
+_SLACK_PERMALINK_RE = re.compile(r"/archives/([A-Z0-9]+)/p(\d+)", re.IGNORECASE)
 
-@dataclass
+
+@dataclass(slots=True)
 class SearchResult:
     service: str
     kind: str
@@ -24,21 +28,115 @@ def _parse_slack_permalink(permalink: str) -> tuple[str, str]:
     Slack permalink format: https://slack.example.com/archives/{channel_id}/p{timestamp}
     Returns: (channel_id, thread_ts)
     """
-    # Pattern: /archives/C12345/p1234567890123456
-    match = re.search(r"/archives/([A-Z0-9]+)/p(\d+)", permalink, re.IGNORECASE)
+    # Fast path for the plain form: two finds and slices instead of a regex scan
+    start = permalink.find("/archives/") + len("/archives/")
+    if start >= len("/archives/"):
+        end = permalink.find("/", start)
+        channel_id = permalink[start:end]
+        ts_raw = permalink[end + 2 :]
+        if (
+            end > start
+            and permalink[end + 1 : end + 2] in ("p", "P")
+            and channel_id.isascii()
+            and channel_id.isalnum()
+            and ts_raw.isascii()
+            and ts_raw.isdecimal()
+        ):
+            return channel_id, _thread_ts_from(ts_raw)
+
+    # Anything else (query strings, trailing paths, ...) goes through the regex
+    match = _SLACK_PERMALINK_RE.search(permalink)
     if match:
-        channel_id = match.group(1)
-        # Convert p123456789012 to 123456789.012 format
-        ts_raw = match.group(2)
-        if len(ts_raw) > 6:
-            thread_ts = f"{ts_raw[:-6]}.{ts_raw[-6:]}"
-        else:
-            thread_ts = ts_raw
-        return channel_id, thread_ts
+        return match.group(1), _thread_ts_from(match.group(2))
     return "", ""
 
 
-def _build_fetch_info(item: Mapping[str, Any]) -> tuple[str, dict[str, Any], str]:
+def _thread_ts_from(ts_raw: str) -> str:
+    # Convert p123456789012 to 123456789.012 format
+    if len(ts_raw) > 6:
+        return f"{ts_raw[:-6]}.{ts_raw[-6:]}"
+    return ts_raw
+
+
+def _build_slack_fetch(item: Mapping[str, Any]) -> tuple[str, dict[str, Any], str]:
+    # korotovsky/slack-mcp-server uses conversations_replies
+    # Try to get channel_id and thread_ts directly, or parse from permalink
+    channel_id = item.get("channel_id", "")
+    thread_ts = item.get("thread_ts", "")
+
+    if not channel_id or not thread_ts:
+        permalink = item.get("permalink", item.get("uri", ""))
+        parsed_channel, parsed_ts = _parse_slack_permalink(permalink)
+        channel_id = channel_id or parsed_channel
+        thread_ts = thread_ts or parsed_ts
+
+    # The real Slack MCP server returns channel names (e.g., "#general") not IDs
+    # and the search results already include the full text, so skip fetch
+    if not channel_id or not channel_id.startswith(("C", "D", "G")):
+        # Channel name detected or missing - use snippet as content
+        return "slack.skip", {}, "message"
+
+    return "slack.conversations_replies", {
+        "channel_id": channel_id,
+        "thread_ts": thread_ts,
+    }, "message"
+
+
+def _build_github_fetch(item: Mapping[str, Any]) -> tuple[str, dict[str, Any], str]:
+    # @modelcontextprotocol/server-github uses get_issue, get_file_contents
+    kind = item.get("kind", "code")
+    owner = item.get("owner", "")
+    repo = item.get("repo", "")
+
+    # For issues/PRs with proper metadata, use get_issue
+    if kind in {"issue", "pr", "pull_request"}:
+        issue_number = item.get("issue_number")
+        # Only fetch if we have all required parameters (issue_number can be 0 which is valid)
+        if owner and repo and issue_number is not None:
+            return "github.get_issue", {
+                "owner": owner,
+                "repo": repo,
+                "issue_number": issue_number,
+            }, kind
+
+    # For code search results, use get_file_contents tool
+    # The GitHub MCP server doesn't support resources/read, only tools
+    path = item.get("path", "")
+    if owner and repo and path:
+        return "github.get_file_contents", {
+            "owner": owner,
+            "repo": repo,
+            "path": path,
+        }, kind
+    # Fallback: skip if required parameters are missing
+    return "github.skip", {}, kind
+
+
+def _build_gdrive_fetch(item: Mapping[str, Any]) -> tuple[str, dict[str, Any], str]:
+    # GDrive MCP server uses resources (gdrive:///<file_id>) via MCP resources protocol
+    # Note: The real GDrive MCP server's search results only include filename and mimeType
+    # in text format, without file IDs. In this case, we construct a search URL for display
+    # but cannot fetch the actual content. Only fetch if we have a valid gdrive:// URI.
+    uri = item.get("uri", "")
+    # Accept both gdrive:// and gdrive:/// formats (resource URIs, not HTTP URLs)
+    if uri and uri.startswith("gdrive://"):
+        return "gdrive.__read_resource__", {"uri": uri}, item.get("kind", "file")
+    # Skip fetching if no valid gdrive:// URI available (e.g., when using HTTP search URL)
+    return "gdrive.skip", {}, item.get("kind", "file")
+
+
+# Name-like string literals are interned, so lookups with an interned service
+# name match these keys on identity without comparing characters
+_FETCH_BUILDERS: dict[str, Callable[[Mapping[str, Any]], tuple[str, dict[str, Any], str]]] = {
+    "slack": _build_slack_fetch,
+    "github": _build_github_fetch,
+    "gdrive": _build_gdrive_fetch,
+}
+
+
+def _build_fetch_info(
+    item: Mapping[str, Any], service: Any = None
+) -> tuple[str, dict[str, Any], str]:
     """Build fetch tool name and parameters for a search result.
 
     Tool names and parameters are matched to the actual MCP server implementations:
@@ -46,74 +144,12 @@ def _build_fetch_info(item: Mapping[str, Any]) -> tuple[str, dict[str, Any], str
     - GitHub (@modelcontextprotocol/server-github): get_issue, get_file_contents
     - GDrive (@modelcontextprotocol/server-gdrive): Uses resources, not tools
     """
-    service = item.get("service")
-    if service == "slack":
-        # korotovsky/slack-mcp-server uses conversations_replies
-        # Try to get channel_id and thread_ts directly, or parse from permalink
-        channel_id = item.get("channel_id", "")
-        thread_ts = item.get("thread_ts", "")
-
-        if not channel_id or not thread_ts:
-            permalink = item.get("permalink", item.get("uri", ""))
-            parsed_channel, parsed_ts = _parse_slack_permalink(permalink)
-            channel_id = channel_id or parsed_channel
-            thread_ts = thread_ts or parsed_ts
-
-        # The real Slack MCP server returns channel names (e.g., "#general") not IDs
-        # and the search results already include the full text, so skip fetch
-        if not channel_id or not channel_id.startswith(("C", "D", "G")):
-            # Channel name detected or missing - use snippet as content
-            return "slack.skip", {}, "message"
-
-        return "slack.conversations_replies", {
-            "channel_id": channel_id,
-            "thread_ts": thread_ts,
-        }, "message"
-
-    if service == "github":
-        # @modelcontextprotocol/server-github uses get_issue, get_file_contents
-        kind = item.get("kind", "code")
-        
-        # For issues/PRs with proper metadata, use get_issue
-        if kind in {"issue", "pr", "pull_request"}:
-            owner = item.get("owner", "")
-            repo = item.get("repo", "")
-            issue_number = item.get("issue_number")
-            # Only fetch if we have all required parameters (issue_number can be 0 which is valid)
-            if owner and repo and issue_number is not None:
-                return "github.get_issue", {
-                    "owner": owner,
-                    "repo": repo,
-                    "issue_number": issue_number,
-                }, kind
-        
-        # For code search results, use get_file_contents tool
-        # The GitHub MCP server doesn't support resources/read, only tools
-        owner = item.get("owner", "")
-        repo = item.get("repo", "")
-        path = item.get("path", "")
-        if owner and repo and path:
-            return "github.get_file_contents", {
-                "owner": owner,
-                "repo": repo,
-                "path": path,
-            }, kind
-        # Fallback: skip if required parameters are missing
-        return "github.skip", {}, kind
-
-    if service == "gdrive":
-        # GDrive MCP server uses resources (gdrive:///<file_id>) via MCP resources protocol
-        # Note: The real GDrive MCP server's search results only include filename and mimeType
-        # in text format, without file IDs. In this case, we construct a search URL for display
-        # but cannot fetch the actual content. Only fetch if we have a valid gdrive:// URI.
-        uri = item.get("uri", "")
-        # Accept both gdrive:// and gdrive:/// formats (resource URIs, not HTTP URLs)
-        if uri and uri.startswith("gdrive://"):
-            return "gdrive.__read_resource__", {"uri": uri}, item.get("kind", "file")
-        # Skip fetching if no valid gdrive:// URI available (e.g., when using HTTP search URL)
-        return "gdrive.skip", {}, item.get("kind", "file")
-
-    raise ValueError(f"unsupported service: {service}")
+    if service is None:
+        service = item.get("service")
+    builder = _FETCH_BUILDERS.get(service)
+    if builder is None:
+        raise ValueError(f"unsupported service: {service}")
+    return builder(item)
 
 
 def _get_display_uri(item: Mapping[str, Any]) -> str:
@@ -141,20 +177,44 @@ def _get_display_uri(item: Mapping[str, Any]) -> str:
     )
 
 
-def map_search_results(raw_results: Iterable[Mapping[str, Any]]) -> list[SearchResult]:
-    counts: dict[str, int] = {}
+def map_search_results(
+    raw_results: Iterable[Mapping[str, Any]],
+    *,
+    services: Collection[str] | None = None,
+    counts: dict[str, int] | None = None,
+) -> list[SearchResult]:
+    """Map raw search hits to ``SearchResult`` keeping at most the cap per service.
+
+    When ``services`` names every service the hits can come from, iteration
+    stops as soon as all of them are full instead of scanning the rest.
+    Passing the same ``counts`` to several calls makes their batches share
+    one cap; it is updated in place.
+    """
+    if counts is None:
+        counts = {}
     mapped: list[SearchResult] = []
+    pending = (
+        {service for service in services if counts.get(service, 0) < MAX_RESULTS_PER_SERVICE}
+        if services is not None
+        else None
+    )
+    if pending is not None and not pending:
+        return mapped
 
     for item in raw_results:
         service = item.get("service")
         if not service:
             raise ValueError("search result missing service")
+        if type(service) is str:
+            # Decoded JSON strings are fresh objects; interning them once makes
+            # the builder and cap lookups below identity hits
+            service = sys.intern(service)
 
         current = counts.get(service, 0)
         if current >= MAX_RESULTS_PER_SERVICE:
             continue
 
-        fetch_tool, fetch_params, kind = _build_fetch_info(item)
+        fetch_tool, fetch_params, kind = _build_fetch_info(item, service)
 
         result = SearchResult(
             service=service,
@@ -168,5 +228,9 @@ def map_search_results(raw_results: Iterable[Mapping[str, Any]]) -> list[SearchR
 
         mapped.append(result)
         counts[service] = current + 1
+        if pending is not None and current + 1 >= MAX_RESULTS_PER_SERVICE:
+            pending.discard(service)
+            if not pending:
+                break
 
     return mapped
@@ -3,21 +3,29 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import sys
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Iterable, Mapping
+from typing import Any, Awaitable, Callable, Iterable, Mapping, TypeVar
 
 from app.config import RunMode, ServerDefinition, ResolvedService, cli_override_warning, resolve_service_modes
-from app.retry_policy import run_with_retry
+from app.fetch_cache import MISS, fetch_cache_key, get_cached_fetch, store_fetch
+from app.retry_policy import RunOutcome, run_with_retry
 from app.search_mapping import MAX_RESULTS_PER_SERVICE, SearchResult, map_search_results
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+DEFAULT_FETCH_CONCURRENCY_PER_SERVICE = 4
+
 
 SearchRunner = Callable[[Mapping[str, Any]], Awaitable[list[Mapping[str, Any]]]]
 FetchRunner = Callable[[SearchResult], Awaitable[Any]]
+DocumentHook = Callable[["FetchResult"], Awaitable[None]]
 
 
-@dataclass
+@dataclass(slots=True)
 class FetchResult:
     service: str
     kind: str
@@ -27,7 +35,7 @@ class FetchResult:
     content: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineOutput:
     documents: list[FetchResult]
     warnings: list[str]
@@ -41,7 +49,12 @@ class ModeAwareRunners:
     resolved_services: dict[str, ResolvedService]
 
 
-def _cap_max_results(payload: Mapping[str, Any], limit: int) -> dict[str, Any]:
+def _cap_max_results(payload: Mapping[str, Any], limit: int) -> Mapping[str, Any]:
+    requested = payload.get("max_results")
+    if isinstance(payload, dict) and type(requested) is int and requested <= limit:
+        # Already within the cap (the usual case): pass it through uncopied
+        return payload
+
     capped = dict(payload)
     try:
         requested = int(capped.get("max_results", limit))
@@ -51,12 +64,12 @@ def _cap_max_results(payload: Mapping[str, Any], limit: int) -> dict[str, Any]:
     return capped
 
 
-def _fetch_keys_for_service(source: Mapping[str, FetchRunner], service: str) -> dict[str, FetchRunner]:
-    return {
-        key: runner
-        for key, runner in source.items()
-        if key == service or key.startswith(f"{service}.")
-    }
+def _group_by_service(source: Mapping[str, FetchRunner]) -> dict[str, dict[str, FetchRunner]]:
+    """Index fetch runners by service: ``slack`` and ``slack.*`` keys go under ``slack``."""
+    groups: dict[str, dict[str, FetchRunner]] = {}
+    for key, runner in source.items():
+        groups.setdefault(key.split(".", 1)[0], {})[key] = runner
+    return groups
 
 
 def prepare_mode_aware_runners(
@@ -103,11 +116,12 @@ def prepare_mode_aware_runners(
 
     selected_search: dict[str, SearchRunner] = {}
     selected_fetch: dict[str, FetchRunner] = {}
+    # Each runner map is scanned once, and only if some service uses its mode
+    fetch_groups: dict[RunMode, dict[str, dict[str, FetchRunner]]] = {}
 
     for name, decision in resolved.items():
         mode = decision.selected_mode
         search_source = search_runners_real if mode is RunMode.REAL else search_runners_mock
-        fetch_source = fetch_runners_real if mode is RunMode.REAL else fetch_runners_mock
 
         if name in search_source:
             selected_search[name] = search_source[name]
@@ -116,7 +130,12 @@ def prepare_mode_aware_runners(
             warnings.append(warning)
             log.warning(warning)
 
-        fetch_subset = _fetch_keys_for_service(fetch_source, name)
+        groups = fetch_groups.get(mode)
+        if groups is None:
+            groups = fetch_groups[mode] = _group_by_service(
+                fetch_runners_real if mode is RunMode.REAL else fetch_runners_mock
+            )
+        fetch_subset = groups.get(name)
         if fetch_subset:
             selected_fetch.update(fetch_subset)
         else:
@@ -132,33 +151,57 @@ def prepare_mode_aware_runners(
     )
 
 
+if sys.version_info >= (3, 11):
+
+    async def _run_wave(calls: Iterable[Awaitable[T]]) -> list[T]:
+        # A TaskGroup tracks its children without gather's per-call future, and
+        # cancels the rest of the wave if one of them fails unexpectedly
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(call) for call in calls]
+        except BaseExceptionGroup as failures:
+            # Surface the failure itself, as gather did, not the group around it
+            raise failures.exceptions[0] from None
+        return [task.result() for task in tasks]
+
+else:  # pragma: no cover - Python 3.10
+
+    async def _run_wave(calls: Iterable[Awaitable[T]]) -> list[T]:
+        return list(await asyncio.gather(*calls))
+
+
 async def run_search_and_fetch_pipeline(
     searches: Iterable[Mapping[str, Any]],
     *,
     search_runners: Mapping[str, SearchRunner],
     fetch_runners: Mapping[str, FetchRunner],
     max_results_per_service: int = MAX_RESULTS_PER_SERVICE,
+    fetch_concurrency_per_service: int = DEFAULT_FETCH_CONCURRENCY_PER_SERVICE,
     initial_warnings: list[str] | None = None,
+    on_document: DocumentHook | None = None,
+    fetch_cache_scope: str | None = None,
 ) -> PipelineOutput:
     """Run search + fetch in two asynchronous waves with per-service caps.
 
-    - Searches for each service run in parallel using ``asyncio.gather``.
-    - After all searches complete, fetches for the mapped results run in parallel.
+    - Searches for each service run in parallel in one task group.
+    - As soon as a search finishes, fetches for its mapped results start in
+      parallel, without waiting for the other searches.
     - Both stages enforce the per-service ``max_results`` cap (default: 3).
+    - At most ``fetch_concurrency_per_service`` fetches (default: 4) hit one
+      service at a time, so large result sets do not trip its rate limits.
+    - ``on_document`` is awaited with each document as soon as it is ready, so
+      callers can start per-document work while other fetches are in flight.
+      The returned ``documents`` keep payload order regardless.
+    - With a ``fetch_cache_scope`` (see ``app.fetch_cache.fetch_cache_scope``),
+      fetched content is reused by later runs in the same scope until it expires.
     - Failures during fetch are logged/warned but do not stop other services.
     """
 
-    warnings: list[str] = list(initial_warnings or [])
-
-    async def _run_single_search(payload: Mapping[str, Any]) -> list[Mapping[str, Any]]:
-        service = payload.get("service")
-        if not service:
-            raise ValueError("search payload missing service")
-
-        runner = search_runners.get(service)
-        if not runner:
-            raise ValueError(f"no search runner registered for {service}")
-
+    # Each search and fetch records into its own warnings list; they are merged
+    # in payload order at the end, so no list is shared between tasks.
+    async def _run_single_search(
+        service: str, runner: SearchRunner, payload: Mapping[str, Any], warnings: list[str]
+    ) -> list[Mapping[str, Any]]:
         capped = _cap_max_results(payload, max_results_per_service)
 
         outcome = await run_with_retry(
@@ -181,46 +224,73 @@ async def run_search_and_fetch_pipeline(
 
         return results
 
-    search_tasks = [asyncio.create_task(_run_single_search(payload)) for payload in searches]
-    raw_batches = await asyncio.gather(*search_tasks) if search_tasks else []
-    raw_results = [item for batch in raw_batches for item in batch]
-
-    mapped_results = map_search_results(raw_results)
-
-    async def _run_fetch(result: SearchResult) -> FetchResult | None:
-        # Skip fetch if explicitly marked as skip (e.g., "slack.skip")
-        if result.fetch_tool.endswith(".skip"):
-            # Use snippet as content when fetch is skipped
-            return FetchResult(
-                service=result.service,
-                kind=result.kind,
-                title=result.title,
-                snippet=result.snippet,
-                uri=result.uri,
-                content=result.snippet,  # Use snippet as content
-            )
+    # Reject bad payloads before any search starts, so the wave only holds
+    # calls that report their own failures as warnings
+    planned: list[tuple[str, SearchRunner, Mapping[str, Any]]] = []
+    for payload in searches:
+        service = payload.get("service")
+        if not service:
+            raise ValueError("search payload missing service")
 
-        runner = fetch_runners.get(result.fetch_tool) or fetch_runners.get(result.service)
+        runner = search_runners.get(service)
         if not runner:
-            warning = f"{result.service} fetch runner missing for {result.fetch_tool}"
-            warnings.append(warning)
-            logger.warning(warning)
-            return None
+            raise ValueError(f"no search runner registered for {service}")
 
-        outcome = await run_with_retry(
-            lambda: runner(result),
-            service=result.service,
-            stage="fetch",
-            warnings=warnings,
-            logger=logger,
-        )
+        planned.append((service, runner, payload))
+
+    # One fetch per target: results that point at the same tool and params
+    # (e.g. a thread found by two queries) wait on the first caller's outcome
+    inflight: dict[tuple[str, str, str], asyncio.Future[RunOutcome[Any]]] = {}
+    fetch_slots: defaultdict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(max(1, fetch_concurrency_per_service))
+    )
+
+    async def _fetch_once(result: SearchResult, runner: FetchRunner, warnings: list[str]) -> RunOutcome[Any]:
+        key = fetch_cache_key(fetch_cache_scope or "", result.fetch_tool, result.fetch_params)
+        shared = inflight.get(key)
+        if shared is not None:
+            return await shared
+
+        # Content fetched for an earlier question is reused until it expires;
+        # unscoped runs cannot tell whose servers produced it, so they skip it
+        if fetch_cache_scope is not None:
+            cached = get_cached_fetch(key)
+            if cached is not MISS:
+                return RunOutcome(success=True, result=cached, attempts=0)
+
+        shared = asyncio.get_running_loop().create_future()
+        inflight[key] = shared
+        try:
+            # The slot is taken outside run_with_retry so queueing does not eat
+            # into the per-attempt timeout
+            async with fetch_slots[result.service]:
+                outcome = await run_with_retry(
+                    lambda: runner(result),
+                    service=result.service,
+                    stage="fetch",
+                    warnings=warnings,
+                    logger=logger,
+                )
+        except BaseException:
+            # Waiters were not cancelled themselves: they see a failed fetch,
+            # and a later result for the same target fetches it again
+            del inflight[key]
+            shared.set_result(RunOutcome(success=False, result=None, attempts=0, skipped_reason="cancelled"))
+            raise
+        shared.set_result(outcome)
+        if outcome.success and fetch_cache_scope is not None:
+            store_fetch(key, outcome.result)
+        return outcome
+
+    async def _run_fetch(result: SearchResult, runner: FetchRunner, warnings: list[str]) -> FetchResult | None:
+        outcome = await _fetch_once(result, runner, warnings)
 
         if not outcome.success:
             return None
 
         content = outcome.result
 
-        return FetchResult(
+        document = FetchResult(
             service=result.service,
             kind=result.kind,
             title=result.title,
@@ -228,9 +298,107 @@ async def run_search_and_fetch_pipeline(
             uri=result.uri,
             content=content,
         )
+        if on_document is not None:
+            await on_document(document)
+        return document
+
+    # Cap and dedup state is keyed by the service of each hit, which may differ
+    # from the service that was searched. Payloads claim their share in payload
+    # order, so which results are kept does not depend on which search happens
+    # to finish first.
+    counts: dict[str, int] = {}
+    # Documents already claimed by a batch, keyed by URI (or by content when
+    # the result has none), so one document is fetched and summarized once
+    seen_documents: set[object] = set()
+
+    async def _search_then_fetch(
+        service: str,
+        runner: SearchRunner,
+        payload: Mapping[str, Any],
+        turn: asyncio.Event | None,
+        claimed: asyncio.Event,
+    ) -> tuple[list[FetchResult | None], list[str]]:
+        warnings: list[str] = []
+        batch = await _run_single_search(service, runner, payload, warnings)
+
+        # Resolve runners once up front; results without one are reported here
+        # and never get a task. Slots keep the documents in result order.
+        documents: list[FetchResult | None] = []
+        skipped: list[FetchResult] = []
+        jobs: list[tuple[int, SearchResult, FetchRunner]] = []
+        duplicates = 0
+        try:
+            # Wait for the previous payload to claim its share
+            if turn is not None:
+                await turn.wait()
+            hit_services = {item.get("service") for item in batch}
+            mapped_results = map_search_results(batch, services=hit_services, counts=counts)
+            for result in mapped_results:
+                document_key = result.uri or (result.service, result.title, result.snippet)
+                if document_key in seen_documents:
+                    duplicates += 1
+                    continue
+                seen_documents.add(document_key)
+
+                # Skip fetch if explicitly marked as skip (e.g., "slack.skip")
+                if result.fetch_tool.endswith(".skip"):
+                    # Use snippet as content when fetch is skipped
+                    document = FetchResult(
+                        service=result.service,
+                        kind=result.kind,
+                        title=result.title,
+                        snippet=result.snippet,
+                        uri=result.uri,
+                        content=result.snippet,
+                    )
+                    documents.append(document)
+                    skipped.append(document)
+                    continue
+                fetch_runner = fetch_runners.get(result.fetch_tool) or fetch_runners.get(result.service)
+                if not fetch_runner:
+                    warning = f"{result.service} fetch runner missing for {result.fetch_tool}"
+                    warnings.append(warning)
+                    logger.warning(warning)
+                    continue
+                jobs.append((len(documents), result, fetch_runner))
+                documents.append(None)
+        finally:
+            claimed.set()
+
+        if on_document is not None:
+            for document in skipped:
+                await on_document(document)
+
+        if duplicates:
+            logger.debug("%s: dropped %d duplicate result(s) before fetching", service, duplicates)
+
+        fetch_warnings: list[list[str]] = [[] for _ in jobs]
+        fetched = await _run_wave(
+            _run_fetch(result, fetch_runner, local)
+            for (_, result, fetch_runner), local in zip(jobs, fetch_warnings)
+        )
+        for (index, _, _), document in zip(jobs, fetched):
+            documents[index] = document
+        for local in fetch_warnings:
+            warnings.extend(local)
+        return documents, warnings
+
+    # Hits can belong to any service, so each payload waits for the previous
+    # one to claim before it does; searches themselves still run concurrently
+    turns: list[tuple[asyncio.Event | None, asyncio.Event]] = []
+    last_claim: asyncio.Event | None = None
+    for _ in planned:
+        claimed = asyncio.Event()
+        turns.append((last_claim, claimed))
+        last_claim = claimed
+
+    outcomes = await _run_wave(
+        _search_then_fetch(*entry, *turn) for entry, turn in zip(planned, turns)
+    )
 
-    fetch_tasks = [asyncio.create_task(_run_fetch(result)) for result in mapped_results]
-    fetched = await asyncio.gather(*fetch_tasks) if fetch_tasks else []
-
-    documents = [item for item in fetched if item is not None]
+    warnings: list[str] = list(initial_warnings or [])
+    documents: list[FetchResult] = []
+    for fetched, batch_warnings in outcomes:
+        documents.extend(item for item in fetched if item is not None)
+        warnings.extend(batch_warnings)
     return PipelineOutput(documents=documents, warnings=warnings)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import http.client
 import json
 import os
+import threading
 import time
 import urllib.parse
 import urllib.error
@@ -35,6 +38,76 @@ class SmokeServiceResult:
         return payload
 
 
+# Idle keep-alive connections per (scheme, host), so GET probes against the
+# same API skip the TCP and TLS handshakes. A connection is checked out while
+# in use, so concurrent callers never share one.
+_CONNECTIONS: dict[tuple[str, str], http.client.HTTPConnection] = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+def close_session() -> None:
+    """Close every idle keep-alive connection."""
+    with _CONNECTIONS_LOCK:
+        connections = list(_CONNECTIONS.values())
+        _CONNECTIONS.clear()
+    for connection in connections:
+        connection.close()
+
+
+def _checkout_connection(key: tuple[str, str], timeout: float, *, fresh: bool) -> tuple[http.client.HTTPConnection, bool]:
+    if not fresh:
+        with _CONNECTIONS_LOCK:
+            connection = _CONNECTIONS.pop(key, None)
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+    scheme, netloc = key
+    factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    return factory(netloc, timeout=timeout), False
+
+
+def _release_connection(key: tuple[str, str], connection: http.client.HTTPConnection) -> None:
+    with _CONNECTIONS_LOCK:
+        if key not in _CONNECTIONS:
+            _CONNECTIONS[key] = connection
+            return
+    connection.close()
+
+
+def _keep_alive_get(
+    parts: urllib.parse.SplitResult, headers: Mapping[str, str], timeout: float
+) -> tuple[int, str, bytes]:
+    key = (parts.scheme, parts.netloc)
+    target = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+    request_headers = {"User-Agent": "mcp-workspace-finder-smoke", **headers}
+
+    fresh = False
+    while True:
+        connection, reused = _checkout_connection(key, timeout, fresh=fresh)
+        try:
+            connection.request("GET", target, headers=request_headers)
+            response = connection.getresponse()
+            body = response.read()
+        except ConnectionError:
+            connection.close()
+            if reused:
+                # The server dropped the idle socket; GET is safe to send once more
+                fresh = True
+                continue
+            raise
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            _release_connection(key, connection)
+        return response.status, response.reason, body
+
+
 def _http_json_request(
     url: str,
     *,
@@ -43,21 +116,30 @@ def _http_json_request(
     data: bytes | None = None,
     timeout: float = 10.0,
 ) -> dict:
-    request = urllib.request.Request(url, data=data, method=method)
-    for key, value in (headers or {}).items():
-        request.add_header(key, value)
+    parts = urllib.parse.urlsplit(url)
+    # Only idempotent GETs reuse connections; anything else, or a proxied
+    # scheme, goes through urllib as a one-off request that is never retried
+    if method == "GET" and data is None and parts.scheme not in urllib.request.getproxies():
+        status, reason, body = _keep_alive_get(parts, headers or {}, timeout)
+        if status >= 400:
+            detail = body.decode("utf-8", errors="replace")
+            raise SmokeProbeError(f"{status} {reason} for {url}: {detail}")
+    else:
+        request = urllib.request.Request(url, data=data, method=method)
+        for key, value in (headers or {}).items():
+            request.add_header(key, value)
 
-    try:
-        with urllib.request.urlopen(request, timeout=timeout) as response:  # noqa: S310
-            body = response.read()
-    except urllib.error.HTTPError as exc:  # type: ignore[attr-defined]
-        # surface API error details to the caller instead of hiding them in the traceback
-        detail = ""
         try:
-            detail = exc.read().decode("utf-8")  # type: ignore[assignment]
-        except Exception:  # noqa: BLE001
-            detail = "<no response body>"
-        raise SmokeProbeError(f"{exc.code} {exc.reason} for {url}: {detail}") from exc
+            with urllib.request.urlopen(request, timeout=timeout) as response:  # noqa: S310
+                body = response.read()
+        except urllib.error.HTTPError as exc:  # type: ignore[attr-defined]
+            # surface API error details to the caller instead of hiding them in the traceback
+            detail = ""
+            try:
+                detail = exc.read().decode("utf-8")  # type: ignore[assignment]
+            except Exception:  # noqa: BLE001
+                detail = "<no response body>"
+            raise SmokeProbeError(f"{exc.code} {exc.reason} for {url}: {detail}") from exc
 
     try:
         return json.loads(body.decode("utf-8"))
@@ -268,12 +350,18 @@ def _default_probes() -> dict[str, Callable[[], SmokeServiceResult]]:
     }
 
 
-def run_smoke_checks(
+async def run_smoke_checks_async(
     resolved: Mapping[str, ResolvedService],
     probes: Mapping[str, Callable[[], SmokeServiceResult]] | None = None,
 ) -> dict[str, SmokeServiceResult]:
+    """Run the probes of all real-mode services concurrently.
+
+    Probes are blocking network calls, so each runs in a worker thread and the
+    total time is that of the slowest probe rather than the sum.
+    """
     probes = probes or _default_probes()
-    results: dict[str, SmokeServiceResult] = {}
+    results: dict[str, SmokeServiceResult | None] = {}
+    scheduled: list[tuple[str, Callable[[], SmokeServiceResult]]] = []
 
     for name, decision in resolved.items():
         if decision.selected_mode is not RunMode.REAL:
@@ -285,18 +373,33 @@ def run_smoke_checks(
             results[name] = SmokeServiceResult(name=name, ok=False, detail="no probe defined")
             continue
 
-        try:
-            result = probe()
-        except SmokeProbeError as exc:
-            results[name] = SmokeServiceResult(name=name, ok=False, detail=str(exc))
+        results[name] = None  # keeps the report in service order
+        scheduled.append((name, probe))
+
+    outcomes = await asyncio.gather(
+        *(asyncio.to_thread(probe) for _, probe in scheduled), return_exceptions=True
+    )
+
+    for (name, _), outcome in zip(scheduled, outcomes):
+        if isinstance(outcome, SmokeProbeError):
+            results[name] = SmokeServiceResult(name=name, ok=False, detail=str(outcome))
             continue
+        if isinstance(outcome, BaseException):
+            raise outcome
 
         # ensure correct name
-        if result.name != name:
-            result.name = name
-        results[name] = result
+        if outcome.name != name:
+            outcome.name = name
+        results[name] = outcome
+
+    return results  # type: ignore[return-value]
+
 
-    return results
+def run_smoke_checks(
+    resolved: Mapping[str, ResolvedService],
+    probes: Mapping[str, Callable[[], SmokeServiceResult]] | None = None,
+) -> dict[str, SmokeServiceResult]:
+    return asyncio.run(run_smoke_checks_async(resolved, probes))
 
 
 def summarise_results(results: Mapping[str, SmokeServiceResult]) -> dict[str, object]:
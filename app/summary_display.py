@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import re
 from typing import Sequence
 
@@ -8,10 +9,12 @@ from rich.markdown import Markdown
 
 from app.evidence_links import EvidenceLink
 
+_EVIDENCE_RE = re.compile(r"\s*\[(\d+)\]")
+
 
 def _inject_urls_into_summary(summary: str, links: Sequence[EvidenceLink]) -> str:
     """Replace [N] references with the corresponding URL on the next line."""
-    if not links:
+    if not links or "[" not in summary:
         return summary
 
     # Build mapping from evidence number to URL
@@ -25,36 +28,38 @@ def _inject_urls_into_summary(summary: str, links: Sequence[EvidenceLink]) -> st
             return f"\n  {url}"
         return match.group(0)
 
-    return re.sub(r'\s*\[(\d+)\]', replace_ref, summary)
+    return _EVIDENCE_RE.sub(replace_ref, summary)
 
 
-def _build_alternatives_block(alternatives: Sequence[str] | None) -> str:
+def _emit_alternatives(buf: io.StringIO, alternatives: Sequence[str] | None, separate: bool) -> bool:
+    """Write the "次の検索候補" block; returns whether anything was written."""
     if not alternatives:
-        return ""
-
-    cleaned = [alt.strip() for alt in alternatives if isinstance(alt, str) and alt.strip()]
-    if not cleaned:
-        return ""
-
-    lines = ["## 次の検索候補"]
-    lines.extend(f"- {alt}" for alt in cleaned)
-    return "\n".join(lines)
+        return False
+
+    wrote = False
+    for alt in alternatives:
+        if not isinstance(alt, str):
+            continue
+        alt = alt.strip()
+        if not alt:
+            continue
+        if not wrote:
+            buf.write("\n\n## 次の検索候補" if separate else "## 次の検索候補")
+            wrote = True
+        buf.write(f"\n- {alt}")
+    return wrote
 
 
 def _compose_markdown(summary_markdown: str, links: Sequence[EvidenceLink], alternatives: Sequence[str] | None) -> str:
-    blocks: list[str] = []
+    buf = io.StringIO()
 
     summary = (summary_markdown or "").strip()
     if summary:
         # Inject URLs directly into the summary
-        summary_with_urls = _inject_urls_into_summary(summary, links)
-        blocks.append(summary_with_urls)
-
-    alt_block = _build_alternatives_block(alternatives)
-    if alt_block:
-        blocks.append(alt_block)
+        buf.write(_inject_urls_into_summary(summary, links))
 
-    return "\n\n".join(blocks)
+    _emit_alternatives(buf, alternatives, separate=bool(summary))
+    return buf.getvalue()
 
 
 def render_summary_with_links(
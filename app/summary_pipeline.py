@@ -3,15 +3,23 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Sequence
+from typing import Any, Iterable, Mapping, Sequence, TextIO
 
 from app.evidence_links import EvidenceLink, format_evidence_links
 from app.llm_summary import summarize_documents
 from app.search_mapping import MAX_RESULTS_PER_SERVICE
-from app.search_pipeline import FetchResult, FetchRunner, SearchRunner, run_search_and_fetch_pipeline
+from app.search_pipeline import (
+    DEFAULT_FETCH_CONCURRENCY_PER_SERVICE,
+    DocumentHook,
+    FetchResult,
+    FetchRunner,
+    SearchRunner,
+    run_search_and_fetch_pipeline,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,11 +44,32 @@ class SearchFetchSummaryResult:
     alternatives: list[str]
 
 
-def _write_jsonl(path: Path, record: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as fp:
-        fp.write(json.dumps(record, ensure_ascii=False, default=str))
-        fp.write("\n")
+class _JsonlWriter:
+    """Append JSON records to one file through a single lazily opened handle.
+
+    Records are buffered and reach the file on ``close()`` (or when the buffer
+    fills), instead of one open/write/close per record. Safe to call from the
+    worker threads ``summarize_documents`` may use.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._fp: TextIO | None = None
+        self._lock = threading.Lock()
+
+    def write(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._fp is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._fp = self._path.open("a", encoding="utf-8")
+            self._fp.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
 
 
 def _build_fallback_markdown(documents: Sequence[FetchResult]) -> str:
@@ -55,9 +84,9 @@ def _build_fallback_markdown(documents: Sequence[FetchResult]) -> str:
     return "\n".join(lines)
 
 
-def _build_io_logger(log_path: Path | None):
+def _build_io_logger(writer: _JsonlWriter | None):
     def _log(payload: dict[str, Any]) -> None:
-        if log_path is None:
+        if writer is None:
             return
         record = {
             "ts": datetime.now(timezone.utc).isoformat(),
@@ -66,7 +95,7 @@ def _build_io_logger(log_path: Path | None):
             **{k: v for k, v in payload.items() if k not in {"stage", "direction"}},
         }
         try:
-            _write_jsonl(log_path, record)
+            writer.write(record)
         except Exception:  # noqa: BLE001
             logger.debug("failed to write LLM summary log", exc_info=True)
 
@@ -89,7 +118,8 @@ def run_summary_pipeline(
     warnings = links_result.warnings
 
     log_path = (log_dir or Path.cwd() / "logs") / SUMMARY_LOG_FILENAME if debug_enabled else None
-    io_logger = _build_io_logger(log_path)
+    writer = _JsonlWriter(log_path) if log_path is not None else None
+    io_logger = _build_io_logger(writer)
 
     try:
         summary = summarize_documents(
@@ -110,6 +140,12 @@ def run_summary_pipeline(
         message = f"summary failed: {exc}"
     else:
         message = ""
+    finally:
+        if writer is not None:
+            try:
+                writer.close()
+            except Exception:  # noqa: BLE001
+                logger.debug("failed to write LLM summary log", exc_info=True)
 
     if message:
         warnings.append(message)
@@ -132,10 +168,13 @@ async def run_search_fetch_and_summarize_pipeline(
     fetch_runners: Mapping[str, FetchRunner],
     llm_client: Any,
     max_results_per_service: int = MAX_RESULTS_PER_SERVICE,
+    fetch_concurrency_per_service: int = DEFAULT_FETCH_CONCURRENCY_PER_SERVICE,
     initial_warnings: list[str] | None = None,
     debug_enabled: bool = False,
     log_dir: Path | None = None,
     alternatives: list[str] | None = None,
+    on_document: DocumentHook | None = None,
+    fetch_cache_scope: str | None = None,
 ) -> SearchFetchSummaryResult:
     """Execute search+fetch asynchronously then summarize with evidence links."""
 
@@ -144,7 +183,10 @@ async def run_search_fetch_and_summarize_pipeline(
         search_runners=search_runners,
         fetch_runners=fetch_runners,
         max_results_per_service=max_results_per_service,
+        fetch_concurrency_per_service=fetch_concurrency_per_service,
         initial_warnings=initial_warnings,
+        on_document=on_document,
+        fetch_cache_scope=fetch_cache_scope,
     )
 
     summary_result = run_summary_pipeline(
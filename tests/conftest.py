@@ -3,8 +3,24 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 
 # Ensure the repository root is importable so `app` can be imported in tests.
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_search_cache(tmp_path, monkeypatch):
+    """Keep generated-search and fetch caching in memory and independent per test."""
+    from app.fetch_cache import clear_fetch_cache
+    from app.llm_search import clear_search_cache
+
+    monkeypatch.delenv("MCP_SEARCH_CACHE_PATH", raising=False)
+    clear_search_cache()
+    clear_fetch_cache()
+    yield
+    clear_search_cache()
+    clear_fetch_cache()
@@ -67,6 +67,8 @@ class BaseMcpServer(ABC):
         except json.JSONDecodeError as e:
             self._send_error(None, -32700, f"Parse error: {e}")
             return
+        if "id" not in request:
+            return  # notifications (e.g. notifications/cancelled) get no response
 
         request_id = request.get("id")
         method = request.get("method", "")
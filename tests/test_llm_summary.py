@@ -1,9 +1,11 @@
 import json
 import logging
+import threading
+import time
 
 import pytest
 
-from app.llm_summary import summarize_documents
+from app.llm_summary import _extract_function_arguments, summarize_documents
 from app.search_pipeline import FetchResult
 
 
@@ -92,3 +94,89 @@ def test_schema_mismatch_retries_and_warns(caplog):
 
     assert len(client.calls) == 2
     assert any("retry" in record.message.lower() for record in caplog.records)
+
+
+def test_speculative_mode_returns_first_valid_candidate():
+    docs = _sample_docs()
+    bad_payload = {"markdown": "missing evidence_count"}
+    good_payload = {"markdown": "## Slack\n- A [1]\n## GitHub\n- B [2]\n## Drive\n- C [3]", "evidence_count": 3}
+    client = DummyClient([make_response(bad_payload), make_response(good_payload)])
+
+    result = summarize_documents("Q", docs, client, speculative=True)
+
+    assert result.evidence_count == 3
+    assert len(client.calls) == 2
+
+
+def test_speculative_mode_raises_when_all_candidates_invalid():
+    docs = _sample_docs()
+    bad_payload = {"markdown": "missing evidence_count"}
+    client = DummyClient([make_response(bad_payload), make_response(bad_payload)])
+
+    with pytest.raises(ValueError):
+        summarize_documents("Q", docs, client, speculative=True)
+
+    assert len(client.calls) == 2
+
+
+def test_speculative_mode_propagates_client_errors():
+    docs = _sample_docs()
+    client = DummyClient([])
+
+    with pytest.raises(RuntimeError, match="no more responses"):
+        summarize_documents("Q", docs, client, speculative=True)
+
+
+def test_speculative_mode_drops_late_candidate_io_logs():
+    docs = _sample_docs()
+    good_payload = {"markdown": "## Slack\n- A [1]\n## GitHub\n- B [2]\n## Drive\n- C [3]", "evidence_count": 3}
+    release = threading.Event()
+    logged = []
+
+    class SlowLoserClient:
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.calls = 0
+
+        def create(self, **kwargs):
+            with self.lock:
+                self.calls += 1
+                first = self.calls == 1
+            if not first:
+                release.wait(timeout=5)
+            return make_response(good_payload)
+
+    result = summarize_documents("Q", docs, SlowLoserClient(), io_logger=logged.append, speculative=True)
+    logged_before_release = list(logged)
+    release.set()
+    time.sleep(0.05)
+
+    assert result.evidence_count == 3
+    assert logged == logged_before_release
+    assert [entry["direction"] for entry in logged].count("response") == 1
+
+
+def test_extracted_arguments_do_not_alias_the_response():
+    arguments = {"markdown": "## Slack\n- A [1]", "evidence_count": 1}
+    response = {"function_call": {"name": "write_markdown_summary", "arguments": arguments}}
+
+    extracted = _extract_function_arguments(response)
+    extracted["evidence_count"] = 2
+
+    assert extracted is not arguments
+    assert arguments["evidence_count"] == 1
+
+
+def test_documents_payload_omits_empty_title_and_snippet():
+    docs = [
+        FetchResult(service="slack", kind="message", title="", snippet="", uri="https://slack.test/1", content="body"),
+    ]
+    payload = {"markdown": "## Slack\n- A [1]", "evidence_count": 1}
+    client = DummyClient([make_response(payload)])
+
+    summarize_documents("Q", docs, client)
+
+    user_payload = json.loads(client.calls[0]["messages"][-1]["content"])
+    assert user_payload["documents"] == [
+        {"id": 1, "service": "slack", "kind": "message", "uri": "https://slack.test/1", "content": "body"}
+    ]
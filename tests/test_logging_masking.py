@@ -1,7 +1,7 @@
 import logging
 from io import StringIO
 
-from app.logging_utils import install_log_masking, mask_sensitive_text
+from app.logging_utils import _mask_domain_value, install_log_masking, mask_sensitive_text
 
 
 def test_mask_sensitive_text_masks_token_email_and_domain():
@@ -20,6 +20,14 @@ def test_mask_sensitive_text_masks_token_email_and_domain():
     # )
 
 
+def test_mask_domain_value_masks_labels_and_keeps_tld():
+    assert _mask_domain_value("internal.example.org") == "i******l.e*****e.org"
+    assert _mask_domain_value("ab.example.com") == "**.e*****e.com"
+    assert _mask_domain_value("localhost") == "*********"
+    # Non-ASCII domains take the generic path and mask identically.
+    assert _mask_domain_value("日本語.example.jp") == "日*語.e*****e.jp"
+
+
 def test_logging_formatter_masks_output():
     stream = StringIO()
     handler = logging.StreamHandler(stream)
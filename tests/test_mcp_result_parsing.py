@@ -0,0 +1,178 @@
+import pytest
+
+from app.mcp_runners import _parse_slack_csv_results
+
+
+SLACK_CSV = (
+    "MsgID,UserID,UserName,RealName,Channel,ThreadTs,Text,Time,Reactions,Cursor\n"
+    '1762499528.459139,U1,alice,Alice A,#general,,"Design review\nnotes",2025-01-01,,\n'
+    "\n"
+    "1762499529.000001,U2,bob,,#dev,,Short,2025-01-02,,\n"
+    "1762499530.000002,U3,carol,Carol C,#dev,,Third,2025-01-03,,\n"
+)
+
+
+def test_slack_csv_parser_maps_columns_and_stops_at_max_results(monkeypatch):
+    monkeypatch.setenv("SLACK_WORKSPACE", "acme")
+
+    results = _parse_slack_csv_results(SLACK_CSV, max_results=2)
+
+    assert len(results) == 2
+    first, second = results
+    assert first["title"] == "Message from Alice A"
+    assert first["snippet"] == "Design review\nnotes"
+    assert first["uri"] == "https://acme.slack.com/archives/general/p1762499528459139"
+    assert first["channel"] == "#general"
+    assert first["thread_ts"] == "1762499528.459139"
+    assert first["time"] == "2025-01-01"
+    # RealName column is present but empty -> generic title
+    assert second["title"] == "Slack message"
+    assert second["msg_id"] == "1762499529.000001"
+
+
+def test_slack_csv_parser_tolerates_missing_columns_and_short_rows(monkeypatch):
+    monkeypatch.delenv("SLACK_WORKSPACE", raising=False)
+
+    results = _parse_slack_csv_results("MsgID,Text\n1.5\n", max_results=3)
+
+    assert results == [
+        {
+            "service": "slack",
+            "title": "Slack message",
+            "snippet": "",
+            "uri": "https://workspace.slack.com/archives/channel/p15",
+            "kind": "message",
+            "channel": "",
+            "thread_ts": "1.5",
+            "msg_id": "1.5",
+            "user": "",
+            "time": "",
+        }
+    ]
+
+
+def test_drive_service_is_cached_until_token_file_changes(monkeypatch, tmp_path):
+    import json
+    import os
+    from unittest.mock import MagicMock
+
+    pytest.importorskip("googleapiclient")
+    import googleapiclient.discovery
+
+    from app.mcp_runners import _build_drive_service, _get_drive_service
+
+    token_path = tmp_path / "token.json"
+    token_path.write_text(json.dumps({"access_token": "a", "refresh_token": "r"}))
+    monkeypatch.setenv("DRIVE_TOKEN_PATH", str(token_path))
+    build = MagicMock(side_effect=lambda *args, **kwargs: object())
+    monkeypatch.setattr(googleapiclient.discovery, "build", build)
+    _build_drive_service.cache_clear()
+
+    first = _get_drive_service()
+    assert _get_drive_service() is first
+    assert build.call_count == 1
+
+    stat = token_path.stat()
+    os.utime(token_path, (stat.st_atime, stat.st_mtime + 10))
+    assert _get_drive_service() is not first
+    assert build.call_count == 2
+    _build_drive_service.cache_clear()
+
+
+def test_gdrive_parser_resolves_links_with_one_drive_query(monkeypatch):
+    from unittest.mock import MagicMock
+
+    import app.mcp_runners as mcp_runners
+
+    service = MagicMock()
+    service.files.return_value.list.return_value.execute.return_value = {
+        "files": [
+            {"name": "Plan's draft", "webViewLink": "https://drive.google.com/file/d/1"},
+            {"name": "Budget", "webViewLink": "https://drive.google.com/file/d/2"},
+        ]
+    }
+    monkeypatch.setattr(mcp_runners, "_get_drive_service", lambda: service)
+
+    text = "Found 3 files:\nPlan's draft (application/pdf)\nBudget (text/csv)\nMissing (text/plain)"
+    results = mcp_runners._parse_gdrive_text_results(text, max_results=3)
+
+    assert [r["uri"] for r in results] == [
+        "https://drive.google.com/file/d/1",
+        "https://drive.google.com/file/d/2",
+        "https://drive.google.com/drive/search?q=Missing",
+    ]
+    service.files.return_value.list.assert_called_once()
+    query = service.files.return_value.list.call_args.kwargs["q"]
+    assert query == "name = 'Plan\\'s draft' or name = 'Budget' or name = 'Missing'"
+
+
+@pytest.mark.anyio
+async def test_gdrive_search_runner_resolves_links_off_the_event_loop(monkeypatch):
+    import threading
+    from unittest.mock import AsyncMock, MagicMock
+
+    import app.mcp_runners as mcp_runners
+
+    lookup_threads = []
+
+    def fake_bulk(names):
+        lookup_threads.append(threading.get_ident())
+        return {}
+
+    monkeypatch.setattr(mcp_runners, "_get_webviewlinks_bulk", fake_bulk)
+    client = MagicMock()
+    client.call_tool = AsyncMock(return_value=[{"type": "text", "text": "Found 1 files:\nDoc (text/plain)"}])
+    runner = mcp_runners.create_search_runner(client, "gdrive", "search")
+
+    results = await runner({"query": "doc", "max_results": 3})
+
+    assert [r["title"] for r in results] == ["Doc"]
+    assert lookup_threads and lookup_threads[0] != threading.get_ident()
+
+
+def test_github_json_parser_decodes_payload_once(monkeypatch):
+    import json
+
+    import app.mcp_runners as mcp_runners
+
+    calls = []
+    real_loads = mcp_runners._loads
+
+    def counting_loads(text):
+        calls.append(text)
+        return real_loads(text)
+
+    monkeypatch.setattr(mcp_runners, "_loads", counting_loads)
+    payload = json.dumps({
+        "total_count": 1,
+        "items": [{
+            "title": "Crash on start",
+            "number": 7,
+            "html_url": "https://github.com/acme/app/issues/7",
+            "body": "",
+            "state": "open",
+        }],
+    })
+
+    results = mcp_runners._parse_github_json_results(payload, max_results=3)
+
+    assert len(calls) == 1
+    assert results[0]["title"] == "#7 Crash on start"
+    assert (results[0]["owner"], results[0]["repo"]) == ("acme", "app")
+    assert results[0]["snippet"] == "ISSUE (open)"
+
+
+def test_normalize_search_items_overwrites_canonical_fields_and_keeps_the_rest():
+    from app.mcp_runners import _normalize_search_items
+
+    item = {"name": "README.md", "html_url": "https://github.com/o/r/blob/main/README.md", "owner": "o", "text": "x" * 300}
+
+    (entry,) = _normalize_search_items([item, "not a dict"], "github")
+
+    assert entry["service"] == "github"
+    assert entry["title"] == "README.md"
+    assert entry["uri"] == item["html_url"]
+    assert entry["snippet"] == "x" * 200
+    assert entry["kind"] == "file"
+    assert entry["owner"] == "o"
+    assert item["text"] == "x" * 300  # input is not mutated
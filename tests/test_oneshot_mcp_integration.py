@@ -10,6 +10,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+import sys
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -22,6 +24,15 @@ from app.search_pipeline import run_search_and_fetch_pipeline
 from app.summary_pipeline import run_search_fetch_and_summarize_pipeline
 
 
+def _as_read(next_chunk):
+    """Adapt a no-arg coroutine returning frames to StreamReader.read(n)."""
+
+    async def read(_n: int = -1) -> bytes:
+        return await next_chunk()
+
+    return read
+
+
 @pytest.fixture
 def mock_llm_client():
     """Create a mock LLM client that returns fixed responses for both search and summary."""
@@ -85,7 +96,7 @@ class TestStdioMcpClient:
 
         mock_process.stdin.drain = mock_drain
 
-        # Mock stdout.readline to return appropriate responses
+        # Mock stdout.read to return appropriate responses
         # First call: initialize response, Second call: tool result
         responses = [
             '{"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05", "capabilities": {}}}\n',
@@ -97,7 +108,7 @@ class TestStdioMcpClient:
             return next(response_iter).encode()
 
         mock_process.stdout = MagicMock()
-        mock_process.stdout.readline = mock_readline
+        mock_process.stdout.read = _as_read(mock_readline)
 
         client = StdioMcpClient(mock_process, "test-service")
         result = await client.call_tool("search_messages", {"query": "test"})
@@ -119,6 +130,396 @@ class TestStdioMcpClient:
         # Verify response was parsed
         assert result == [{"text": "test result"}]
 
+    @pytest.mark.anyio
+    async def test_concurrent_calls_are_pipelined_and_matched_by_id(self):
+        """Concurrent tool calls should share the pipe and get responses by id."""
+        import json as json_module
+
+        mock_process = MagicMock()
+        outgoing: asyncio.Queue[bytes] = asyncio.Queue()
+        held: list[dict] = []
+
+        def mock_write(data):
+            request = json_module.loads(data.decode())
+            if request["method"] == "initialize":
+                outgoing.put_nowait(json_module.dumps({"jsonrpc": "2.0", "id": request["id"], "result": {}}).encode() + b"\n")
+                return
+            held.append(request)
+            if len(held) == 2:
+                # Reply in reverse order to prove responses are matched by id.
+                for req in reversed(held):
+                    result = {"content": [{"text": req["params"]["name"]}]}
+                    outgoing.put_nowait(json_module.dumps({"jsonrpc": "2.0", "id": req["id"], "result": result}).encode() + b"\n")
+
+        async def mock_drain():
+            pass
+
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.write = mock_write
+        mock_process.stdin.drain = mock_drain
+        mock_process.stdout = MagicMock()
+        mock_process.stdout.read = _as_read(outgoing.get)
+
+        client = StdioMcpClient(mock_process, "test-service")
+        await client.initialize()
+        first, second = await asyncio.gather(
+            client.call_tool("tool_a", {}),
+            client.call_tool("tool_b", {}),
+        )
+
+        assert first == [{"text": "tool_a"}]
+        assert second == [{"text": "tool_b"}]
+
+    @pytest.mark.anyio
+    async def test_in_flight_requests_are_bounded(self, monkeypatch):
+        """MCP_MAX_INFLIGHT caps how many requests are outstanding at once."""
+        import json as json_module
+
+        monkeypatch.setenv("MCP_MAX_INFLIGHT", "1")
+        mock_process = MagicMock()
+        outgoing: asyncio.Queue[bytes] = asyncio.Queue()
+        written: list[dict] = []
+
+        def mock_write(data):
+            written.append(json_module.loads(data.decode()))
+
+        async def mock_drain():
+            pass
+
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.write = mock_write
+        mock_process.stdin.drain = mock_drain
+        mock_process.stdout = MagicMock()
+        mock_process.stdout.read = _as_read(outgoing.get)
+
+        def answer(request):
+            outgoing.put_nowait(json_module.dumps({"jsonrpc": "2.0", "id": request["id"], "result": {"content": []}}).encode() + b"\n")
+
+        client = StdioMcpClient(mock_process, "test-service")
+        client._initialized = True
+        calls = [asyncio.ensure_future(client.call_tool(f"tool_{i}", {})) for i in range(2)]
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert len(written) == 1
+        assert client.inflight_count == 1
+        answer(written[0])
+        while len(written) < 2:
+            await asyncio.sleep(0)
+        answer(written[1])
+
+        assert await asyncio.gather(*calls) == [[], []]
+        assert client.inflight_count == 0
+
+    @pytest.mark.anyio
+    async def test_concurrent_first_calls_share_one_initialize(self):
+        """Concurrent first calls should wait on a single initialize handshake."""
+        import json as json_module
+
+        mock_process = MagicMock()
+        outgoing: asyncio.Queue[bytes] = asyncio.Queue()
+        methods: list[str] = []
+
+        def mock_write(data):
+            request = json_module.loads(data.decode())
+            methods.append(request["method"])
+            outgoing.put_nowait(json_module.dumps({"jsonrpc": "2.0", "id": request["id"], "result": {}}).encode() + b"\n")
+
+        async def mock_drain():
+            pass
+
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.write = mock_write
+        mock_process.stdin.drain = mock_drain
+        mock_process.stdout = MagicMock()
+        mock_process.stdout.read = _as_read(outgoing.get)
+
+        client = StdioMcpClient(mock_process, "test-service")
+        await asyncio.gather(*(client.call_tool(f"tool_{i}", {}) for i in range(3)))
+
+        assert methods.count("initialize") == 1
+        assert methods.count("tools/call") == 3
+
+    @pytest.mark.anyio
+    async def test_call_tools_batch_sends_one_array_and_demultiplexes(self):
+        """Servers advertising batch support get one JSON-RPC array mapped back by id."""
+        import json as json_module
+
+        mock_process = MagicMock()
+        outgoing: asyncio.Queue[bytes] = asyncio.Queue()
+        writes: list = []
+        init_result = {"capabilities": {"experimental": {"jsonrpcBatch": True}}}
+
+        def mock_write(data):
+            payload = json_module.loads(data.decode())
+            writes.append(payload)
+            if isinstance(payload, dict):
+                outgoing.put_nowait(json_module.dumps({"jsonrpc": "2.0", "id": payload["id"], "result": init_result}).encode() + b"\n")
+                return
+            responses = [
+                {"jsonrpc": "2.0", "id": req["id"], "result": {"content": [{"text": req["params"]["name"]}]}}
+                for req in reversed(payload)
+            ]
+            responses[0] = {"jsonrpc": "2.0", "id": payload[-1]["id"], "error": {"code": -32000, "message": "boom"}}
+            outgoing.put_nowait(json_module.dumps(responses).encode() + b"\n")
+
+        async def mock_drain():
+            pass
+
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.write = mock_write
+        mock_process.stdin.drain = mock_drain
+        mock_process.stdout = MagicMock()
+        mock_process.stdout.read = _as_read(outgoing.get)
+
+        client = StdioMcpClient(mock_process, "test-service")
+        results = await client.call_tools_batch([("tool_a", {}), ("tool_b", {}), ("tool_c", {})])
+
+        assert len(writes) == 2  # initialize + one batch array
+        assert isinstance(writes[1], list) and len(writes[1]) == 3
+        assert results[0] == [{"text": "tool_a"}]
+        assert results[1] == [{"text": "tool_b"}]
+        assert "boom" in str(results[2])
+
+    @pytest.mark.anyio
+    async def test_batch_falls_back_to_single_requests_when_rejected(self, monkeypatch):
+        """Servers answering a batch with an id-less error should get single requests."""
+        import json as json_module
+
+        monkeypatch.setenv("MCP_JSONRPC_BATCH", "1")
+        mock_process = MagicMock()
+        outgoing: asyncio.Queue[bytes] = asyncio.Queue()
+        writes: list = []
+
+        def mock_write(data):
+            payload = json_module.loads(data.decode())
+            writes.append(payload)
+            if isinstance(payload, list):
+                error = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+                outgoing.put_nowait(json_module.dumps(error).encode() + b"\n")
+                return
+            result = {"content": [{"text": "body"}]}
+            outgoing.put_nowait(json_module.dumps({"jsonrpc": "2.0", "id": payload["id"], "result": result}).encode() + b"\n")
+
+        async def mock_drain():
+            pass
+
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.write = mock_write
+        mock_process.stdin.drain = mock_drain
+        mock_process.stdout = MagicMock()
+        mock_process.stdout.read = _as_read(outgoing.get)
+
+        client = StdioMcpClient(mock_process, "test-service")
+        first = await client.call_tools_batch([("tool_a", {}), ("tool_b", {})])
+        second = await client.call_tools_batch([("tool_c", {}), ("tool_d", {})])
+
+        assert first == [[{"text": "body"}]] * 2
+        assert second == [[{"text": "body"}]] * 2
+        # initialize, rejected batch, two singles, then two singles without retrying the batch
+        assert [isinstance(w, list) for w in writes] == [False, True, False, False, False, False]
+
+    @pytest.mark.anyio
+    async def test_batch_calls_go_out_as_single_requests_without_opt_in(self, monkeypatch):
+        """Servers that have not opted in never see a batch array."""
+        import json as json_module
+
+        monkeypatch.delenv("MCP_JSONRPC_BATCH", raising=False)
+        mock_process = MagicMock()
+        outgoing: asyncio.Queue[bytes] = asyncio.Queue()
+        writes: list = []
+
+        def mock_write(data):
+            payload = json_module.loads(data.decode())
+            writes.append(payload)
+            result = {"content": [{"text": payload["params"].get("name", "")}]}
+            outgoing.put_nowait(json_module.dumps({"jsonrpc": "2.0", "id": payload["id"], "result": result}).encode() + b"\n")
+
+        async def mock_drain():
+            pass
+
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.write = mock_write
+        mock_process.stdin.drain = mock_drain
+        mock_process.stdout = MagicMock()
+        mock_process.stdout.read = _as_read(outgoing.get)
+
+        client = StdioMcpClient(mock_process, "test-service")
+        results = await client.call_tools_batch([("tool_a", {}), ("tool_b", {})])
+
+        assert results == [[{"text": "tool_a"}], [{"text": "tool_b"}]]
+        assert not any(isinstance(w, list) for w in writes)
+
+    @pytest.mark.anyio
+    async def test_github_combined_search_sends_concurrent_single_requests(self, monkeypatch):
+        """Code, issue and PR searches should be in flight together as single requests."""
+        import json as json_module
+
+        from app.mcp_runners import create_github_combined_search_runner
+
+        monkeypatch.delenv("MCP_JSONRPC_BATCH", raising=False)
+        mock_process = MagicMock()
+        outgoing: asyncio.Queue[bytes] = asyncio.Queue()
+        writes: list = []
+        held: list = []
+
+        def mock_write(data):
+            payload = json_module.loads(data.decode())
+            writes.append(payload)
+            if payload["method"] == "initialize":
+                outgoing.put_nowait(json_module.dumps({"jsonrpc": "2.0", "id": payload["id"], "result": {}}).encode() + b"\n")
+                return
+            arguments = payload["params"]["arguments"]
+            item = {"title": f'{payload["params"]["name"]} {arguments["q"]}', "url": "https://github.com/o/r"}
+            held.append({"jsonrpc": "2.0", "id": payload["id"], "result": {"content": [item]}})
+            if len(held) == 3:
+                # Only answer once all three searches have been sent
+                for response in reversed(held):
+                    outgoing.put_nowait(json_module.dumps(response).encode() + b"\n")
+
+        async def mock_drain():
+            pass
+
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.write = mock_write
+        mock_process.stdin.drain = mock_drain
+        mock_process.stdout = MagicMock()
+        mock_process.stdout.read = _as_read(outgoing.get)
+
+        runner = create_github_combined_search_runner(StdioMcpClient(mock_process, "github"))
+        results = await asyncio.wait_for(runner({"query": "bug", "max_results": 5}), timeout=5)
+
+        assert not any(isinstance(w, list) for w in writes)
+        assert [w["params"]["name"] for w in writes[1:]] == ["search_code", "search_issues", "search_issues"]
+        assert [r["title"] for r in results] == [
+            "search_issues bug is:issue",
+            "search_issues bug is:pr",
+            "search_code bug",
+        ]
+
+    @pytest.mark.anyio
+    async def test_reader_handles_frames_split_across_chunks(self):
+        """Frames split over reads or sharing one read should both be decoded."""
+        mock_process = MagicMock()
+        stdout = asyncio.StreamReader()
+        init = b'{"jsonrpc": "2.0", "id": 1, "result": {}}\n'
+        tool = b'{"jsonrpc": "2.0", "id": 2, "result": {"content": [{"text": "split"}]}}\n'
+
+        def mock_write(data):
+            if b'"initialize"' in data:
+                stdout.feed_data(init + tool[:10])
+            else:
+                stdout.feed_data(tool[10:])
+
+        async def mock_drain():
+            pass
+
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.write = mock_write
+        mock_process.stdin.drain = mock_drain
+        mock_process.stdout = stdout
+
+        client = StdioMcpClient(mock_process, "test-service")
+        result = await client.call_tool("tool", {})
+
+        assert result == [{"text": "split"}]
+
+    @pytest.mark.anyio
+    async def test_aclose_stops_reader_and_fails_pending_requests(self):
+        """aclose cancels the reader task and releases in-flight callers."""
+        from app.mcp_runners import McpClientError
+
+        mock_process = MagicMock()
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.write = MagicMock()
+
+        async def mock_drain():
+            pass
+
+        mock_process.stdin.drain = mock_drain
+        never = asyncio.Event()
+
+        async def hang():
+            await never.wait()
+            return b""
+
+        mock_process.stdout.read = _as_read(hang)
+
+        client = StdioMcpClient(mock_process, "test-service")
+        call = asyncio.ensure_future(client.call_tool("search", {"query": "q"}))
+        while client._reader_task is None:
+            await asyncio.sleep(0)
+        reader = client._reader_task
+
+        await client.aclose()
+
+        with pytest.raises(McpClientError, match="connection closed"):
+            await call
+        assert reader.done()
+        assert client._pending == {}
+
+    @pytest.mark.anyio
+    async def test_small_writes_skip_drain_until_buffer_fills(self):
+        """drain() is only awaited once the transport buffer passes the threshold."""
+        mock_process = MagicMock()
+        mock_process.stdin = MagicMock()
+        drained = []
+
+        async def mock_drain():
+            drained.append(True)
+
+        mock_process.stdin.drain = mock_drain
+        mock_process.stdin.transport.get_write_buffer_size.return_value = 0
+
+        client = StdioMcpClient(mock_process, "test-service")
+        await client._send_notification("notifications/initialized")
+        assert drained == []
+
+        mock_process.stdin.transport.get_write_buffer_size.return_value = 2 << 20
+        await client._send_notification("notifications/initialized")
+        assert drained == [True]
+        assert mock_process.stdin.write.call_count == 2
+
+    @pytest.mark.anyio
+    async def test_cancelled_call_notifies_server(self):
+        """Cancelling a caller sends notifications/cancelled for its request id."""
+        import json as json_module
+
+        mock_process = MagicMock()
+        outgoing: asyncio.Queue[bytes] = asyncio.Queue()
+        writes: list = []
+
+        def mock_write(data):
+            payload = json_module.loads(data.decode())
+            writes.append(payload)
+            if payload.get("method") == "initialize":
+                outgoing.put_nowait(json_module.dumps({"jsonrpc": "2.0", "id": payload["id"], "result": {}}).encode() + b"\n")
+
+        async def mock_drain():
+            pass
+
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.write = mock_write
+        mock_process.stdin.drain = mock_drain
+        mock_process.stdout = MagicMock()
+        mock_process.stdout.read = _as_read(outgoing.get)
+
+        client = StdioMcpClient(mock_process, "test-service")
+        call = asyncio.ensure_future(client.call_tool("search_code", {"q": "x"}))
+        while not any(w.get("method") == "tools/call" for w in writes):
+            await asyncio.sleep(0)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+        tool_call = next(w for w in writes if w.get("method") == "tools/call")
+        assert writes[-1] == {
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": tool_call["id"], "reason": "cancelled by client"},
+        }
+        assert client._pending == {}
+
     @pytest.mark.anyio
     async def test_read_resource_returns_text_content(self):
         """read_resource should return text content from resources/read response."""
@@ -145,7 +546,7 @@ class TestStdioMcpClient:
             return next(response_iter).encode()
 
         mock_process.stdout = MagicMock()
-        mock_process.stdout.readline = mock_readline
+        mock_process.stdout.read = _as_read(mock_readline)
 
         client = StdioMcpClient(mock_process, "test-service")
         result = await client.read_resource("gdrive:///file123")
@@ -188,13 +589,94 @@ class TestStdioMcpClient:
             return next(response_iter).encode()
 
         mock_process.stdout = MagicMock()
-        mock_process.stdout.readline = mock_readline
+        mock_process.stdout.read = _as_read(mock_readline)
 
         client = StdioMcpClient(mock_process, "test-service")
         result = await client.read_resource("gdrive:///file123")
 
         assert result == "Binary file content"
 
+    @pytest.mark.anyio
+    async def test_read_resource_replaces_invalid_utf8_in_blobs(self):
+        """Invalid UTF-8 in blob content is replaced instead of failing the read."""
+        import base64
+
+        mock_process = MagicMock()
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.write = MagicMock()
+
+        async def mock_drain():
+            pass
+
+        mock_process.stdin.drain = mock_drain
+
+        blob_content = base64.b64encode(b"\xffPDF").decode()
+        blob_response = (
+            '{"jsonrpc": "2.0", "id": %d, "result": {"contents": '
+            f'[{{"uri": "gdrive:///file123", "blob": "{blob_content}"}}]}}}}\n'
+        )
+        responses = iter([
+            '{"jsonrpc": "2.0", "id": 1, "result": {"capabilities": {}}}\n',
+            blob_response % 2,
+        ])
+
+        async def mock_readline():
+            return next(responses).encode()
+
+        mock_process.stdout = MagicMock()
+        mock_process.stdout.read = _as_read(mock_readline)
+
+        client = StdioMcpClient(mock_process, "test-service")
+
+        assert await client.read_resource("gdrive:///file123") == "\ufffdPDF"
+
+    @pytest.mark.anyio
+    async def test_read_resource_joins_chunked_contents(self):
+        """Multiple contents entries are concatenated in order."""
+        import base64
+
+        mock_process = MagicMock()
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.write = MagicMock()
+
+        async def mock_drain():
+            pass
+
+        mock_process.stdin.drain = mock_drain
+
+        first = base64.b64encode("前半".encode()).decode()
+        second = base64.b64encode(b" and more").decode()
+        contents = [
+            {"uri": "gdrive:///file123", "blob": first},
+            {"uri": "gdrive:///file123", "blob": second},
+        ]
+        responses = iter([
+            {"jsonrpc": "2.0", "id": 1, "result": {"capabilities": {}}},
+            {"jsonrpc": "2.0", "id": 2, "result": {"contents": contents}},
+            {"jsonrpc": "2.0", "id": 3, "result": {"contents": [*contents, {"text": "!"}]}},
+        ])
+
+        async def mock_readline():
+            return (json.dumps(next(responses)) + "\n").encode()
+
+        mock_process.stdout = MagicMock()
+        mock_process.stdout.read = _as_read(mock_readline)
+
+        client = StdioMcpClient(mock_process, "test-service")
+
+        assert await client.read_resource("gdrive:///file123") == "前半 and more"
+        assert await client.read_resource("gdrive:///file123") == "前半 and more!"
+
+    def test_blob_is_released_from_the_response_once_decoded(self):
+        """The base64 text should not stay referenced by the response dict."""
+        import base64
+
+        client = StdioMcpClient(MagicMock(), "test-service")
+        content = {"uri": "gdrive:///file123", "blob": base64.b64encode(b"payload").decode()}
+
+        assert client._resource_text({"contents": [content]}) == "payload"
+        assert "blob" not in content
+
     @pytest.mark.anyio
     async def test_read_resource_raises_error_on_empty_contents(self):
         """read_resource should raise McpClientError when contents is empty."""
@@ -219,7 +701,7 @@ class TestStdioMcpClient:
             return next(response_iter).encode()
 
         mock_process.stdout = MagicMock()
-        mock_process.stdout.readline = mock_readline
+        mock_process.stdout.read = _as_read(mock_readline)
 
         client = StdioMcpClient(mock_process, "test-service")
 
@@ -252,7 +734,7 @@ class TestStdioMcpClient:
             return next(response_iter).encode()
 
         mock_process.stdout = MagicMock()
-        mock_process.stdout.readline = mock_readline
+        mock_process.stdout.read = _as_read(mock_readline)
 
         client = StdioMcpClient(mock_process, "test-service")
 
@@ -294,6 +776,95 @@ class TestMcpRunnersFromProcesses:
         assert "gdrive.__read_resource__" in fetch_runners
 
 
+    @pytest.mark.anyio
+    async def test_prewarm_initializes_concurrently_and_drops_failures(self):
+        """prewarm runs every handshake up front and skips services that fail."""
+
+        def make_process(response: bytes):
+            process = MagicMock()
+            process.stdin = MagicMock()
+            process.stdin.write = MagicMock()
+
+            async def drain():
+                pass
+
+            process.stdin.drain = drain
+            frames = [response]
+
+            async def next_chunk():
+                await asyncio.sleep(0)
+                return frames.pop(0) if frames else b""
+
+            process.stdout.read = _as_read(next_chunk)
+            return process
+
+        ok = b'{"jsonrpc": "2.0", "id": 1, "result": {"capabilities": {}}}\n'
+        failed = b'{"jsonrpc": "2.0", "id": 1, "error": {"code": -32603, "message": "boom"}}\n'
+        processes = {"slack": make_process(ok), "github": make_process(failed)}
+
+        search_runners, fetch_runners = await create_mcp_runners_from_processes(
+            processes, prewarm=True
+        )
+
+        assert "slack" in search_runners
+        assert "slack" in fetch_runners
+        assert "github" not in search_runners
+        assert "github" not in fetch_runners
+        for process in processes.values():
+            assert process.stdin.write.call_count == 1
+
+    @pytest.mark.anyio
+    async def test_prewarm_handshake_timeout_is_the_readiness_check(self):
+        """A server that never answers initialize is dropped after handshake_timeout."""
+        process = MagicMock()
+        process.stdin = MagicMock()
+        process.stdin.write = MagicMock()
+
+        async def drain():
+            pass
+
+        async def silent_read():
+            await asyncio.sleep(10)
+            return b""
+
+        process.stdin.drain = drain
+        process.stdout.read = _as_read(silent_read)
+
+        started = time.monotonic()
+        search_runners, _ = await create_mcp_runners_from_processes(
+            {"slack": process}, prewarm=True, handshake_timeout=0.05
+        )
+
+        assert search_runners == {}
+        assert time.monotonic() - started < 1.0
+
+
+    def test_registration_plan_is_memoized_with_interned_keys(self):
+        """Runner keys are computed once per server name and interned."""
+        from app.mcp_runners import _plan_registration
+
+        plan = _plan_registration("".join(["dr", "ive"]))
+
+        assert _plan_registration("drive") is plan
+        assert plan.search_keys == ("gdrive", "drive")
+        for key, _ in plan.fetch_keys:
+            assert sys.intern(key) is key
+
+    @pytest.mark.anyio
+    async def test_default_searches_skip_alias_runners(self):
+        """The no-LLM fallback queries each server once, under its canonical name."""
+        from app.mcp_runners import _default_searches
+
+        search_runners, _ = await create_mcp_runners_from_processes(
+            {"drive": MagicMock(), "slack": MagicMock()}
+        )
+        assert "drive" in search_runners and "gdrive" in search_runners
+
+        searches = _default_searches(search_runners, "q")
+
+        assert sorted(s["service"] for s in searches) == ["gdrive", "slack"]
+
+
 class TestFetchRunnerWithReadResource:
     """Test fetch runner using read_resource for resource-based services."""
 
@@ -323,7 +894,7 @@ class TestFetchRunnerWithReadResource:
             return next(response_iter).encode()
 
         mock_process.stdout = MagicMock()
-        mock_process.stdout.readline = mock_readline
+        mock_process.stdout.read = _as_read(mock_readline)
 
         client = StdioMcpClient(mock_process, "gdrive")
         fetch_runner = create_fetch_runner(client, "gdrive", None)
@@ -644,6 +1215,7 @@ class TestOneshotWithAutoMcpServers:
                 "テストクエリ",
                 force_mock=True,
                 llm_client=None,
+                eager=True,
             )
         )
 
@@ -681,3 +1253,341 @@ class TestOneshotWithAutoMcpServers:
             assert hasattr(result, "links")
             assert hasattr(result, "documents")
 
+
+    @pytest.mark.anyio
+    async def test_pooled_sessions_are_reused_across_queries(self, monkeypatch):
+        """
+        Scenario: プールを使うと 2 回目のクエリでサーバーを再起動しない
+
+        Given: McpSessionPool が渡されている
+        When: run_oneshot_with_mcp を 2 回実行する
+        Then: MCP サーバーの起動は 1 回だけで、aclose で停止される
+        """
+        import app.mcp_runners as mcp_runners_module
+
+        launches = []
+        real_launch = mcp_runners_module.launch_services_async
+
+        async def counting_launch(*args, **kwargs):
+            statuses = await real_launch(*args, **kwargs)
+            launches.append(statuses)
+            return statuses
+
+        monkeypatch.setattr(mcp_runners_module, "launch_services_async", counting_launch)
+        pool = mcp_runners_module.McpSessionPool()
+
+        try:
+            for _ in range(2):
+                await mcp_runners_module.run_oneshot_with_mcp(
+                    "設計ドキュメント",
+                    force_mock=True,
+                    llm_client=None,
+                    pool=pool,
+                )
+        finally:
+            await pool.aclose()
+
+        # Servers start lazily, one launch per service, and only once across queries
+        launched = [name for statuses in launches for name in statuses]
+        assert launched
+        assert len(launched) == len(set(launched))
+        processes = [
+            status.process
+            for statuses in launches
+            for status in statuses.values()
+            if status.process is not None
+        ]
+        assert processes
+        assert all(process.returncode is not None for process in processes)
+
+    @pytest.mark.anyio
+    async def test_search_generation_overlaps_eager_server_launch(self, monkeypatch):
+        """
+        Scenario: LLM による検索パラメータ生成はサーバー起動と並行して進む
+
+        Given: eager モードでサーバー起動に時間がかかる
+        When: LLM クライアント付きで run_oneshot_with_mcp を実行する
+        Then: 起動完了を待たずに検索パラメータ生成が始まる
+        """
+        import threading
+
+        import app.llm_search as llm_search_module
+        import app.mcp_runners as mcp_runners_module
+        from app.llm_search import SearchGenerationResult
+
+        events = []
+        generation_started = threading.Event()
+
+        async def slow_launch(definitions, resolved, **kwargs):
+            events.append("launch-start")
+            await asyncio.to_thread(generation_started.wait, 2.0)
+            events.append("launch-end")
+            return {}
+
+        def fake_generate(query, llm_client):
+            events.append("generate")
+            generation_started.set()
+            return SearchGenerationResult(searches=[], alternatives=[])
+
+        monkeypatch.setattr(mcp_runners_module, "launch_services_async", slow_launch)
+        monkeypatch.setattr(llm_search_module, "generate_search_parameters", fake_generate)
+
+        result = await mcp_runners_module.run_oneshot_with_mcp(
+            "設計ドキュメント",
+            force_mock=True,
+            llm_client=object(),
+            eager=True,
+        )
+
+        assert result is None
+        assert events.index("generate") < events.index("launch-end")
+
+    @pytest.mark.anyio
+    async def test_prewarm_starts_listed_servers_into_the_pool(self, tmp_path):
+        """
+        Scenario: servers.yaml の prewarm に挙げたサーバーだけを事前起動する
+
+        Given: prewarm: [slack] の設定
+        When: prewarm_mcp_session を呼び出す
+        Then: プールのセッションで slack だけが起動済みになる
+        """
+        import app.mcp_runners as mcp_runners_module
+        from app.config import DEFAULT_CONFIG_PATH
+
+        config_path = tmp_path / "servers.yaml"
+        config_path.write_text(
+            DEFAULT_CONFIG_PATH.read_text().replace("prewarm: []", "prewarm: [slack]")
+        )
+        pool = mcp_runners_module.McpSessionPool()
+
+        try:
+            await mcp_runners_module.prewarm_mcp_session(
+                force_mock=True, config_path=config_path, pool=pool
+            )
+            (session,) = pool._sessions.values()
+            assert set(session.processes) == {"slack"}
+            assert session.processes["slack"].returncode is None
+        finally:
+            await pool.aclose()
+
+    @pytest.mark.anyio
+    async def test_lazy_session_starts_only_the_queried_service(self):
+        """
+        Scenario: 遅延起動では呼び出されたサービスのサーバーだけが起動する
+
+        Given: mock 設定の全サービスが遅延セッションに登録されている
+        When: slack の検索ランナーだけを呼び出す
+        Then: slack のサーバーだけが起動し、他のサービスは起動しない
+        """
+        import app.mcp_runners as mcp_runners_module
+        from app.config import load_server_definitions, resolve_service_modes
+
+        definitions = load_server_definitions(None)
+        resolved = resolve_service_modes(definitions, force_mock=True, allow_real=False)
+
+        processes, search_runners, fetch_runners, _ = mcp_runners_module._lazy_mcp_session(
+            definitions, resolved, readiness_timeout=10.0
+        )
+        try:
+            assert processes == {}
+            assert {"slack", "github", "gdrive"} <= set(search_runners)
+            assert "slack" in fetch_runners
+
+            results = await search_runners["slack"]({"query": "設計", "max_results": 1})
+
+            assert isinstance(results, list)
+            assert set(processes) == {"slack"}
+        finally:
+            await mcp_runners_module._terminate_processes(processes)
+
+    @pytest.mark.anyio
+    async def test_lazy_session_retries_a_failed_launch(self, monkeypatch):
+        """
+        Scenario: 起動に失敗したサービスは次の呼び出しで再起動を試みる
+
+        Given: slack の初回起動が失敗する遅延セッション
+        When: 検索ランナーを 2 回呼び出す
+        Then: 1 回目は失敗し、2 回目はサーバーを起動して結果を返す
+        """
+        import app.mcp_runners as mcp_runners_module
+        from app.config import load_server_definitions, resolve_service_modes
+        from app.mcp_runners import McpClientError
+        from app.process import RuntimeStatus
+
+        definitions = load_server_definitions(None)
+        resolved = resolve_service_modes(definitions, force_mock=True, allow_real=False)
+        real_launch = mcp_runners_module.launch_services_async
+        attempts = []
+
+        async def flaky_launch(definitions, resolved, **kwargs):
+            attempts.append(set(definitions))
+            if len(attempts) == 1:
+                (name,) = definitions
+                return {name: RuntimeStatus(name, resolved[name].selected_mode, None, None, False, error="boom")}
+            return await real_launch(definitions, resolved, **kwargs)
+
+        monkeypatch.setattr(mcp_runners_module, "launch_services_async", flaky_launch)
+        processes, search_runners, _, _ = mcp_runners_module._lazy_mcp_session(
+            definitions, resolved, readiness_timeout=10.0
+        )
+        try:
+            with pytest.raises(McpClientError, match="boom"):
+                await search_runners["slack"]({"query": "設計", "max_results": 1})
+            assert processes == {}
+
+            results = await search_runners["slack"]({"query": "設計", "max_results": 1})
+
+            assert isinstance(results, list)
+            assert len(attempts) == 2
+            assert set(processes) == {"slack"}
+        finally:
+            await mcp_runners_module._terminate_processes(processes)
+
+    @pytest.mark.anyio
+    async def test_lazy_oneshot_returns_none_when_no_server_starts(self, monkeypatch):
+        """
+        Scenario: 遅延起動でもすべてのサーバーが起動できなければ None を返す
+
+        Given: どのサービスも起動に失敗する
+        When: run_oneshot_with_mcp を遅延起動で実行する
+        Then: パイプラインは実行されず None が返される
+        """
+        import app.mcp_runners as mcp_runners_module
+        from app.process import RuntimeStatus
+
+        async def failing_launch(definitions, resolved, **kwargs):
+            return {
+                name: RuntimeStatus(name, resolved[name].selected_mode, None, None, False, error="boom")
+                for name in resolved
+            }
+
+        monkeypatch.setattr(mcp_runners_module, "launch_services_async", failing_launch)
+
+        result = await mcp_runners_module.run_oneshot_with_mcp("設計", force_mock=True)
+
+        assert result is None
+
+    @pytest.mark.anyio
+    async def test_single_use_session_waits_for_pending_launches_before_teardown(self, monkeypatch):
+        """
+        Scenario: セッション終了時に起動途中のサーバーも停止される
+
+        Given: 呼び出し元がキャンセルされ、起動だけが続いている遅延セッション
+        When: セッションを閉じる
+        Then: 起動完了を待ってからそのサーバーも停止される
+        """
+        import app.mcp_runners as mcp_runners_module
+        from app.config import load_server_definitions, resolve_service_modes
+
+        definitions = load_server_definitions(None)
+        resolved = resolve_service_modes(definitions, force_mock=True, allow_real=False)
+        real_launch = mcp_runners_module.launch_services_async
+        launched = []
+        entered = asyncio.Event()
+
+        async def slow_launch(definitions, resolved, **kwargs):
+            entered.set()
+            await asyncio.sleep(0.1)
+            statuses = await real_launch(definitions, resolved, **kwargs)
+            launched.extend(status.process for status in statuses.values())
+            return statuses
+
+        monkeypatch.setattr(mcp_runners_module, "launch_services_async", slow_launch)
+
+        async with mcp_runners_module._single_use_session(
+            definitions, resolved, readiness_timeout=10.0
+        ) as runners:
+            search_runners, _ = runners
+            caller = asyncio.ensure_future(search_runners["slack"]({"query": "設計"}))
+            await entered.wait()
+            caller.cancel()
+
+        assert len(launched) == 1
+        assert launched[0].returncode is not None
+
+
+class TestTerminateProcesses:
+    """Test concurrent MCP server teardown."""
+
+    @pytest.mark.anyio
+    async def test_stops_all_processes_even_when_one_fails(self, monkeypatch):
+        """A failing child must not keep the others from being stopped."""
+        import app.mcp_runners as mcp_runners
+
+        real_wait_for = asyncio.wait_for
+
+        async def short_wait_for(aw, timeout):
+            return await real_wait_for(aw, timeout=0.05)
+
+        monkeypatch.setattr(mcp_runners.asyncio, "wait_for", short_wait_for)
+
+        class FakeProcess:
+            def __init__(self, *, hangs=False, fails=False):
+                self.returncode = None
+                self.hangs = hangs
+                self.fails = fails
+                self.killed = False
+                self.terminated = False
+
+            def terminate(self):
+                if self.fails:
+                    raise OSError("cannot signal")
+                self.terminated = True
+
+            def kill(self):
+                self.killed = True
+
+            async def wait(self):
+                if self.hangs and not self.killed:
+                    await asyncio.sleep(10)
+                self.returncode = 0
+                return 0
+
+        hung, failing, normal = FakeProcess(hangs=True), FakeProcess(fails=True), FakeProcess()
+
+        await mcp_runners._terminate_processes({"a": hung, "b": failing, "c": normal})
+
+        assert hung.terminated and hung.killed
+        assert normal.terminated and not normal.killed
+
+    @pytest.mark.anyio
+    async def test_closes_stdio_transports_after_stop(self):
+        """Stopped servers release their pipes instead of leaking transports."""
+        import app.mcp_runners as mcp_runners
+
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", "import sys; sys.stdin.read()",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        await mcp_runners._terminate_processes({"a": process})
+
+        assert process.returncode is not None
+        assert process.stdin.transport.is_closing()
+        assert process._transport.is_closing()
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(sys.platform != "linux", reason="F_SETPIPE_SZ is Linux-only")
+async def test_client_enlarges_stdio_pipe_buffers():
+    """StdioMcpClient grows both stdio pipes and the stdin write buffer limits."""
+    import fcntl
+
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", "import sys; sys.stdin.read()",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    try:
+        StdioMcpClient(process, "test-service")
+        assert process.stdin.transport.get_write_buffer_limits() == (1 << 16, 1 << 20)
+        for fd in (
+            process.stdin.transport.get_extra_info("pipe").fileno(),
+            process.stdout._transport.get_extra_info("pipe").fileno(),
+        ):
+            assert fcntl.fcntl(fd, getattr(fcntl, "F_GETPIPE_SZ", 1032)) > 64 * 1024
+    finally:
+        process.stdin.close()
+        await process.wait()
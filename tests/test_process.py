@@ -1,11 +1,19 @@
+import asyncio
 import json
 import textwrap
 from pathlib import Path
 
 import pytest
 
-from app.config import RunMode, load_server_definitions, resolve_service_modes
-from app.process import start_services
+from app.config import (
+    DEFAULT_LAUNCH_PARALLELISM,
+    RunMode,
+    load_launch_parallelism,
+    load_server_definitions,
+    resolve_service_modes,
+)
+import app.process as process_module
+from app.process import launch_services_async, start_services
 
 
 def _write_config(tmp_path: Path, yaml_text: str) -> Path:
@@ -175,3 +183,284 @@ def test_mock_mode_uses_mock_command(monkeypatch, tmp_path):
     assert github.mode is RunMode.MOCK
     assert github.command == [str(mock_exec), "--serve"]
     assert trace_file.read_text() == "mock-run"
+
+
+def test_stdio_buffer_limit_reads_env_and_ignores_bad_values(monkeypatch):
+    from app.process import DEFAULT_STDIO_BUFFER_BYTES, _stdio_buffer_limit
+
+    monkeypatch.delenv("MCP_STDIO_BUFFER_BYTES", raising=False)
+    assert _stdio_buffer_limit() == DEFAULT_STDIO_BUFFER_BYTES
+
+    monkeypatch.setenv("MCP_STDIO_BUFFER_BYTES", "1048576")
+    assert _stdio_buffer_limit() == 1048576
+
+    monkeypatch.setenv("MCP_STDIO_BUFFER_BYTES", "lots")
+    assert _stdio_buffer_limit() == DEFAULT_STDIO_BUFFER_BYTES
+
+
+def test_session_config_key_tracks_command_and_env(monkeypatch, tmp_path):
+    from app.process import session_config_key
+
+    runner = tmp_path / "runner.py"
+    runner.write_text("#!/usr/bin/env python3\n")
+    runner.chmod(0o755)
+    config_path = _write_config(
+        tmp_path,
+        f"""
+        services:
+          slack:
+            mode: mock
+            kind: binary
+            exec: {runner}
+            workdir: {tmp_path}
+            env:
+              SLACK_USER_TOKEN: ${{SLACK_USER_TOKEN}}
+            mock:
+              exec: {runner}
+              args: ["--mock"]
+              workdir: {tmp_path}
+        """,
+    )
+    definitions = load_server_definitions(config_path)
+    resolved = resolve_service_modes(definitions, force_mock=True, allow_real=False)
+
+    first = session_config_key(definitions, resolved, base_env={"SLACK_USER_TOKEN": "a"})
+
+    assert session_config_key(definitions, resolved, base_env={"SLACK_USER_TOKEN": "a"}) == first
+    assert session_config_key(definitions, resolved, base_env={"SLACK_USER_TOKEN": "b"}) != first
+
+
+def test_plan_launches_shares_env_and_reports_errors(tmp_path):
+    from app.process import CommandSpec, StartConfigurationError, plan_launches
+
+    runner = tmp_path / "runner.py"
+    runner.write_text("#!/usr/bin/env python3\n")
+    runner.chmod(0o755)
+    config_path = _write_config(
+        tmp_path,
+        f"""
+        services:
+          slack:
+            mode: mock
+            kind: binary
+            exec: {runner}
+            workdir: {tmp_path}
+            mock:
+              exec: {runner}
+              workdir: {tmp_path}
+          github:
+            mode: mock
+            kind: binary
+            exec: {runner}
+            workdir: {tmp_path}
+            mock:
+              exec: {runner}
+              args: ["--mock"]
+              workdir: {tmp_path}
+          jira:
+            mode: mock
+            kind: binary
+            exec: {tmp_path / "missing.py"}
+            workdir: {tmp_path}
+            mock:
+              exec: {tmp_path / "missing.py"}
+              workdir: {tmp_path}
+        """,
+    )
+    definitions = load_server_definitions(config_path)
+    resolved = resolve_service_modes(definitions, force_mock=True, allow_real=False)
+
+    plans = plan_launches(definitions, resolved, base_env={"PATH": "/usr/bin"})
+
+    assert isinstance(plans["slack"], CommandSpec)
+    assert isinstance(plans["github"], CommandSpec)
+    assert plans["slack"].env is plans["github"].env
+    assert isinstance(plans["jira"], StartConfigurationError)
+
+
+def test_launch_failure_does_not_hide_other_services(monkeypatch, tmp_path):
+    config_path = _write_config(
+        tmp_path,
+        """
+        services:
+          slack:
+            mode: mock
+            kind: python
+            exec: python
+            args: []
+            env: {}
+          github:
+            mode: mock
+            kind: python
+            exec: python
+            args: []
+            env: {}
+        """,
+    )
+    definitions = load_server_definitions(config_path)
+    resolved = resolve_service_modes(definitions, force_mock=True, allow_real=True)
+
+    async def fake_start(name, decision, definition, default_env, readiness_timeout, wait_for_output=True, spec=None):
+        if name == "slack":
+            raise RuntimeError("boom")
+        return process_module.RuntimeStatus(
+            name=name, mode=decision.selected_mode, command=["python"], process=None, ready=True
+        )
+
+    monkeypatch.setattr(process_module, "_start_service_async", fake_start)
+
+    statuses = asyncio.run(launch_services_async(definitions, resolved))
+
+    assert statuses["slack"].error == "boom"
+    assert statuses["slack"].ready is False
+    assert statuses["github"].ready is True
+
+
+def test_launch_parallelism_caps_concurrent_starts(monkeypatch, tmp_path):
+    config_path = _write_config(
+        tmp_path,
+        """
+        launch_parallelism: 2
+        services:
+          slack: {mode: mock, exec: python}
+          github: {mode: mock, exec: python}
+          gdrive: {mode: mock, exec: python}
+          jira: {mode: mock, exec: python}
+        """,
+    )
+    definitions = load_server_definitions(config_path)
+    resolved = resolve_service_modes(definitions, force_mock=True, allow_real=True)
+    parallelism = load_launch_parallelism(config_path)
+    active = peak = 0
+
+    async def fake_start(name, decision, definition, default_env, readiness_timeout, wait_for_output=True, spec=None):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return process_module.RuntimeStatus(
+            name=name, mode=decision.selected_mode, command=["python"], process=None, ready=True
+        )
+
+    monkeypatch.setattr(process_module, "_start_service_async", fake_start)
+
+    statuses = asyncio.run(
+        launch_services_async(definitions, resolved, max_parallel_launches=parallelism)
+    )
+
+    assert parallelism == 2
+    assert peak == 2
+    assert all(status.ready for status in statuses.values())
+
+
+def test_single_service_launch_runs_in_the_callers_task(monkeypatch, tmp_path):
+    config_path = _write_config(tmp_path, "services:\n  slack: {mode: mock, exec: python}\n")
+    definitions = load_server_definitions(config_path)
+    resolved = resolve_service_modes(definitions, force_mock=True, allow_real=True)
+    launch_tasks = []
+
+    async def fake_start(name, decision, definition, default_env, readiness_timeout, wait_for_output=True, spec=None):
+        launch_tasks.append(asyncio.current_task())
+        return process_module.RuntimeStatus(
+            name=name, mode=decision.selected_mode, command=["python"], process=None, ready=True
+        )
+
+    monkeypatch.setattr(process_module, "_start_service_async", fake_start)
+
+    async def scenario():
+        statuses = await launch_services_async(definitions, resolved)
+        return statuses, asyncio.current_task()
+
+    statuses, caller_task = asyncio.run(scenario())
+
+    assert statuses["slack"].ready is True
+    assert launch_tasks == [caller_task]
+
+
+def test_launch_parallelism_defaults_when_missing_or_invalid(tmp_path):
+    missing = _write_config(tmp_path, "services: {}\n")
+    assert load_launch_parallelism(missing) == DEFAULT_LAUNCH_PARALLELISM
+
+    invalid = tmp_path / "invalid.yaml"
+    invalid.write_text("launch_parallelism: many\n")
+    assert load_launch_parallelism(invalid) == DEFAULT_LAUNCH_PARALLELISM
+
+
+def test_executable_lookups_are_cached_per_path(monkeypatch, tmp_path):
+    process_module.clear_executable_cache()
+    calls = []
+
+    def fake_which(cmd, path=None):
+        calls.append((cmd, path))
+        return f"/opt/bin/{cmd}" if cmd == "uv" else None
+
+    monkeypatch.setattr(process_module.shutil, "which", fake_which)
+    try:
+        for _ in range(3):
+            assert process_module._resolve_executable("uv", tmp_path, {"PATH": "/opt/bin"}) == "/opt/bin/uv"
+        assert len(calls) == 1
+
+        # A different PATH is a different lookup, and misses are retried
+        process_module._resolve_executable("uv", tmp_path, {"PATH": "/usr/bin"})
+        for _ in range(2):
+            with pytest.raises(process_module.StartConfigurationError):
+                process_module._resolve_executable("node", tmp_path, {"PATH": "/opt/bin"})
+        assert len(calls) == 4
+    finally:
+        process_module.clear_executable_cache()
+
+
+def test_render_template_substitutes_placeholders():
+    env = {"HOME": "/home/me", "TOKEN": "t"}
+
+    assert process_module._render_template("plain", env) == "plain"
+    assert process_module._render_template("${HOME}/bin:${TOKEN}!", env) == "/home/me/bin:t!"
+    assert process_module._render_template("a${MISSING}b", env, allow_missing=True) == "ab"
+    with pytest.raises(process_module.StartConfigurationError):
+        process_module._render_template("${MISSING}", env)
+
+
+def test_permanent_failure_detects_keywords_case_insensitively():
+    assert process_module._is_permanent_failure("Error: UNAUTHORIZED (401)")
+    assert process_module._is_permanent_failure("Traceback...\nInvalid Token supplied")
+    assert not process_module._is_permanent_failure("Traceback...\nConnectionResetError")
+
+
+def test_merge_env_copies_base_once_and_defaults_unbuffered(monkeypatch):
+    base = {"HOME": "/home/me"}
+
+    merged = process_module._merge_env({"DATA": "${HOME}/data"}, base, allow_missing=False)
+
+    assert merged == {"PYTHONUNBUFFERED": "1", "HOME": "/home/me", "DATA": "/home/me/data"}
+    assert base == {"HOME": "/home/me"}
+    assert process_module._merge_env({}, {"PYTHONUNBUFFERED": "0"}, allow_missing=False) == {
+        "PYTHONUNBUFFERED": "0"
+    }
+
+    # The default environment is os.environ itself, so later changes are seen
+    monkeypatch.setenv("MCP_TEST_LATE_VALUE", "late")
+    assert process_module._build_default_env(None)["MCP_TEST_LATE_VALUE"] == "late"
+
+
+def test_config_parse_is_cached_until_the_file_changes(monkeypatch, tmp_path):
+    import app.config as config_module
+
+    config_path = _write_config(tmp_path, "services:\n  slack: {mode: mock, exec: python}\n")
+    parses = []
+    real_safe_load = config_module.yaml.safe_load
+
+    def counting_safe_load(text):
+        parses.append(text)
+        return real_safe_load(text)
+
+    monkeypatch.setattr(config_module.yaml, "safe_load", counting_safe_load)
+
+    assert set(load_server_definitions(config_path)) == {"slack"}
+    load_server_definitions(config_path)
+    load_launch_parallelism(config_path)
+    assert len(parses) == 1
+
+    config_path.write_text("services:\n  slack: {mode: mock, exec: python}\n  github: {mode: mock, exec: python}\n")
+    assert set(load_server_definitions(config_path)) == {"slack", "github"}
+    assert len(parses) == 2
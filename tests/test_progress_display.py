@@ -1,3 +1,5 @@
+import asyncio
+
 from rich.console import Console
 
 from app.progress_display import ProgressDisplay
@@ -54,3 +56,28 @@ def test_progress_display_skips_when_no_steps(monkeypatch):
     display.run([], delay=0.01)
 
     assert calls == []
+
+
+def test_progress_display_run_async_yields_between_steps(monkeypatch):
+    console = Console(force_terminal=True, color_system=None)
+    fake = _FakeStatus()
+    monkeypatch.setattr(console, "status", lambda message, spinner="dots": fake)
+    display = ProgressDisplay(console)
+    events: list[str] = []
+
+    async def ticker():
+        await asyncio.sleep(0)
+        events.append("tick")
+
+    async def progress():
+        await display.run_async(["step1", "step2"], delay=0.01)
+        events.append("done")
+
+    async def scenario():
+        await asyncio.gather(progress(), ticker())
+
+    asyncio.run(scenario())
+
+    assert fake.messages == ["step1", "step2"]
+    assert events == ["tick", "done"]
+    assert fake.exited == 1
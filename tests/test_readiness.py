@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from app.config import load_server_definitions, resolve_service_modes
+import app.process as process_module
 from app.process import launch_services_async
 
 
@@ -272,3 +273,56 @@ def test_readiness_timeout_produces_warning(tmp_path, caplog):
             await _cleanup(statuses)
 
     asyncio.run(_scenario())
+
+
+def test_stderr_is_tailed_in_the_background(tmp_path):
+    async def _scenario():
+        chatty = _script(
+            tmp_path / "chatty.py",
+            """
+            #!/usr/bin/env python3
+            import sys, time
+            for i in range(4000):
+                sys.stderr.write(f"log line {i:04d} " + "x" * 100 + "\\n")
+            sys.stderr.flush()
+            print("served", flush=True)
+            time.sleep(0.5)
+            """,
+        )
+        config_path = _write_config(
+            tmp_path,
+            f"""
+            services:
+              slack:
+                mode: mock
+                kind: python
+                exec: {sys.executable}
+                args: ["{chatty}"]
+                workdir: {tmp_path}
+                env: {{}}
+                mock:
+                  exec: {sys.executable}
+                  args: ["{chatty}"]
+                  workdir: {tmp_path}
+            """,
+        )
+
+        definitions = load_server_definitions(config_path)
+        resolved = resolve_service_modes(definitions, force_mock=True, allow_real=True)
+
+        statuses = await launch_services_async(definitions, resolved, wait_for_output=False)
+        try:
+            process = statuses["slack"].process
+            line = await asyncio.wait_for(process.stdout.readline(), timeout=5)
+            assert line.strip() == b"served"
+
+            process.kill()
+            await process.wait()
+            # Only the last lines are kept, not the whole ~450 KB stream
+            tail = await process_module._read_stderr(process)
+            assert tail.splitlines()[-1].startswith("log line 3999")
+            assert len(tail.splitlines()) == process_module.STDERR_TAIL_LINES
+        finally:
+            await _cleanup(statuses)
+
+    asyncio.run(_scenario())
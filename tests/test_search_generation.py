@@ -2,8 +2,12 @@ import json
 import os
 import pytest
 
+import app.llm_search as llm_search
 from app.llm_search import (
+    clear_search_cache,
     generate_search_parameters,
+    generate_search_parameters_cached,
+    set_search_cache_enabled,
     _apply_github_search_scope,
     _get_github_search_scope,
 )
@@ -231,3 +235,132 @@ class TestGitHubSearchScope:
 
         github_search = next(s for s in result.searches if s["service"] == "github")
         assert "repo:nob-ogura/mcp-workspace-finder" in github_search["query"]
+
+
+def test_cached_generation_skips_llm_for_repeated_question(tmp_path, monkeypatch):
+    payload = {
+        "searches": [
+            {"service": "slack", "query": "design review", "max_results": 3},
+            {"service": "github", "query": "design", "max_results": 2},
+            {"service": "gdrive", "query": "design docs", "max_results": 1},
+        ],
+        "alternatives": ["design review summary", "design doc"],
+    }
+    cache_path = tmp_path / "searches.json"
+    monkeypatch.setenv("MCP_SEARCH_CACHE_PATH", str(cache_path))
+    client = DummyClient([make_response(payload), make_response(payload)])
+
+    first = generate_search_parameters_cached("設計レビュー", client, services=["slack", "github"])
+    second = generate_search_parameters_cached("設計レビュー", client, services=["github", "slack"])
+    assert len(client.calls) == 1
+    assert second == first
+
+    # A fresh process reads the disk cache; a different service set misses it
+    clear_search_cache()
+    generate_search_parameters_cached("設計レビュー", client, services=["slack", "github"])
+    assert len(client.calls) == 1
+    generate_search_parameters_cached("設計レビュー", client, services=["slack"])
+    assert len(client.calls) == 2
+    assert len(json.loads(cache_path.read_text())) == 2
+
+
+def test_cached_generation_expires_after_ttl(tmp_path, monkeypatch):
+    payload = {
+        "searches": [
+            {"service": "slack", "query": "q", "max_results": 3},
+            {"service": "github", "query": "q", "max_results": 3},
+            {"service": "gdrive", "query": "q", "max_results": 3},
+        ],
+        "alternatives": ["a design", "b design"],
+    }
+    monkeypatch.setenv("MCP_SEARCH_CACHE_PATH", str(tmp_path / "searches.json"))
+    client = DummyClient([make_response(payload), make_response(payload)])
+    now = [1_000_000.0]
+    monkeypatch.setattr(llm_search.time, "time", lambda: now[0])
+
+    generate_search_parameters_cached("質問", client)
+    now[0] += llm_search.SEARCH_CACHE_TTL
+    generate_search_parameters_cached("質問", client)
+
+    assert len(client.calls) == 2
+
+
+def test_search_cache_can_be_disabled_and_is_keyed_by_prompt_version(tmp_path, monkeypatch):
+    payload = {
+        "searches": [
+            {"service": "slack", "query": "q", "max_results": 3},
+            {"service": "github", "query": "q", "max_results": 3},
+            {"service": "gdrive", "query": "q", "max_results": 3},
+        ],
+        "alternatives": ["a design", "b design"],
+    }
+    cache_path = tmp_path / "searches.json"
+    monkeypatch.setenv("MCP_SEARCH_CACHE_PATH", str(cache_path))
+    client = DummyClient([make_response(payload) for _ in range(5)])
+
+    monkeypatch.setenv("MCP_SEARCH_CACHE", "0")
+    generate_search_parameters_cached("質問", client)
+    generate_search_parameters_cached("質問", client)
+    assert len(client.calls) == 2
+    assert not cache_path.exists()
+    monkeypatch.delenv("MCP_SEARCH_CACHE")
+
+    set_search_cache_enabled(False)
+    try:
+        generate_search_parameters_cached("質問", client)
+    finally:
+        set_search_cache_enabled(True)
+    assert len(client.calls) == 3
+
+    generate_search_parameters_cached("質問", client)
+    generate_search_parameters_cached("質問", client)
+    assert len(client.calls) == 4
+
+    # A new prompt version must not reuse searches generated by the old one
+    monkeypatch.setattr(llm_search, "SEARCH_PROMPT_VERSION", llm_search.SEARCH_PROMPT_VERSION + 1)
+    generate_search_parameters_cached("質問", client)
+    assert len(client.calls) == 5
+
+
+def test_search_cache_stays_in_memory_unless_a_path_is_set(tmp_path, monkeypatch):
+    payload = {
+        "searches": [
+            {"service": "slack", "query": "q", "max_results": 3},
+            {"service": "github", "query": "q", "max_results": 3},
+            {"service": "gdrive", "query": "q", "max_results": 3},
+        ],
+        "alternatives": ["a design", "b design"],
+    }
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    client = DummyClient([make_response(payload), make_response(payload)])
+
+    generate_search_parameters_cached("質問", client)
+    generate_search_parameters_cached("質問", client)
+
+    assert len(client.calls) == 1
+    assert list(tmp_path.rglob("*")) == []
+
+
+def test_invalid_disk_cache_entries_are_regenerated(tmp_path, monkeypatch):
+    payload = {
+        "searches": [
+            {"service": "slack", "query": "q", "max_results": 3},
+            {"service": "github", "query": "q", "max_results": 3},
+            {"service": "gdrive", "query": "q", "max_results": 3},
+        ],
+        "alternatives": ["a design", "b design"],
+    }
+    cache_path = tmp_path / "searches.json"
+    monkeypatch.setenv("MCP_SEARCH_CACHE_PATH", str(cache_path))
+    key = llm_search.search_cache_key("質問", [])
+    tampered = {"service": "slack", "query": "q", "max_results": 99}
+    cache_path.write_text(
+        json.dumps({key: {"created_at": llm_search.time.time(), "searches": [tampered], "alternatives": []}})
+    )
+    client = DummyClient([make_response(payload)])
+
+    result = generate_search_parameters_cached("質問", client)
+
+    assert len(client.calls) == 1
+    assert result.searches[0]["max_results"] == 3
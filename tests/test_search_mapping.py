@@ -131,3 +131,29 @@ def test_gdrive_skips_fetch_when_search_url():
     assert gdrive.fetch_params == {}
     # Display URI should still be the search URL
     assert gdrive.uri == "https://drive.google.com/drive/search?q=Design%20Doc"
+
+
+def test_mapping_stops_reading_once_known_services_are_full():
+    consumed = []
+
+    def hits():
+        for index in range(10):
+            consumed.append(index)
+            yield {"service": "gdrive", "title": f"doc {index}", "uri": f"gdrive:///file{index}"}
+
+    mapped = map_search_results(hits(), services={"gdrive"})
+
+    assert [result.title for result in mapped] == ["doc 0", "doc 1", "doc 2"]
+    assert consumed == [0, 1, 2]
+
+
+def test_slack_permalink_parsing_handles_plain_and_decorated_links():
+    from app.search_mapping import _parse_slack_permalink
+
+    base = "https://team.slack.com/archives/C123ABC/p1234567890123456"
+
+    assert _parse_slack_permalink(base) == ("C123ABC", "1234567890.123456")
+    assert _parse_slack_permalink(base + "?thread_ts=1") == ("C123ABC", "1234567890.123456")
+    assert _parse_slack_permalink("https://team.slack.com/archives/c9/P12") == ("c9", "12")
+    assert _parse_slack_permalink("https://team.slack.com/archives/#general/p1") == ("", "")
+    assert _parse_slack_permalink("") == ("", "")
@@ -431,3 +431,286 @@ async def test_allow_real_prefers_real_without_override(monkeypatch, tmp_path, c
     assert output.documents and output.documents[0].content == "real-content"
     assert not any("CLI override" in warning for warning in output.warnings)
     assert all("CLI override" not in record.message for record in caplog.records)
+
+
+@pytest.mark.anyio("asyncio")
+async def test_missing_search_runner_fails_before_any_search_starts():
+    started: list[str] = []
+
+    async def search(params):
+        started.append(params["service"])
+        return []
+
+    with pytest.raises(ValueError, match="no search runner registered for gdrive"):
+        await run_search_and_fetch_pipeline(
+            _build_search_payloads(),
+            search_runners={"slack": search, "github": search},
+            fetch_runners={},
+        )
+
+    assert started == []
+
+
+@pytest.mark.anyio("asyncio")
+async def test_fetch_starts_before_slower_searches_finish():
+    events: list[str] = []
+
+    async def search(params):
+        service = params["service"]
+        await asyncio.sleep(0.2 if service == "github" else 0)
+        events.append(f"search:{service}")
+        return [{"service": service, "title": service, "uri": f"gdrive:///{service}"}]
+
+    async def fetch(result):
+        events.append(f"fetch:{result.service}")
+        return "body"
+
+    output = await run_search_and_fetch_pipeline(
+        [{"service": "gdrive", "query": "q"}, {"service": "github", "query": "q"}],
+        search_runners={"gdrive": search, "github": search},
+        fetch_runners={"gdrive": fetch},
+    )
+
+    assert events.index("fetch:gdrive") < events.index("search:github")
+    assert [document.service for document in output.documents] == ["gdrive", "github"]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_warnings_follow_payload_order_not_completion_order():
+    async def search(params):
+        service = params["service"]
+        await asyncio.sleep(0.05 if service == "slack" else 0)
+        raise RuntimeError(f"{service} broke")
+
+    output = await run_search_and_fetch_pipeline(
+        [{"service": "slack", "query": "q"}, {"service": "github", "query": "q"}],
+        search_runners={"slack": search, "github": search},
+        fetch_runners={},
+        initial_warnings=["pre"],
+    )
+
+    assert output.warnings[0] == "pre"
+    assert "slack broke" in output.warnings[1]
+    assert "github broke" in output.warnings[2]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_cap_and_dedup_follow_payload_order_not_completion_order():
+    async def search(params):
+        # The first payload's search finishes last
+        slow = params["query"] == "first"
+        await asyncio.sleep(0.05 if slow else 0)
+        names = ["a", "b", "c"] if slow else ["c", "d", "e"]
+        return [{"service": "gdrive", "title": name, "uri": f"gdrive:///{name}"} for name in names]
+
+    async def fetch(result):
+        return "body"
+
+    output = await run_search_and_fetch_pipeline(
+        [{"service": "gdrive", "query": "first"}, {"service": "gdrive", "query": "second"}],
+        search_runners={"gdrive": search},
+        fetch_runners={"gdrive": fetch},
+    )
+
+    assert [document.title for document in output.documents] == ["a", "b", "c"]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_cap_and_dedup_are_shared_across_payloads_by_hit_service():
+    async def search(params):
+        # The gdrive search also surfaces github hits, and finishes first
+        if params["service"] == "github":
+            await asyncio.sleep(0.05)
+            names = ["a", "b", "c"]
+        else:
+            names = ["c", "d", "e"]
+        return [
+            {"service": "github", "title": name, "uri": f"https://github.test/{name}", "owner": "org", "repo": "r", "path": name}
+            for name in names
+        ]
+
+    async def fetch(result):
+        return "body"
+
+    output = await run_search_and_fetch_pipeline(
+        [{"service": "github", "query": "q"}, {"service": "gdrive", "query": "q"}],
+        search_runners={"github": search, "gdrive": search},
+        fetch_runners={"github": fetch},
+    )
+
+    assert [document.title for document in output.documents] == ["a", "b", "c"]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_duplicate_fetch_targets_are_fetched_once():
+    fetch_calls: list[str] = []
+
+    async def search(params):
+        return [
+            {
+                "service": "github",
+                "title": params["query"],
+                "owner": "org",
+                "repo": "repo",
+                "path": "README.md",
+            }
+        ]
+
+    async def fetch(result):
+        fetch_calls.append(result.title)
+        await asyncio.sleep(0.01)
+        return "readme body"
+
+    output = await run_search_and_fetch_pipeline(
+        [{"service": "github", "query": "first"}, {"service": "github", "query": "second"}],
+        search_runners={"github": search},
+        fetch_runners={"github.get_file_contents": fetch},
+    )
+
+    assert len(fetch_calls) == 1
+    assert [document.title for document in output.documents] == ["first", "second"]
+    assert all(document.content == "readme body" for document in output.documents)
+
+
+@pytest.mark.anyio("asyncio")
+async def test_fetch_concurrency_is_capped_per_service():
+    active = peak = 0
+
+    async def search(params):
+        return [
+            {"service": "github", "title": f"file {index}", "owner": "org", "repo": "repo", "path": f"f{index}.md"}
+            for index in range(3)
+        ]
+
+    async def fetch(result):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return "body"
+
+    output = await run_search_and_fetch_pipeline(
+        [{"service": "github", "query": "q"}],
+        search_runners={"github": search},
+        fetch_runners={"github": fetch},
+        fetch_concurrency_per_service=2,
+    )
+
+    assert len(output.documents) == 3
+    assert peak == 2
+
+
+@pytest.mark.anyio("asyncio")
+async def test_results_with_the_same_uri_are_fetched_and_kept_once():
+    fetched_titles: list[str] = []
+
+    async def search(params):
+        return [
+            {"service": "gdrive", "title": "Spec", "uri": "gdrive:///spec"},
+            {"service": "gdrive", "title": "Spec (again)", "uri": "gdrive:///spec"},
+            {"service": "gdrive", "title": "Notes", "uri": "gdrive:///notes"},
+        ]
+
+    async def fetch(result):
+        fetched_titles.append(result.title)
+        return "body"
+
+    output = await run_search_and_fetch_pipeline(
+        [{"service": "gdrive", "query": "q"}],
+        search_runners={"gdrive": search},
+        fetch_runners={"gdrive": fetch},
+    )
+
+    assert [document.title for document in output.documents] == ["Spec", "Notes"]
+    assert sorted(fetched_titles) == ["Notes", "Spec"]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_fetched_content_is_reused_across_pipeline_runs():
+    from app.fetch_cache import set_fetch_cache_enabled
+
+    fetch_calls = 0
+
+    async def search(params):
+        return [{"service": "gdrive", "title": "Spec", "uri": "gdrive:///spec"}]
+
+    async def fetch(result):
+        nonlocal fetch_calls
+        fetch_calls += 1
+        return f"body {fetch_calls}"
+
+    async def run_once(scope="gdrive=mock:session"):
+        return await run_search_and_fetch_pipeline(
+            [{"service": "gdrive", "query": "q"}],
+            search_runners={"gdrive": search},
+            fetch_runners={"gdrive": fetch},
+            fetch_cache_scope=scope,
+        )
+
+    first = await run_once()
+    second = await run_once()
+    assert fetch_calls == 1
+    assert second.documents[0].content == first.documents[0].content == "body 1"
+
+    set_fetch_cache_enabled(False)
+    try:
+        third = await run_once()
+    finally:
+        set_fetch_cache_enabled(True)
+    assert fetch_calls == 2
+    assert third.documents[0].content == "body 2"
+
+    # Other modes or server configurations, and unscoped runs, fetch their own
+    assert (await run_once("gdrive=real:session")).documents[0].content == "body 3"
+    assert (await run_once(None)).documents[0].content == "body 4"
+    assert fetch_calls == 4
+
+
+def test_fetch_cache_scope_depends_on_modes_and_session_key():
+    from app.config import ResolvedService
+    from app.fetch_cache import fetch_cache_scope
+
+    def resolved(mode):
+        return {
+            "gdrive": ResolvedService(
+                name="gdrive",
+                declared_mode=RunMode.REAL,
+                selected_mode=mode,
+                missing_keys=[],
+                warning=None,
+            )
+        }
+
+    mock_scope = fetch_cache_scope(resolved(RunMode.MOCK), "abc")
+    assert mock_scope == fetch_cache_scope(resolved(RunMode.MOCK), "abc")
+    assert mock_scope != fetch_cache_scope(resolved(RunMode.REAL), "abc")
+    assert mock_scope != fetch_cache_scope(resolved(RunMode.MOCK), "def")
+
+
+@pytest.mark.anyio("asyncio")
+async def test_on_document_sees_documents_as_they_complete():
+    seen: list[str] = []
+
+    async def search(params):
+        return [
+            {"service": "gdrive", "title": "slow", "uri": "gdrive:///slow"},
+            {"service": "gdrive", "title": "fast", "uri": "gdrive:///fast"},
+        ]
+
+    async def fetch(result):
+        await asyncio.sleep(0.05 if result.title == "slow" else 0)
+        return result.title
+
+    async def on_document(document):
+        seen.append(document.title)
+
+    output = await run_search_and_fetch_pipeline(
+        [{"service": "gdrive", "query": "q"}],
+        search_runners={"gdrive": search},
+        fetch_runners={"gdrive": fetch},
+        on_document=on_document,
+    )
+
+    assert seen == ["fast", "slow"]
+    assert [document.title for document in output.documents] == ["slow", "fast"]
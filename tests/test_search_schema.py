@@ -28,3 +28,26 @@ def test_drive_missing_query_fails():
         validate_search_payload(payload)
 
     assert "query" in str(excinfo.value)
+
+
+def test_validation_does_not_read_schema_files(monkeypatch):
+    reads = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self.name)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    for _ in range(3):
+        validate_search_payload({"service": "slack", "query": "design"})
+
+    assert reads == []
+
+
+def test_unsupported_service_fails():
+    with pytest.raises(ValueError) as excinfo:
+        validate_search_payload({"service": "jira", "query": "bug"})
+
+    assert "Unsupported service" in str(excinfo.value)
@@ -152,3 +152,97 @@ def test_smoke_skips_when_allow_real_missing(monkeypatch, tmp_path):
 
     assert result.exit_code == 0
     assert "real smoke skipped" in result.stdout
+
+
+def test_http_json_request_reuses_connections_for_get_only(monkeypatch):
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    import app.smoke as smoke
+
+    peers: list[tuple[str, int]] = []
+    posts: list[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # noqa: N802
+            peers.append(self.client_address)
+            status = 404 if self.path.startswith("/missing") else 200
+            body = json.dumps({"ok": status == 200}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):  # noqa: N802
+            # Drop the connection without answering, like a stale socket would
+            posts.append(self.path)
+            self.close_connection = True
+
+        def log_message(self, *args):
+            pass
+
+    for name in ("http_proxy", "HTTP_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        assert smoke._http_json_request(f"{base}/a?x=1") == {"ok": True}
+        assert smoke._http_json_request(f"{base}/b") == {"ok": True}
+        with pytest.raises(SmokeProbeError, match='404 .*{"ok": false}'):
+            smoke._http_json_request(f"{base}/missing")
+        with pytest.raises(OSError):
+            smoke._http_json_request(f"{base}/token", method="POST", data=b"x=1")
+
+        assert len(peers) == 3
+        assert len(set(peers)) == 1
+        assert posts == ["/token"]
+    finally:
+        smoke.close_session()
+        server.shutdown()
+        server.server_close()
+
+
+def test_run_smoke_checks_runs_probes_concurrently():
+    import time
+
+    from app.config import ResolvedService, RunMode
+    from app.smoke import run_smoke_checks
+
+    def resolved(name, mode=RunMode.REAL):
+        return ResolvedService(name=name, declared_mode=mode, selected_mode=mode, missing_keys=[], warning=None)
+
+    def slow_probe(name, fail=False):
+        def probe():
+            time.sleep(0.2)
+            if fail:
+                raise SmokeProbeError(f"{name} down")
+            return SmokeServiceResult(name="other", ok=True, detail="ok")
+
+        return probe
+
+    services = {
+        "slack": resolved("slack"),
+        "github": resolved("github"),
+        "drive": resolved("drive"),
+        "gdrive": resolved("gdrive", RunMode.MOCK),
+    }
+    probes = {
+        "slack": slow_probe("slack"),
+        "github": slow_probe("github", fail=True),
+        "drive": slow_probe("drive"),
+    }
+
+    start = time.perf_counter()
+    results = run_smoke_checks(services, probes)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert list(results) == ["slack", "github", "drive", "gdrive"]
+    assert results["slack"].ok is True and results["slack"].name == "slack"
+    assert results["github"].detail == "github down"
+    assert results["gdrive"].detail == "skipped (mock mode)"